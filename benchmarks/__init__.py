@@ -0,0 +1 @@
+"""Performance benchmarks for Lightimer (run with ``python -m benchmarks.<name>``)."""
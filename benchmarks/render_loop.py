@@ -0,0 +1,331 @@
+"""Micro-benchmarks for the render loop hot path.
+
+Every hot-path function is timed call by call; the report lists the mean
+and 99th-percentile cost per frame and the frame rate that cost would
+allow.  With a display available, the same scenarios are timed again on
+a real ``tk.Canvas`` (as ``tk:...``), and the lateness of the app's
+``after()`` callbacks against their schedule is measured on a real Tk
+root as well.
+
+Usage::
+
+    python -m benchmarks.render_loop [--frames N] [--output results.json]
+    python -m benchmarks.render_loop --compare old.json new.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable
+
+from lightimer.config import Orientation
+from lightimer.headless import HeadlessImage, HeadlessRoot, RecordingCanvas
+from lightimer.profiler import FrameProfiler
+from lightimer.timer import StaticTimer, VirtualClock
+from lightimer.ui import LightimerApp
+from lightimer.utils import interpolate_color
+
+DEFAULT_FRAMES = 20_000
+JITTER_SECONDS = 2.0
+
+
+def _summarize(name: str, samples_ns: list[int]) -> dict[str, Any]:
+    samples_ns.sort()
+    mean = statistics.fmean(samples_ns)
+    p99 = samples_ns[min(len(samples_ns) - 1, int(len(samples_ns) * 0.99))]
+    return {
+        "name": name,
+        "frames": len(samples_ns),
+        "mean_us": mean / 1000,
+        "p99_us": p99 / 1000,
+        "fps": 1e9 / mean if mean else float("inf"),
+    }
+
+
+def _time_calls(name: str, func: Callable[[], Any], frames: int) -> dict[str, Any]:
+    clock = time.perf_counter_ns
+    samples = []
+    for _ in range(frames):
+        t0 = clock()
+        func()
+        samples.append(clock() - t0)
+    return _summarize(name, samples)
+
+
+# A scenario app: the clock it runs on, the app, and what makes its
+# drawing happen (nothing for the headless canvas, idle tasks on Tk)
+Scenario = tuple[VirtualClock, LightimerApp, Callable[[], Any]]
+AppFactory = Callable[..., Scenario]
+
+
+def _headless_app(
+    screen: tuple[int, int] = (1920, 1080), **options: Any
+) -> Scenario:
+    root = HeadlessRoot(screen=screen)
+    app = LightimerApp(
+        root,
+        defer_assets=True,
+        clock=root.clock,
+        canvas_factory=RecordingCanvas,
+        **options,
+    )
+    return root.clock, app, lambda: None
+
+
+def _tk_app_factory(roots: list[Any]) -> AppFactory:
+    """Build scenario apps on real Tk roots, collected in *roots*."""
+    import tkinter as tk
+
+    def make(screen: tuple[int, int] = (1920, 1080), **options: Any) -> Scenario:
+        # A real root has the real screen and makes real images
+        options.pop("image_factory", None)
+        root = tk.Tk()
+        roots.append(root)
+        clock = VirtualClock()
+        app = LightimerApp(root, defer_assets=True, clock=clock, **options)
+        return clock, app, root.update_idletasks
+
+    return make
+
+
+def _start(
+    make_app: AppFactory, orientation: Orientation, **options: Any
+) -> Scenario:
+    clock, app, flush = make_app(**options)
+    if app.orientation is not orientation:
+        app._on_toggle(None)
+    app._on_click(None)
+    return clock, app, flush
+
+
+# ── hot-path benchmarks ───────────────────────────────────────────────
+
+
+def bench_hot_path(
+    frames: int, make_app: AppFactory = _headless_app, prefix: str = ""
+) -> list[dict[str, Any]]:
+    """Time the per-frame functions on the backend of *make_app*.
+
+    Result names start with *prefix*, so that the backends can be told
+    apart in one report.
+    """
+    results = []
+    for orientation in Orientation:
+        tag = orientation.name.lower()
+        clock, app, flush = _start(make_app, orientation)
+        step = app.duration / (frames + 1)
+
+        def redraw() -> None:
+            clock.advance(step)
+            app.redraw_canvas()
+            flush()
+
+        results.append(_time_calls(f"{prefix}redraw_canvas[{tag}]", redraw, frames))
+
+        levels = iter(range(frames))
+
+        def redraw_level() -> None:
+            app._redraw_level(next(levels) * 0.37 % 800, 100)
+            flush()
+
+        results.append(
+            _time_calls(f"{prefix}_redraw_level[{tag}]", redraw_level, frames)
+        )
+
+    # Fullscreen on a 4K projector: the label is swapped sprites, not text.
+    # Centisecond mode over the last minute: the hundredths change on
+    # nearly every frame
+    projector = dict(screen=(3840, 2160), fullscreen=True, image_factory=HeadlessImage)
+    cases = [("projector", Orientation.VERTICAL, projector, False)]
+    cases += [
+        (f"centiseconds-{orientation.name.lower()}", orientation, {}, True)
+        for orientation in Orientation
+    ]
+    cases.append(("centiseconds-projector", Orientation.VERTICAL, projector, True))
+    for tag, orientation, options, centiseconds in cases:
+        clock, app, flush = _start(
+            make_app, orientation, centiseconds=centiseconds, **options
+        )
+        seconds = 60 if centiseconds else app.duration
+        clock.advance(app.duration - seconds)
+        step = seconds / (frames + 1)
+
+        def redraw_case() -> None:
+            clock.advance(step)
+            app.redraw_canvas()
+            flush()
+
+        results.append(
+            _time_calls(f"{prefix}redraw_canvas[{tag}]", redraw_case, frames)
+        )
+    return results
+
+
+def bench_tk_hot_path(frames: int) -> list[dict[str, Any]]:
+    """The scenarios of :func:`bench_hot_path` on a real ``tk.Canvas``."""
+    import tkinter as tk
+
+    roots: list[Any] = []
+    try:
+        return bench_hot_path(frames, _tk_app_factory(roots), prefix="tk:")
+    except tk.TclError as exc:
+        if roots:
+            raise
+        return [{"name": "tk:hot_path", "skipped": f"no display: {exc}"}]
+    finally:
+        for root in roots:
+            root.destroy()
+
+
+def bench_helpers(frames: int) -> list[dict[str, Any]]:
+    """Time the helpers that every frame calls."""
+    results = [
+        _time_calls(
+            "interpolate_color", lambda: interpolate_color("#80ff00", 0.37), frames
+        )
+    ]
+    timer = StaticTimer(300)
+    timer.start()
+    for method in (timer.get_remaining, timer.get_elapsed):
+        results.append(_time_calls(f"StaticTimer.{method.__name__}", method, frames))
+    results.append(
+        _time_calls("StaticTimer.format", lambda: StaticTimer.format(299.5), frames)
+    )
+    results.append(
+        _time_calls(
+            "StaticTimer.format_centiseconds",
+            lambda: StaticTimer.format_centiseconds(59.37),
+            frames,
+        )
+    )
+    return results
+
+
+# ── after() jitter on a real Tk root ──────────────────────────────────
+
+
+def bench_after_jitter(seconds: float) -> list[dict[str, Any]]:
+    """Measure frame callback lateness for both orientations on real Tk."""
+    import tkinter as tk
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as exc:
+        return [{"name": "after_jitter", "skipped": f"no display: {exc}"}]
+    results = []
+    try:
+        for orientation in Orientation:
+            for adaptive in (False, True):
+                profiler = FrameProfiler()
+                app = LightimerApp(
+                    root, defer_assets=True, adaptive=adaptive, profiler=profiler
+                )
+                if app.orientation is not orientation:
+                    app._on_toggle(None)
+                app._on_click(None)
+                root.after(int(seconds * 1000), root.quit)
+                root.mainloop()
+                app.timer.stop()
+                app.canvas.destroy()
+                frames = profiler.frames()[1:]  # the first frame is unscheduled
+                if not frames:
+                    continue
+
+                mode = "adaptive" if adaptive else "fixed"
+                result = _summarize(
+                    f"after_jitter[{orientation.name.lower()},{mode}]",
+                    [int((actual - due) * 1e9) for due, actual, _, _ in frames],
+                )
+                result["late_frames"] = sum(1 for frame in frames if frame[3])
+                result.pop("fps")
+                results.append(result)
+    finally:
+        root.destroy()
+    return results
+
+
+# ── reporting ─────────────────────────────────────────────────────────
+
+
+def _metadata() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "machine": platform.machine(),
+    }
+
+
+def _print_table(results: list[dict[str, Any]]) -> None:
+    for r in results:
+        if "skipped" in r:
+            print(f"{r['name']:<40} skipped ({r['skipped']})")
+        elif "fps" in r:
+            print(
+                f"{r['name']:<40} mean {r['mean_us']:9.2f} us"
+                f"  p99 {r['p99_us']:9.2f} us  {r['fps']:12.0f} fps"
+            )
+        else:
+            print(
+                f"{r['name']:<40} mean {r['mean_us']:9.2f} us"
+                f"  p99 {r['p99_us']:9.2f} us  late {r['late_frames']}/{r['frames']}"
+            )
+
+
+def compare(old_path: str, new_path: str) -> None:
+    """Print the change in mean and p99 cost between two result files."""
+    with open(old_path, encoding="utf-8") as f:
+        old = {r["name"]: r for r in json.load(f)["results"]}
+    with open(new_path, encoding="utf-8") as f:
+        new = {r["name"]: r for r in json.load(f)["results"]}
+    for name, r in new.items():
+        before = old.get(name)
+        if before is None or "mean_us" not in r or "mean_us" not in before:
+            continue
+        print(
+            f"{name:<40} mean {r['mean_us'] / before['mean_us']:6.2f}x"
+            f"  p99 {r['p99_us'] / before['p99_us']:6.2f}x"
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument("--jitter-seconds", type=float, default=JITTER_SECONDS)
+    parser.add_argument("--output", help="write machine-readable results here")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    results = (
+        bench_hot_path(args.frames)
+        + bench_helpers(args.frames)
+        + bench_tk_hot_path(args.frames)
+        + bench_after_jitter(args.jitter_seconds)
+    )
+    _print_table(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"meta": _metadata(), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Load test for the state-streaming server.
+
+Connects hundreds of loopback subscribers (JSON lines and server-sent
+events), fires timer transitions and reports the fan-out latency from
+each transition to its arrival at every subscriber.
+
+Usage::
+
+    python -m benchmarks.server_load [--subscribers N] [--events N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from lightimer.server import StateServer
+from lightimer.timer import StaticTimer
+
+
+async def _json_subscriber(port: int, events: int, arrivals: list[float]) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    await reader.readline()  # snapshot
+    for _ in range(events):
+        await reader.readline()
+        arrivals.append(time.perf_counter())
+    writer.close()
+
+
+async def _sse_subscriber(port: int, events: int, arrivals: list[float]) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"GET /events HTTP/1.1\r\nHost: localhost\r\n\r\n")
+    await reader.readuntil(b"\r\n\r\n")  # response headers
+    await reader.readuntil(b"\n\n")  # snapshot
+    for _ in range(events):
+        await reader.readuntil(b"\n\n")
+        arrivals.append(time.perf_counter())
+    writer.close()
+
+
+async def _run(subscribers: int, events: int, interval: float) -> dict:
+    timer = StaticTimer(300)
+    server = StateServer(timer, lambda *cmd: None, port=0)
+    server.start()
+
+    arrivals: list[list[float]] = [[] for _ in range(subscribers)]
+    tasks = [
+        asyncio.create_task(
+            (_sse_subscriber if i % 2 else _json_subscriber)(
+                server.http_port if i % 2 else server.port, events, arrivals[i]
+            )
+        )
+        for i in range(subscribers)
+    ]
+    while server.subscribers < subscribers:
+        await asyncio.sleep(0.01)
+
+    sent = []
+    for i in range(events):
+        sent.append(time.perf_counter())
+        if i % 2:
+            timer.stop()
+        else:
+            timer.start()
+        await asyncio.sleep(interval)
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=30)
+    server.close()
+
+    latencies = sorted(
+        (got[i] - sent[i]) * 1000 for got in arrivals for i in range(events)
+    )
+    return {
+        "subscribers": subscribers,
+        "events": events,
+        "deliveries": len(latencies),
+        "mean_ms": statistics.fmean(latencies),
+        "p99_ms": latencies[int(len(latencies) * 0.99)],
+        "max_ms": latencies[-1],
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subscribers", type=int, default=500)
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.02)
+    args = parser.parse_args(argv)
+    result = asyncio.run(_run(args.subscribers, args.events, args.interval))
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Scheduling cost of a TimerGroup as the number of timers grows.
+
+For each group size, every timer is started with a random period,
+stopped and restarted at random, and run to expiry on a virtual clock.
+The report gives the cost per operation and the number of wakeups, next
+to the cost of the alternative: polling every timer on each 8 ms tick.
+
+Usage::
+
+    python -m benchmarks.timer_group [--sizes 100 1000 10000 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from typing import Any
+
+from lightimer.config import REFRESH_CYCLE_MS
+from lightimer.group import TimerGroup
+from lightimer.headless import HeadlessRoot
+
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000)
+
+
+def _run(n: int, seed: int = 1) -> dict[str, Any]:
+    rng = random.Random(seed)
+    root = HeadlessRoot()
+    group = TimerGroup(clock=root.clock, scheduler=root)
+    timers = [group.add(i, rng.uniform(60, 3600)) for i in range(n)]
+    expired = []
+    group.listeners.append(
+        lambda key, event, timer: event == "timesup" and expired.append(key)
+    )
+
+    started = time.perf_counter()
+    for timer in timers:
+        timer.start()
+    start_s = time.perf_counter() - started
+
+    root.advance(30)
+    toggled = rng.sample(timers, n // 2)
+    started = time.perf_counter()
+    for timer in toggled:
+        timer.stop()
+    for timer in toggled:
+        timer.start()
+    toggle_s = time.perf_counter() - started
+
+    # One tick of polling all timers, as n separate render loops would
+    started = time.perf_counter()
+    any(timer.is_time_up() for timer in timers)
+    poll_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    wakeups = root.advance(3600)
+    expire_s = time.perf_counter() - started
+
+    assert len(expired) == n, (len(expired), n)
+    return {
+        "timers": n,
+        "start_us": start_s / n * 1e6,
+        "stop_start_us": toggle_s / len(toggled) / 2 * 1e6 if toggled else 0.0,
+        "expire_us": expire_s / n * 1e6,
+        "wakeups": wakeups,
+        "poll_tick_us": poll_s * 1e6,
+        "poll_us_per_s": poll_s * 1e6 * 1000 / REFRESH_CYCLE_MS,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    args = parser.parse_args(argv)
+    results = [_run(n) for n in args.sizes]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(
+        f"{'timers':>8} {'start':>9} {'stop+start':>11} {'expire':>9}"
+        f" {'wakeups':>8} {'polling instead':>18}"
+    )
+    for r in results:
+        print(
+            f"{r['timers']:>8} {r['start_us']:7.2f}us {r['stop_start_us']:9.2f}us"
+            f" {r['expire_us']:7.2f}us {r['wakeups']:>8}"
+            f" {r['poll_us_per_s'] / 1000:12.1f} ms/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
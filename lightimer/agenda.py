@@ -0,0 +1,113 @@
+"""Schedules of back-to-back segments driven by a single timer."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Iterable, NamedTuple
+
+
+@dataclass(frozen=True)
+class Segment:
+    """A talk of *duration* seconds, followed by a changeover *gap*."""
+
+    title: str
+    duration: float
+    gap: float = 0.0
+
+
+class Slot(NamedTuple):
+    """Where in the agenda a point in time falls."""
+
+    index: int  # segment index
+    in_gap: bool  # inside the changeover after the segment
+    elapsed: float  # seconds into the talk (or gap)
+    remaining: float  # seconds left in the talk (or gap)
+    length: float  # length of the talk (or gap)
+
+
+class Agenda:
+    """An ordered list of segments indexed by their cumulative boundaries.
+
+    Talks and changeover gaps are laid out on one time axis starting at 0,
+    so the slot at any elapsed time of a single running timer is found by
+    binary search in ``O(log n)``.
+    """
+
+    def __init__(self, segments: Iterable[Segment]) -> None:
+        self.segments: tuple[Segment, ...] = tuple(segments)
+        if not self.segments:
+            raise ValueError("an agenda needs at least one segment")
+
+        # One entry per talk and per non-empty gap: start, segment, is-gap
+        self._starts: list[float] = []
+        self._slots: list[tuple[int, bool, float]] = []
+        t = 0.0
+        for index, segment in enumerate(self.segments):
+            if segment.duration <= 0 or segment.gap < 0:
+                raise ValueError(f"invalid timing in segment {segment.title!r}")
+            for in_gap, length in ((False, segment.duration), (True, segment.gap)):
+                if length:
+                    self._starts.append(t)
+                    self._slots.append((index, in_gap, length))
+                    t += length
+        self.total: float = t
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def locate(self, elapsed: float) -> Slot:
+        """Return the slot at *elapsed* seconds (clamped to the agenda)."""
+        elapsed = min(max(elapsed, 0.0), self.total)
+        k = max(0, bisect_right(self._starts, elapsed) - 1)
+        index, in_gap, length = self._slots[k]
+        into = elapsed - self._starts[k]
+        return Slot(index, in_gap, into, length - into, length)
+
+    def start_of(self, index: int) -> float:
+        """Agenda time at which segment *index* starts."""
+        k = bisect_right(self._slots, (index, False, -1.0))
+        return self._starts[k]
+
+    # ── parsing ───────────────────────────────────────────────────────
+
+    @classmethod
+    def parse(cls, text: str) -> Agenda:
+        """Build an agenda from lines of ``MM:SS [+MM:SS] title``.
+
+        The optional ``+MM:SS`` is the changeover gap after the segment.
+        Blank lines and lines starting with ``#`` are ignored.
+        """
+        segments = []
+        for lineno, line in enumerate(text.splitlines(), 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            duration, _, rest = line.partition(" ")
+            rest = rest.strip()
+            gap = "0:00"
+            if rest.startswith("+"):
+                gap, _, rest = rest[1:].partition(" ")
+            try:
+                segment = Segment(rest.strip(), _parse_mmss(duration), _parse_mmss(gap))
+                if not segment.duration:
+                    raise ValueError(f"zero duration {duration!r}")
+            except ValueError as exc:
+                raise ValueError(f"line {lineno}: {exc}") from None
+            segments.append(segment)
+        return cls(segments)
+
+    @classmethod
+    def load(cls, path: str) -> Agenda:
+        """Read an agenda file, see :meth:`parse`."""
+        with open(path, encoding="utf-8") as f:
+            return cls.parse(f.read())
+
+
+def _parse_mmss(value: str) -> float:
+    minutes, sep, seconds = value.partition(":")
+    if not sep or not minutes.isdigit() or not seconds.isdigit():
+        raise ValueError(f"expected MM:SS, got {value!r}")
+    if int(seconds) > 59:
+        raise ValueError(f"seconds out of range in {value!r}")
+    return int(minutes) * 60 + int(seconds)
@@ -0,0 +1,71 @@
+"""Precomputed colour look-up tables for the level bar."""
+
+from __future__ import annotations
+
+from lightimer.config import GRADIENT_STEPS, RGB_MAX
+from lightimer.utils import interpolate_color
+
+# "#rr" and "gg00" for every channel value: a faded colour is one
+# concatenation instead of a format
+_RED_HEX = tuple(f"#{n:02x}" for n in range(RGB_MAX + 1))
+_GREEN_HEX = tuple(f"{n:02x}00" for n in range(RGB_MAX + 1))
+
+
+class ColorTable:
+    """Green→red gradient and lead-line fades, built once up front.
+
+    The gradient is indexed by the quantised progress ``0‥2·steps``:
+    index ``0`` is pure green, ``steps`` is yellow and ``2·steps`` pure red.
+    With ``steps == RGB_MAX`` the gradient matches the formerly formatted
+    ``#rrgg00`` strings exactly.
+
+    By default the lead line fades exactly as :func:`interpolate_color`
+    would: the channel values kept per gradient colour are scaled and
+    their hex digits looked up, with no string formatting.  With
+    *fade_steps* (e.g. ``FADE_STEPS``) the table instead holds that many
+    shades per colour and the fade is a pure look-up, quantised to
+    ``1 / fade_steps``.
+    """
+
+    def __init__(
+        self, steps: int = GRADIENT_STEPS, fade_steps: int | None = None
+    ) -> None:
+        self.steps = steps
+        self.fade_steps = fade_steps
+
+        gradient = []
+        channels = []
+        for index in range(2 * steps + 1):
+            red = round(min(index, steps) * RGB_MAX / steps)
+            green = round(min(2 * steps - index, steps) * RGB_MAX / steps)
+            gradient.append(f"#{red:02x}{green:02x}00")
+            channels.append((red, green))
+        self.gradient: tuple[str, ...] = tuple(gradient)
+        self._channels: tuple[tuple[int, int], ...] = tuple(channels)
+
+        # Flat [index * fade_steps + shade] layout keeps the table compact
+        self.fades: tuple[str, ...] = tuple(
+            interpolate_color(color, shade / fade_steps)
+            for color in gradient
+            for shade in range(fade_steps or 0)
+        )
+
+    def index(self, elapsed: float, remaining: float, half: float) -> int:
+        """Return the gradient index for the given progress of a countdown."""
+        steps = self.steps
+        red = int(round(min(steps, (elapsed / half) * steps)))
+        green = max(0, int(round(min(steps, (remaining / half) * steps))))
+        return red + steps - green
+
+    def color(self, index: int) -> str:
+        """Return the level colour at gradient *index*."""
+        return self.gradient[index]
+
+    def fade(self, index: int, frac: float) -> str:
+        """Return the lead-line colour at *index* faded by *frac* (0‥1)."""
+        if self.fade_steps is not None:
+            return self.fades[index * self.fade_steps + int(frac * self.fade_steps)]
+        # The arithmetic of interpolate_color, minus parsing and formatting
+        red, green = self._channels[index]
+        keep = 1.0 - frac
+        return _RED_HEX[int(red * keep)] + _GREEN_HEX[int(green * keep)]
@@ -17,18 +17,43 @@ RGB_MAX: int = 255
 BG_COLOR: str = "#000000"
 LEVEL_COLOR: str = "#00FF00"
 TIME_COLOR: str = "#777777"
+GRADIENT_STEPS: int = RGB_MAX  # colours per half of the green→red gradient
 
 # ── Timing ───────────────────────────────────────────────────────────
 INIT_DURATION_S: int = 300  # 5 minutes
 REFRESH_CYCLE_MS: int = 8  # ~120 fps
+MAX_FPS: int = 1000 // REFRESH_CYCLE_MS  # frame-rate cap of the render loop
+FADE_STEPS: int = 16  # sub-pixel steps of the bar that frames are drawn for
+CENTISECONDS_BELOW_S: float = 60.0  # --centiseconds shows MM:SS.cc from here on
+POST_POLL_MS: int = 20  # how often calls posted by other threads are run
 
 # ── Font ─────────────────────────────────────────────────────────────
 TIME_FONT: tuple[str, int] = ("Helvetica", 24)
+FRACTION_FONT: tuple[str, int] = ("Courier", 14)  # fixed width: the .cc digits
+LAYOUT_CACHE_SIZE: int = 32  # window sizes whose layout is kept
 
 # ── Resource paths (relative to bundle / project root) ───────────────
 SOUND_PATH: str = "sound/universfield-game-level-complete-143022.mp3"
 ICON_PATH: str = "icon/lightimer.gif"
 
+# ── State server ─────────────────────────────────────────────────────
+SERVER_PORT: int = 47800  # JSON lines; server-sent events on the next port
+
+# ── Single instance ───────────────────────────────────────────────────
+INSTANCE_PORT: int = 47820  # First loopback port for running instances
+INSTANCE_PORTS: int = 1000  # Users are spread over this many ports from there
+
+# ── Multi-node sync ───────────────────────────────────────────────────
+SYNC_GROUP: str = "239.255.47.80"  # Administratively scoped multicast group
+SYNC_PORT: int = 47810
+SYNC_HEARTBEAT_S: float = 1.0  # Leader state repeat interval
+SYNC_PING_S: float = 2.0  # Follower clock-offset probe interval
+SYNC_TOLERANCE_S: float = 0.002  # Followers correct deviations above this
+
+# ── Talk history ──────────────────────────────────────────────────────
+HISTORY_BATCH: int = 64  # Talks written per transaction at most
+HISTORY_FLUSH_S: float = 2.0  # Longest a finished talk waits to be written
+
 # ── Window position offsets ───────────────────────────────────────────
 WIN_OFFSET_X: int = 25  # Horizontal offset from screen edge
 WIN_OFFSET_Y: int = 40  # Vertical offset from screen edge (taskbar)
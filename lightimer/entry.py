@@ -0,0 +1,66 @@
+"""Typing a new ``mm:ss`` duration, digit by digit, as a pure state machine.
+
+Digits fill ``M0 M1 : S0 S1`` from left to right; positions not typed
+yet count as zero, so ``1-:--`` already means ten minutes.  The fifth
+digit starts a new entry.  A tens-of-seconds digit above 5 is ignored.
+An entry that is all zeroes so far keeps the previous duration.
+
+:func:`press` and :func:`clear` return a new :class:`Entry` and never
+touch a timer or widget; the UI applies the resulting :attr:`Entry.duration`.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+NUM_DIGITS = 4
+BLANK = -1  # a position not typed yet
+
+# Seconds per unit of each position: [10 min, 1 min, 10 s, 1 s]
+_MULTIPLIERS = (600, 60, 10, 1)
+_MAX_TENS_OF_SECONDS = 5
+_BLANKS = (BLANK,) * NUM_DIGITS
+
+
+class Entry(NamedTuple):
+    """The state of digit entry and the duration it has set."""
+
+    duration: float
+    position: int = 0  # where the next digit goes
+    digits: tuple[int, ...] = _BLANKS
+    entered: int = 0  # seconds of the digits typed in this entry
+
+    @property
+    def typing(self) -> bool:
+        """Whether an entry is under way (some but not all digits typed)."""
+        return self.position != 0
+
+    @property
+    def label(self) -> str:
+        """The digits as ``MM:SS``, with ``-`` for positions not typed yet."""
+        m0, m1, s0, s1 = ("-" if d == BLANK else str(d) for d in self.digits)
+        return f"{m0}{m1}:{s0}{s1}"
+
+
+def press(entry: Entry, digit: int) -> Entry:
+    """Type *digit* (0‥9) into *entry*."""
+    position = entry.position
+    if position == 2 and digit > _MAX_TENS_OF_SECONDS:
+        return entry
+    if position == 0:
+        digits = (digit, BLANK, BLANK, BLANK)
+        entered = digit * _MULTIPLIERS[0]
+    else:
+        digits = entry.digits[:position] + (digit,) + entry.digits[position + 1 :]
+        entered = entry.entered + digit * _MULTIPLIERS[position]
+    return Entry(
+        duration=entered if entered != 0 else entry.duration,
+        position=(position + 1) % NUM_DIGITS,
+        digits=digits,
+        entered=entered,
+    )
+
+
+def clear(entry: Entry) -> Entry:
+    """Abandon the entry, keeping the duration it has set."""
+    return Entry(entry.duration)
@@ -0,0 +1,136 @@
+"""Pre-rendered seven-segment digit sprites for the fullscreen label.
+
+At projector sizes, re-rasterising a font of several hundred points for
+every label change stalls the render loop.  Instead, each glyph is drawn
+once per size into an image from a handful of filled rectangles (no font
+engine involved), and the label is composed of canvas image items whose
+``image`` is swapped when a digit changes.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+# Glyph geometry, relative to the digit height
+DIGIT_WIDTH = 0.55
+COLON_WIDTH = 0.25
+GLYPH_GAP = 0.1
+STROKE = 0.125
+
+# Lit segments per character: a top, b/c right, d bottom, e/f left, g middle
+_SEGMENTS: dict[str, str] = {
+    "0": "abcdef",
+    "1": "bc",
+    "2": "abdeg",
+    "3": "abcdg",
+    "4": "bcfg",
+    "5": "acdfg",
+    "6": "acdefg",
+    "7": "abc",
+    "8": "abcdefg",
+    "9": "abcdfg",
+    "-": "g",
+}
+
+CHARS = "0123456789:-."
+
+
+def glyph_height(width: int, height: int, chars: int = 5) -> int:
+    """Largest digit height at which a label of *chars* glyphs fits.
+
+    The label may take 90 % of the *width* and 60 % of the *height*.
+    """
+    digits = chars - 1
+    em = digits * DIGIT_WIDTH + COLON_WIDTH + (chars - 1) * GLYPH_GAP
+    return max(8, int(min(0.9 * width / em, 0.6 * height)))
+
+
+def glyph_width(char: str, height: int) -> int:
+    """Width of the sprite of *char* at digit *height*."""
+    return round((COLON_WIDTH if char in ":." else DIGIT_WIDTH) * height)
+
+
+def layout(
+    text: str, height: int, width: int, canvas_height: int
+) -> list[tuple[int, int]]:
+    """Top-left corners that centre *text* on a *width* × *canvas_height* canvas."""
+    gap = round(GLYPH_GAP * height)
+    total = sum(glyph_width(c, height) for c in text) + gap * (len(text) - 1)
+    x = (width - total) // 2
+    y = (canvas_height - height) // 2
+    corners = []
+    for char in text:
+        corners.append((x, y))
+        x += glyph_width(char, height) + gap
+    return corners
+
+
+class GlyphAtlas:
+    """Images of :data:`CHARS` at digit *height* in *color*.
+
+    *image_factory* is called as ``image_factory(width=…, height=…)`` and
+    must return an object with a ``tk.PhotoImage``-style ``put`` method.
+    """
+
+    def __init__(
+        self,
+        height: int,
+        color: str,
+        image_factory: Callable[..., Any],
+    ) -> None:
+        self.height = height
+        self.color = color
+        self.images: dict[str, Any] = {
+            char: self._render(char, image_factory) for char in CHARS
+        }
+
+    def _render(self, char: str, image_factory: Callable[..., Any]) -> Any:
+        h = self.height
+        w = glyph_width(char, h)
+        t = max(1, round(STROKE * h))
+        image = image_factory(width=w, height=h)
+        if char == ":":
+            x = (w - t) // 2
+            for y in (h // 3 - t // 2, 2 * h // 3 - t // 2):
+                image.put(self.color, to=(x, y, x + t, y + t))
+            return image
+        if char == ".":
+            x = (w - t) // 2
+            image.put(self.color, to=(x, h - t, x + t, h))
+            return image
+
+        mid_top, mid_bottom = (h - t) // 2, (h + t) // 2
+        rects = {
+            "a": (0, 0, w, t),
+            "b": (w - t, 0, w, mid_bottom),
+            "c": (w - t, mid_top, w, h),
+            "d": (0, h - t, w, h),
+            "e": (0, mid_top, t, h),
+            "f": (0, 0, t, mid_bottom),
+            "g": (0, mid_top, w, mid_bottom),
+        }
+        for segment in _SEGMENTS[char]:
+            image.put(self.color, to=rects[segment])
+        return image
+
+
+class GlyphCache:
+    """Atlases by (height, colour), built on first use."""
+
+    def __init__(self, image_factory: Callable[..., Any]) -> None:
+        self.image_factory = image_factory
+        self._atlases: dict[tuple[int, str], GlyphAtlas] = {}
+
+    def get(self, height: int, color: str) -> GlyphAtlas:
+        key = (height, color)
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = self._atlases[key] = GlyphAtlas(height, color, self.image_factory)
+        return atlas
+
+    def clear(self) -> None:
+        """Drop all atlases, e.g. after the window was resized."""
+        self._atlases.clear()
+
+    def __len__(self) -> int:
+        return len(self._atlases)
@@ -0,0 +1,178 @@
+"""Many independent countdowns in one process, woken by one deadline.
+
+A :class:`TimerGroup` holds any number of :class:`~lightimer.timer.StaticTimer`
+instances by key (breakout rooms, plus a session clock) that share a
+clock.  They are started, stopped, reset and set as usual; the group
+follows their transitions and keeps the deadline of every running timer
+in a heap.  Only the earliest deadline is ever waited for, so nothing is
+polled per timer, and starting or expiring a timer costs O(log n).
+
+Stopping, resetting or setting a timer does not search the heap: the
+timer's entry is marked stale by giving the timer a new generation,
+drawn from one counter for the whole group so that a key removed and
+added again never matches an old entry, and skipped when it reaches
+the top.  The heap is rebuilt from live entries
+when stale ones outnumber them.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import math
+import time
+from typing import Any, Callable, Hashable, Iterator
+
+from lightimer.timer import Clock, StaticTimer
+
+logger = logging.getLogger(__name__)
+
+# Stale heap entries tolerated beyond the live ones before a rebuild
+_COMPACT_SLACK = 64
+
+GroupListener = Callable[[Hashable, str, StaticTimer], None]
+
+
+class TimerGroup:
+    """Timers by key sharing *clock*, expired at their deadlines.
+
+    Callables in ``listeners`` are called as ``listener(key, event,
+    timer)`` after every transition of any timer in the group, including
+    ``"timesup"`` when the group expires it.
+
+    With a *scheduler* that has Tk's ``after(ms, func)`` and
+    ``after_cancel(job)`` (a ``tk.Tk`` or a
+    :class:`~lightimer.headless.HeadlessRoot`), the group keeps one job
+    scheduled at the earliest deadline.  Without one, call
+    :meth:`expire_due` after :meth:`next_delay` seconds.
+    """
+
+    def __init__(
+        self, clock: Clock = time.perf_counter, scheduler: Any = None
+    ) -> None:
+        self.clock = clock
+        self.scheduler = scheduler
+        self.listeners: list[GroupListener] = []
+        self._timers: dict[Hashable, StaticTimer] = {}
+        self._generation: dict[Hashable, int] = {}
+        # (deadline, tie-breaker, key, generation); entries whose generation
+        # is not the timer's current one are stale
+        self._heap: list[tuple[float, int, Hashable, int]] = []
+        self._seq = itertools.count()
+        self._queued: set[Hashable] = set()  # keys with a live entry
+        self._job: Any = None
+        self._job_due = math.inf
+
+    # ── membership ────────────────────────────────────────────────────
+
+    def add(self, key: Hashable, period: float) -> StaticTimer:
+        """Create the timer *key* with a countdown of *period* seconds."""
+        if key in self._timers:
+            raise KeyError(f"timer {key!r} already exists")
+        timer = StaticTimer(period, clock=self.clock)
+        self._timers[key] = timer
+        self._generation[key] = next(self._seq)
+        timer.listeners.append(lambda event, timer: self._on_timer_event(key, event))
+        return timer
+
+    def remove(self, key: Hashable) -> None:
+        """Forget the timer *key*; a pending deadline of it never fires."""
+        timer = self._timers.pop(key)
+        self._queued.discard(key)
+        del self._generation[key]
+        timer.listeners.clear()
+
+    def __getitem__(self, key: Hashable) -> StaticTimer:
+        return self._timers[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._timers
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._timers)
+
+    # ── deadlines ─────────────────────────────────────────────────────
+
+    def next_deadline(self) -> float | None:
+        """Clock time of the earliest deadline, or ``None`` if none runs."""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def next_delay(self) -> float | None:
+        """Seconds until the earliest deadline, or ``None`` if none runs."""
+        deadline = self.next_deadline()
+        return None if deadline is None else max(0.0, deadline - self.clock())
+
+    def expire_due(self) -> list[Hashable]:
+        """Expire every running timer whose deadline has passed.
+
+        Returns their keys, earliest deadline first.
+        """
+        now = self.clock()
+        expired = []
+        # Expiring a timer may compact, i.e. replace, the heap
+        while self._heap and self._heap[0][0] <= now:
+            _, _, key, generation = heapq.heappop(self._heap)
+            if self._generation.get(key) != generation:
+                continue
+            expired.append(key)
+            self._timers[key].expire()
+        self._schedule()
+        return expired
+
+    def pending(self) -> int:
+        """Heap entries, live and stale — for tests and the benchmark."""
+        return len(self._heap)
+
+    # ── internals ─────────────────────────────────────────────────────
+
+    def _on_timer_event(self, key: Hashable, event: str) -> None:
+        timer = self._timers[key]
+        # Any transition makes the timer's entry, if it has one, stale
+        generation = self._generation[key] = next(self._seq)
+        deadline = timer.deadline()
+        if deadline is None:
+            self._queued.discard(key)
+        else:
+            self._queued.add(key)
+            heapq.heappush(self._heap, (deadline, next(self._seq), key, generation))
+            if deadline < self._job_due:
+                self._schedule()
+        if len(self._heap) > 2 * len(self._queued) + _COMPACT_SLACK:
+            self._compact()
+        for listener in self.listeners:
+            listener(key, event, timer)
+
+    def _drop_stale(self) -> None:
+        heap = self._heap
+        while heap and self._generation.get(heap[0][2]) != heap[0][3]:
+            heapq.heappop(heap)
+
+    def _compact(self) -> None:
+        self._heap = [e for e in self._heap if self._generation.get(e[2]) == e[3]]
+        heapq.heapify(self._heap)
+
+    def _schedule(self) -> None:
+        """Keep the scheduler's one job at the earliest deadline."""
+        if self.scheduler is None:
+            return
+        deadline = self.next_deadline()
+        due = math.inf if deadline is None else deadline
+        if due == self._job_due:
+            return
+        if self._job is not None:
+            self.scheduler.after_cancel(self._job)
+            self._job = None
+        self._job_due = due
+        if deadline is not None:
+            delay_ms = math.ceil(max(0.0, deadline - self.clock()) * 1000)
+            self._job = self.scheduler.after(delay_ms, self._on_wakeup)
+
+    def _on_wakeup(self) -> None:
+        self._job = None
+        self._job_due = math.inf
+        self.expire_due()
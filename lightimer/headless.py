@@ -0,0 +1,434 @@
+"""In-memory stand-ins for the Tk root and canvas.
+
+They let :class:`~lightimer.ui.LightimerApp` run without a display or a
+Tcl interpreter: the root schedules ``after()`` callbacks on a
+:class:`~lightimer.timer.VirtualClock`, and the canvas records every item,
+coordinate and option that would have been drawn.
+:class:`RecordingTerminal` does the same for the curses window of
+:class:`~lightimer.tui.TerminalApp`, and :func:`load_silent_sound` stands
+in for the sound loader of :mod:`lightimer.sound`.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from lightimer.timer import VirtualClock
+
+_GEOMETRY = re.compile(r"(\d+)x(\d+)\+(-?\d+)\+(-?\d+)")
+
+
+@dataclass
+class HeadlessEvent:
+    """The subset of ``tk.Event`` the app's handlers look at."""
+
+    widget: Any = None
+    char: str = ""
+    keysym: str = ""
+    x: int = 0
+    y: int = 0
+    x_root: int = 0
+    y_root: int = 0
+    width: int = 0
+    height: int = 0
+
+
+@dataclass
+class CanvasItem:
+    """A recorded canvas item."""
+
+    kind: str
+    coords: tuple[float, ...]
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+class HeadlessImage:
+    """Display-less replacement for ``tk.PhotoImage`` recording ``put`` calls."""
+
+    def __init__(self, width: int = 0, height: int = 0) -> None:
+        self._width = width
+        self._height = height
+        self.puts: list[tuple[str, tuple[int, ...]]] = []
+
+    def put(self, data: str, to: tuple[int, ...] = ()) -> None:
+        self.puts.append((data, tuple(to)))
+
+    def width(self) -> int:
+        return self._width
+
+    def height(self) -> int:
+        return self._height
+
+
+class HeadlessRoot:
+    """Display-less replacement for ``tk.Tk`` driven by a virtual clock."""
+
+    def __init__(
+        self,
+        clock: VirtualClock | None = None,
+        screen: tuple[int, int] = (1920, 1080),
+        dpi: float = 96.0,
+    ) -> None:
+        self.clock = clock if clock is not None else VirtualClock()
+        self.screen = screen
+        self.dpi = dpi
+        self.window_title = ""
+        self.window_attributes: dict[str, Any] = {}
+        self.override = False
+        self.iconified = False
+        self.raised = 0
+        self.destroyed = False
+        self.protocols: dict[str, Callable[[], None]] = {}
+        self.pointer = (0, 0)
+        self._geometry = (0, 0, 0, 0)
+        self._jobs: list[tuple[float, int, str, Callable, tuple]] = []
+        self._cancelled: set[str] = set()
+        self._ids = itertools.count()
+
+    # ── window manager ────────────────────────────────────────────────
+
+    def title(self, text: str | None = None) -> str:
+        if text is not None:
+            self.window_title = text
+        return self.window_title
+
+    def attributes(self, *args: Any) -> None:
+        for name, value in zip(args[::2], args[1::2]):
+            self.window_attributes[name] = value
+
+    def overrideredirect(self, flag: bool | None = None) -> bool:
+        if flag is not None:
+            self.override = bool(flag)
+        return self.override
+
+    def deiconify(self) -> None:
+        self.iconified = False
+
+    def protocol(self, name: str, func: Callable[[], None]) -> None:
+        self.protocols[name] = func
+
+    def close(self) -> None:
+        """Close the window as the window manager's close button would."""
+        handler = self.protocols.get("WM_DELETE_WINDOW")
+        if handler is None:
+            self.destroy()
+        else:
+            handler()
+
+    def lift(self) -> None:
+        self.raised += 1
+
+    def geometry(self, spec: str | None = None) -> str:
+        if spec is not None:
+            match = _GEOMETRY.fullmatch(spec)
+            if match is None:
+                raise ValueError(f"bad geometry specifier {spec!r}")
+            self._geometry = tuple(int(v) for v in match.groups())
+        return "%dx%d+%d+%d" % self._geometry
+
+    def winfo_screenwidth(self) -> int:
+        return self.screen[0]
+
+    def winfo_screenheight(self) -> int:
+        return self.screen[1]
+
+    def winfo_fpixels(self, distance: str) -> float:
+        if distance.endswith("i"):
+            return float(distance[:-1]) * self.dpi
+        return float(distance)
+
+    def winfo_pointerx(self) -> int:
+        return self.pointer[0]
+
+    def winfo_pointery(self) -> int:
+        return self.pointer[1]
+
+    def winfo_x(self) -> int:
+        return self._geometry[2]
+
+    def winfo_y(self) -> int:
+        return self._geometry[3]
+
+    winfo_rootx = winfo_x
+    winfo_rooty = winfo_y
+
+    def destroy(self) -> None:
+        self.destroyed = True
+        self._jobs.clear()
+
+    # ── event loop ────────────────────────────────────────────────────
+
+    def after(self, ms: int, func: Callable, *args: Any) -> str:
+        """Schedule *func* to run *ms* milliseconds of virtual time from now."""
+        job_id = f"after#{next(self._ids)}"
+        due = self.clock() + ms / 1000
+        heapq.heappush(self._jobs, (due, next(self._ids), job_id, func, args))
+        return job_id
+
+    def after_idle(self, func: Callable, *args: Any) -> str:
+        return self.after(0, func, *args)
+
+    def after_cancel(self, job_id: str) -> None:
+        self._cancelled.add(job_id)
+
+    def pending(self) -> int:
+        """Number of scheduled callbacks that have not run or been cancelled."""
+        return sum(1 for job in self._jobs if job[2] not in self._cancelled)
+
+    def advance(self, seconds: float) -> int:
+        """Move virtual time *seconds* ahead, running every callback due.
+
+        Callbacks run in schedule order with the clock set to their due
+        time.  Returns the number of callbacks run.
+        """
+        end = self.clock() + seconds
+        ran = 0
+        while self._jobs and self._jobs[0][0] <= end:
+            due, _, job_id, func, args = heapq.heappop(self._jobs)
+            if job_id in self._cancelled:
+                self._cancelled.discard(job_id)
+                continue
+            self.clock.now = max(self.clock.now, due)
+            func(*args)
+            ran += 1
+        self.clock.now = max(self.clock.now, end)
+        return ran
+
+    def update(self) -> None:
+        self.advance(0)
+
+    def update_idletasks(self) -> None:
+        pass
+
+    def mainloop(self) -> None:
+        """Run until nothing is scheduled any more or the root is destroyed."""
+        while not self.destroyed and self._jobs:
+            self.advance(max(0.0, self._jobs[0][0] - self.clock()))
+
+
+class HeadlessToplevel(HeadlessRoot):
+    """Display-less replacement for ``tk.Toplevel`` under a :class:`HeadlessRoot`.
+
+    It has its own window-manager state but shares the clock, the
+    scheduled callbacks and the pointer with *master*, like a real
+    toplevel shares its interpreter with the root.
+    """
+
+    def __init__(self, master: HeadlessRoot) -> None:
+        self.root = master
+        super().__init__(master.clock, master.screen, master.dpi)
+        self._jobs = master._jobs
+        self._cancelled = master._cancelled
+        self._ids = master._ids
+
+    @property
+    def pointer(self) -> tuple[int, int]:
+        return self.root.pointer
+
+    @pointer.setter
+    def pointer(self, value: tuple[int, int]) -> None:
+        self.root.pointer = value
+
+    def destroy(self) -> None:
+        self.destroyed = True
+
+    def mainloop(self) -> None:
+        self.root.mainloop()
+
+
+class RecordingCanvas:
+    """Display-less replacement for ``tk.Canvas`` that records all drawing."""
+
+    def __init__(self, master: Any = None, **options: Any) -> None:
+        self.master = master
+        self.options: dict[str, Any] = dict(options)
+        self.items: dict[int, CanvasItem] = {}
+        self.bindings: dict[str, Callable] = {}
+        self.calls: Counter[str] = Counter()
+        self.focused = False
+        self.packed = False
+        self._ids = itertools.count(1)
+
+    # ── items ─────────────────────────────────────────────────────────
+
+    def _create(self, kind: str, coords: tuple, options: dict) -> int:
+        self.calls["create_" + kind] += 1
+        item = next(self._ids)
+        self.items[item] = CanvasItem(kind, tuple(coords), dict(options))
+        return item
+
+    def create_rectangle(self, *coords: float, **options: Any) -> int:
+        return self._create("rectangle", coords, options)
+
+    def create_text(self, *coords: float, **options: Any) -> int:
+        return self._create("text", coords, options)
+
+    def create_image(self, *coords: float, **options: Any) -> int:
+        return self._create("image", coords, options)
+
+    def coords(self, item: int, *coords: float) -> tuple[float, ...]:
+        if coords:
+            self.calls["coords"] += 1
+            self.items[item].coords = tuple(coords)
+        return self.items[item].coords
+
+    def itemconfig(self, item: int, **options: Any) -> None:
+        self.calls["itemconfig"] += 1
+        self.items[item].options.update(options)
+
+    itemconfigure = itemconfig
+
+    def itemcget(self, item: int, option: str) -> Any:
+        return self.items[item].options.get(option)
+
+    def config(self, **options: Any) -> None:
+        self.calls["config"] += 1
+        self.options.update(options)
+
+    configure = config
+
+    def cget(self, option: str) -> Any:
+        return self.options.get(option)
+
+    # ── widget plumbing ───────────────────────────────────────────────
+
+    def bind(self, sequence: str, func: Callable) -> None:
+        self.bindings[sequence] = func
+
+    def focus_set(self) -> None:
+        self.focused = True
+
+    def pack(self, **options: Any) -> None:
+        self.packed = True
+
+    def update_idletasks(self) -> None:
+        self.calls["update_idletasks"] += 1
+
+    # ── event injection ───────────────────────────────────────────────
+
+    def key(self, keysym: str, char: str = "") -> None:
+        """Deliver a key press, picking the most specific binding like Tk."""
+        for sequence in (char, f"<{keysym}>", "<Key>"):
+            if sequence in self.bindings:
+                event = HeadlessEvent(widget=self, char=char, keysym=keysym)
+                self.bindings[sequence](event)
+                return
+
+    def type(self, text: str) -> None:
+        """Deliver one key press per character of *text*."""
+        for char in text:
+            self.key(char, char)
+
+    def resize(self, width: int, height: int) -> None:
+        """Deliver a ``<Configure>`` event for a new widget size."""
+        self.options.update(width=width, height=height)
+        handler = self.bindings.get("<Configure>")
+        if handler is not None:
+            handler(HeadlessEvent(widget=self, width=width, height=height))
+
+    def mouse(
+        self, sequence: str, x: int = 0, y: int = 0, x_root: int = 0, y_root: int = 0
+    ) -> None:
+        """Deliver a mouse event such as ``<Button-3>`` or ``<B1-Motion>``."""
+        if self.master is not None:
+            self.master.pointer = (x_root, y_root)
+        handler = self.bindings.get(sequence)
+        if handler is not None:
+            handler(HeadlessEvent(widget=self, x=x, y=y, x_root=x_root, y_root=y_root))
+
+
+class RecordingTerminal:
+    """Display-less replacement for a curses window driven by a virtual clock.
+
+    Key codes are scripted with :meth:`press` and delivered by
+    :meth:`getch` at their time; waiting for a key advances the clock.
+    Every ``addstr`` is recorded in ``cells`` and counted in ``writes``.
+    """
+
+    def __init__(
+        self, clock: VirtualClock | None = None, size: tuple[int, int] = (80, 24)
+    ) -> None:
+        self.clock = clock if clock is not None else VirtualClock()
+        self.size = size
+        self.writes = 0
+        self.refreshes = 0
+        self.cells: dict[tuple[int, int], tuple[str, int]] = {}
+        self._keys: list[tuple[float, int, int]] = []
+        self._seq = itertools.count()
+        self._timeout_ms = -1
+
+    # ── curses window API ─────────────────────────────────────────────
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return self.size[1], self.size[0]
+
+    def keypad(self, flag: bool) -> None:
+        pass
+
+    def timeout(self, ms: int) -> None:
+        self._timeout_ms = ms
+
+    def getch(self) -> int:
+        now = self.clock()
+        if self._timeout_ms < 0:
+            if not self._keys:
+                raise RuntimeError("waiting for a key that never comes")
+            deadline = float("inf")
+        else:
+            deadline = now + self._timeout_ms / 1000
+        if self._keys and self._keys[0][0] <= deadline:
+            t, _, key = heapq.heappop(self._keys)
+            self.clock.advance(max(0.0, t - now))
+            return key
+        self.clock.advance(deadline - now)
+        return -1
+
+    def addstr(self, y: int, x: int, text: str, attr: int = 0) -> None:
+        width, height = self.size
+        if not (0 <= y < height and 0 <= x < width):
+            raise ValueError(f"({x}, {y}) is outside the {width}x{height} window")
+        for i, char in enumerate(text[: width - x]):
+            self.cells[y, x + i] = (char, attr)
+        self.writes += 1
+
+    def erase(self) -> None:
+        self.cells.clear()
+
+    def refresh(self) -> None:
+        self.refreshes += 1
+
+    # ── input and inspection ──────────────────────────────────────────
+
+    def press(self, key: int | str, at: float | None = None) -> None:
+        """Deliver *key* (a code or a character) at clock time *at* (now)."""
+        code = ord(key) if isinstance(key, str) else key
+        t = self.clock() if at is None else at
+        heapq.heappush(self._keys, (t, next(self._seq), code))
+
+    def row(self, y: int) -> str:
+        """The characters shown on row *y*."""
+        return "".join(self.cells.get((y, x), (" ", 0))[0] for x in range(self.size[0]))
+
+
+class SilentSound:
+    """A loaded sound that plays nothing, for machines without audio."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.plays = 0
+
+    def play(self) -> None:
+        self.plays += 1
+
+
+def load_silent_sound(sound_path: str) -> SilentSound:
+    """Sound loader for :class:`~lightimer.sound.AudioProcess` in tests.
+
+    A module-level function, so the audio process can import it.
+    """
+    return SilentSound(sound_path)
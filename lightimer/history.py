@@ -0,0 +1,284 @@
+"""Local SQLite history of talks, for statistics on overruns and pauses.
+
+A talk starts with the first ``start`` after the timer was set or reset
+and ends with the next ``set`` or ``reset`` (or when Lightimer closes).
+:class:`SessionTracker` follows the timer's transitions and hands each
+finished talk to :class:`HistoryStore`, whose writer thread inserts them
+in batches, one transaction per batch, so the UI thread never waits for
+the disk.
+
+Overrun is the time between the countdown running out and the talk
+being ended.  :func:`stats` computes the distribution over all recorded
+talks from indexed queries and never loads the table into Python.
+"""
+
+from __future__ import annotations
+
+import logging
+import pathlib
+import queue
+import sqlite3
+import threading
+import time
+from typing import Callable, NamedTuple
+
+from lightimer.config import HISTORY_BATCH, HISTORY_FLUSH_S
+from lightimer.timer import StaticTimer
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    started REAL NOT NULL,   -- time.time() of the first start
+    duration REAL NOT NULL,  -- configured period, seconds
+    elapsed REAL NOT NULL,   -- time spent counting down or overrunning
+    overrun REAL NOT NULL,   -- time past zero before the talk was ended
+    pauses INTEGER NOT NULL,
+    paused REAL NOT NULL     -- total time paused, seconds
+);
+-- Covers every query of stats(): no table lookups at all
+CREATE INDEX IF NOT EXISTS sessions_duration
+    ON sessions (duration, overrun, pauses);
+"""
+
+_INSERT = (
+    "INSERT INTO sessions (started, duration, elapsed, overrun, pauses, paused) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+# The queries of stats()
+_BY_DURATION = (
+    "SELECT duration, COUNT(*), SUM(overrun > 0),"
+    " AVG(CASE WHEN overrun > 0 THEN overrun END),"
+    " SUM(pauses > 0), AVG(pauses)"
+    " FROM sessions GROUP BY duration ORDER BY duration"
+)
+_OVERRUN_AT_RANK = (
+    "SELECT overrun FROM sessions WHERE duration = ?"
+    " ORDER BY overrun LIMIT 1 OFFSET ?"
+)
+
+PERCENTILES = (50, 90, 99)
+
+
+class Session(NamedTuple):
+    """One finished talk."""
+
+    started: float
+    duration: float
+    elapsed: float
+    overrun: float
+    pauses: int
+    paused: float
+
+
+class SessionTracker:
+    """Turn timer transitions into :class:`Session` records for *sink*.
+
+    Add the tracker to a timer's ``listeners``; call :meth:`finish` when
+    the app closes so a talk still in progress is not lost.
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[Session], None],
+        wall: Callable[[], float] = time.time,
+    ) -> None:
+        self.sink = sink
+        self.wall = wall
+        self._timer: StaticTimer | None = None
+        self._started: float | None = None  # timer clock
+        self._started_wall = 0.0
+        self._duration = 0.0
+        self._paused_at: float | None = None
+        self._pauses = 0
+        self._paused = 0.0
+        self._expired_at: float | None = None
+
+    def __call__(self, event: str, timer: StaticTimer) -> None:
+        self._timer = timer
+        now = timer.clock()
+        if event in ("set", "reset"):
+            self._end(now)
+        elif event == "start":
+            if self._started is None:
+                self._started = now
+                self._started_wall = self.wall()
+                self._duration = timer.state().period
+            elif self._paused_at is not None:
+                self._paused += now - self._paused_at
+            self._paused_at = None
+        elif event == "stop" and self._started is not None:
+            self._pauses += 1
+            self._paused_at = now
+        elif event == "timesup" and self._started is not None:
+            self._expired_at = now
+
+    def finish(self) -> None:
+        """End the talk in progress, if any."""
+        if self._timer is not None:
+            self._end(self._timer.clock())
+
+    def _end(self, now: float) -> None:
+        if self._started is not None and self._timer is not None:
+            paused = self._paused
+            if self._paused_at is not None:
+                paused += now - self._paused_at
+            overrun = 0.0 if self._expired_at is None else now - self._expired_at
+            self.sink(
+                Session(
+                    started=self._started_wall,
+                    duration=self._duration,
+                    elapsed=now - self._started - paused,
+                    overrun=overrun,
+                    pauses=self._pauses,
+                    paused=paused,
+                )
+            )
+        self._started = self._paused_at = self._expired_at = None
+        self._pauses = 0
+        self._paused = 0.0
+
+
+class HistoryStore:
+    """Append :class:`Session` records to the database at *path*.
+
+    :meth:`add` only queues the record.  The writer thread commits
+    whatever has queued up, at most *batch* records per transaction, at
+    least every *flush_interval* seconds while records arrive.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch: int = HISTORY_BATCH,
+        flush_interval: float = HISTORY_FLUSH_S,
+    ) -> None:
+        self.path = path
+        self.batch = batch
+        self.flush_interval = flush_interval
+        # Create the schema here so a bad path fails before the UI starts
+        _connect(path).close()
+        self._queue: queue.Queue[Session | None] = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="lightimer-history", daemon=True
+        )
+        self._thread.start()
+
+    def add(self, session: Session) -> None:
+        self._queue.put(session)
+
+    def flush(self) -> None:
+        """Block until everything added so far is committed."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Commit what is queued and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        db = _connect(self.path)
+        try:
+            while True:
+                pending = [self._queue.get()]
+                deadline = time.monotonic() + self.flush_interval
+                while pending[-1] is not None and len(pending) < self.batch:
+                    try:
+                        pending.append(
+                            self._queue.get(timeout=deadline - time.monotonic())
+                        )
+                    except (queue.Empty, ValueError):
+                        break  # ValueError: the deadline has already passed
+                sessions = [s for s in pending if s is not None]
+                try:
+                    with db:
+                        db.executemany(_INSERT, sessions)
+                except sqlite3.Error:
+                    logger.exception("cannot write %d talks", len(sessions))
+                for _ in pending:
+                    self._queue.task_done()
+                if pending[-1] is None:
+                    return
+        finally:
+            db.close()
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    db = sqlite3.connect(path)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.executescript(_SCHEMA)
+    return db
+
+
+# ── analysis ──────────────────────────────────────────────────────────
+
+
+class DurationStats(NamedTuple):
+    """Overrun statistics of the talks with one configured duration."""
+
+    duration: float
+    talks: int
+    overran: int
+    mean_overrun: float  # over the talks that overran
+    percentiles: tuple[float, ...]  # overrun at PERCENTILES, all talks
+    paused: int  # talks with at least one pause
+    mean_pauses: float
+
+
+def stats(path: str) -> list[DurationStats]:
+    """Overrun and pause statistics of the database at *path*, by duration.
+
+    Every query is answered from the covering ``sessions_duration``
+    index: the counts and means by one grouped scan of it, each
+    percentile by stepping to its rank within one duration.  The
+    database is opened read-only: a wrong *path* raises
+    ``sqlite3.OperationalError`` instead of creating an empty history.
+    """
+    uri = pathlib.Path(path).resolve().as_uri()
+    db = sqlite3.connect(f"{uri}?mode=ro", uri=True)
+    try:
+        rows = db.execute(_BY_DURATION).fetchall()
+        result = []
+        for duration, talks, overran, mean_overrun, paused, mean_pauses in rows:
+            percentiles = tuple(
+                db.execute(
+                    _OVERRUN_AT_RANK, (duration, min(talks - 1, talks * p // 100))
+                ).fetchone()[0]
+                for p in PERCENTILES
+            )
+            result.append(
+                DurationStats(
+                    duration,
+                    talks,
+                    overran,
+                    mean_overrun or 0.0,
+                    percentiles,
+                    paused,
+                    mean_pauses,
+                )
+            )
+        return result
+    finally:
+        db.close()
+
+
+def report(rows: list[DurationStats]) -> str:
+    """Return a human-readable table of :func:`stats`."""
+    if not rows:
+        return "no talks recorded"
+    head = "".join(f"  p{p:<5}" for p in PERCENTILES)
+    lines = [f"duration   talks  overran  mean over{head}  paused  pauses"]
+    for r in rows:
+        cells = "".join(f"{v:7.1f}s" for v in r.percentiles)
+        lines.append(
+            f"{StaticTimer.format(r.duration):>8} {r.talks:7d} "
+            f"{100 * r.overran / r.talks:7.1f}% {r.mean_overrun:9.1f}s"
+            f"{cells} {100 * r.paused / r.talks:6.1f}% {r.mean_pauses:7.2f}"
+        )
+    talks = sum(r.talks for r in rows)
+    overran = sum(r.overran for r in rows)
+    lines.append(f"{talks} talks, {100 * overran / talks:.1f}% overran")
+    return "\n".join(lines)
@@ -0,0 +1,171 @@
+"""Single-instance mode: later launches hand their options to the first one.
+
+The first Lightimer a user starts claims a loopback TCP port picked from
+their user name, so that the timers of different users on one machine do
+not answer each other's launches.  A later launch
+finds the port taken, sends its ``--lean``, ``--sound-file`` and
+``--duration`` options there as one JSON line, waits for the ``ok`` and
+exits, without creating a Tk root or loading pygame: this module only
+needs the standard library.
+
+Binding a listening socket is atomic, so of two launches at the same
+moment exactly one becomes the instance, and a crashed instance leaves
+no lock file behind.  Two user names can still hash to the same port;
+the second of those users to start Lightimer then forwards to the first
+one's timer, and should use ``--new-instance``.
+"""
+
+from __future__ import annotations
+
+import getpass
+import json
+import logging
+import select
+import socket
+import sys
+import threading
+import zlib
+from typing import Callable, NamedTuple
+
+from lightimer.config import INSTANCE_PORT, INSTANCE_PORTS
+
+logger = logging.getLogger(__name__)
+
+_HOST = "127.0.0.1"
+_MAX_MESSAGE = 64 * 1024
+_READ_TIMEOUT_S = 0.5
+
+
+class Launch(NamedTuple):
+    """What a later launch asks of the running instance."""
+
+    lean: bool = False
+    sound_file: str | None = None
+    duration: float | None = None  # seconds
+
+    def encode(self) -> bytes:
+        return json.dumps(self._asdict()).encode() + b"\n"
+
+    @classmethod
+    def decode(cls, data: bytes) -> Launch:
+        """Parse a launch message, raising ``ValueError`` when it is invalid."""
+        try:
+            fields = json.loads(data)
+            launch = cls(
+                lean=bool(fields.get("lean", False)),
+                sound_file=fields.get("sound_file"),
+                duration=fields.get("duration"),
+            )
+        except (ValueError, TypeError, AttributeError):
+            raise ValueError("expected a JSON object of launch options") from None
+        if launch.sound_file is not None and not isinstance(launch.sound_file, str):
+            raise ValueError("sound_file must be a string")
+        if launch.duration is not None and (
+            not isinstance(launch.duration, (int, float)) or launch.duration <= 0
+        ):
+            raise ValueError("duration must be a positive number of seconds")
+        return launch
+
+
+def instance_port() -> int:
+    """The loopback port of the current user's instance."""
+    try:
+        user = getpass.getuser()
+    except (KeyError, OSError):
+        user = ""  # no login name: share the base port
+    return INSTANCE_PORT + zlib.crc32(user.encode()) % INSTANCE_PORTS
+
+
+def claim(port: int | None = None) -> socket.socket | None:
+    """Listen on *port*, or return ``None`` if it is taken already.
+
+    *port* defaults to :func:`instance_port`.
+    """
+    if port is None:
+        port = instance_port()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if sys.platform == "win32":
+        # Without this, Windows lets a second process bind the same port
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+    try:
+        sock.bind((_HOST, port))
+        sock.listen(8)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def forward(
+    launch: Launch, port: int | None = None, timeout: float = 2.0
+) -> bool:
+    """Hand *launch* to the instance on *port*; ``False`` if none answered."""
+    if port is None:
+        port = instance_port()
+    try:
+        with socket.create_connection((_HOST, port), timeout=timeout) as sock:
+            sock.sendall(launch.encode())
+            sock.shutdown(socket.SHUT_WR)
+            return sock.makefile("rb").readline().strip() == b"ok"
+    except OSError as exc:
+        logger.debug("instance: cannot forward launch: %s", exc)
+        return False
+
+
+class InstanceServer:
+    """Accept launches on the claimed *sock* and pass them to *dispatch*.
+
+    *dispatch* runs on the server thread; like the state server's, it
+    should hand the launch to the UI thread (:meth:`~lightimer.ui.LightimerApp.post`).
+    """
+
+    def __init__(
+        self, sock: socket.socket, dispatch: Callable[[Launch], None]
+    ) -> None:
+        self.sock = sock
+        self.port: int = sock.getsockname()[1]
+        self.dispatch = dispatch
+        self._stopped = threading.Event()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._thread = threading.Thread(
+            target=self._run, name="lightimer-instance", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop accepting launches and give the port up."""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._wake_w.send(b"\0")
+        if self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+        for sock in (self.sock, self._wake_r, self._wake_w):
+            sock.close()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            readable, _, _ = select.select([self.sock, self._wake_r], [], [])
+            if self.sock in readable:
+                try:
+                    conn, _ = self.sock.accept()
+                except OSError:
+                    continue
+                with conn:
+                    self._serve(conn)
+
+    def _serve(self, conn: socket.socket) -> None:
+        conn.settimeout(_READ_TIMEOUT_S)
+        try:
+            data = conn.makefile("rb").readline(_MAX_MESSAGE)
+            launch = Launch.decode(data)
+        except (OSError, ValueError) as exc:
+            logger.warning("instance: ignored launch message: %s", exc)
+            return
+        self.dispatch(launch)
+        try:
+            conn.sendall(b"ok\n")
+        except OSError:
+            pass  # the launch gave up waiting
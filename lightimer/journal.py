@@ -0,0 +1,127 @@
+"""Crash-safe journal of the timer state in a small memory-mapped file.
+
+Only state transitions are journalled (set, start, stop, reset, …, plus
+moving or turning the window), never frames.  A write is a ``struct``
+pack into a mapped page, so it costs about a microsecond and leaves
+writing the page back to the kernel: a crashed or killed process loses
+nothing.
+
+The file holds two record slots that are written alternately, each with
+a sequence number and a CRC32, so a write torn by a crash or power loss
+leaves the previous record intact.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import time
+import zlib
+from typing import Callable, NamedTuple
+
+from lightimer.timer import TimerState
+
+_MAGIC = b"LTJ1"
+# seq, then the JournalEntry fields
+_RECORD = struct.Struct("<Qdd?dBii")
+_CRC = struct.Struct("<I")
+_SLOT = _RECORD.size + _CRC.size
+SIZE = len(_MAGIC) + 2 * _SLOT
+
+
+class JournalEntry(NamedTuple):
+    """The last journalled state of the timer and its window."""
+
+    period: float
+    remaining: float  # when the entry was written
+    running: bool
+    wall: float  # ``time.time()`` when the entry was written
+    orientation: int  # ``Orientation`` value
+    x: int
+    y: int
+
+    def state(self, now: float | None = None) -> TimerState:
+        """The timer state at wall-clock time *now* (default: the present).
+
+        A running timer kept counting while the process was gone, asleep
+        or not, so the time since the entry was written is subtracted.
+        """
+        remaining = self.remaining
+        if self.running:
+            now = time.time() if now is None else now
+            remaining -= max(0.0, now - self.wall)
+        return TimerState(self.period, remaining, self.running)
+
+
+class Journal:
+    """Fixed-size journal file at *path*, created on first use.
+
+    A file at *path* that is neither empty nor a journal raises
+    ``ValueError`` and is not touched.
+
+    Entries are stamped with *wall*, which must be a wall clock (it keeps
+    counting while no process runs); tests pass a virtual one.
+    """
+
+    def __init__(self, path: str, wall: Callable[[], float] = time.time) -> None:
+        self.path = path
+        self.wall = wall
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            size = os.fstat(fd).st_size
+            if size not in (0, SIZE):
+                raise ValueError(f"{path} is not a Lightimer journal")
+            if not size:
+                os.ftruncate(fd, SIZE)
+            self._map = mmap.mmap(fd, SIZE)
+        finally:
+            os.close(fd)
+        if self._map[: len(_MAGIC)] != _MAGIC:
+            # A journal is only ever created from an empty file: anything
+            # else belongs to someone else and is left alone
+            if self._map[:] != bytes(SIZE):
+                self._map.close()
+                raise ValueError(f"{path} is not a Lightimer journal")
+            self._map[: len(_MAGIC)] = _MAGIC
+        last = self._latest()
+        self._seq = 0 if last is None else last[0]
+
+    def read(self) -> JournalEntry | None:
+        """Return the newest intact entry, or ``None`` for an empty journal."""
+        last = self._latest()
+        return None if last is None else last[1]
+
+    def write(self, state: TimerState, orientation: int, x: int, y: int) -> None:
+        """Journal *state* and the window placement."""
+        self._seq += 1
+        record = _RECORD.pack(
+            self._seq,
+            state.period,
+            state.remaining,
+            state.running,
+            self.wall(),
+            orientation,
+            x,
+            y,
+        )
+        offset = len(_MAGIC) + (self._seq % 2) * _SLOT
+        self._map[offset : offset + _SLOT] = record + _CRC.pack(zlib.crc32(record))
+
+    def close(self) -> None:
+        """Write the journal back to disk and unmap it."""
+        self._map.flush()
+        self._map.close()
+
+    def _latest(self) -> tuple[int, JournalEntry] | None:
+        best = None
+        for slot in range(2):
+            offset = len(_MAGIC) + slot * _SLOT
+            record = self._map[offset : offset + _RECORD.size]
+            (crc,) = _CRC.unpack_from(self._map, offset + _RECORD.size)
+            if zlib.crc32(record) != crc:
+                continue  # torn or never written
+            seq, *fields = _RECORD.unpack(record)
+            if seq and (best is None or seq > best[0]):
+                best = (seq, JournalEntry(*fields))
+        return best
@@ -0,0 +1,122 @@
+"""Size- and DPI-dependent layout of a timer window.
+
+The window constants in :mod:`lightimer.config` describe the timer at
+96 dpi.  Everything drawn is derived from the actual canvas size and the
+display scaling by :func:`compute_layout`, which is cached: a window
+that keeps its size never recomputes its layout, and going back to a
+size seen before (turning the window, undoing a resize) is a lookup.
+"""
+
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+from lightimer.config import (
+    FRACTION_FONT,
+    HEIGHT_H,
+    HEIGHT_V,
+    LAYOUT_CACHE_SIZE,
+    LIN_GAP,
+    TIME_FONT,
+    WIDTH_H,
+    WIDTH_V,
+    WIN_GAP,
+    Orientation,
+)
+
+BASE_DPI = 96.0
+# Width of "MM:SS" in ems: Helvetica's digits are all 0.556 em wide
+_LABEL_EMS = 4 * 0.556 + 0.278
+
+_BASE: dict[Orientation, tuple[int, int]] = {
+    Orientation.VERTICAL: (WIDTH_V, HEIGHT_V),
+    Orientation.HORIZONTAL: (WIDTH_H, HEIGHT_H),
+}
+
+_TEXT_GAP: dict[str, int] = {
+    "linux": LIN_GAP,
+    "win32": WIN_GAP,
+}
+
+
+class Layout(NamedTuple):
+    """Where things go on a canvas of a given size."""
+
+    width: int
+    height: int
+    axis: int  # length of the canvas along which the bar moves
+    text_x: float
+    text_y: float
+    font: tuple[str, int]
+    lead: int  # thickness of the bar's leading-edge line
+    # Where the ``.cc`` of centisecond mode goes: its own fixed-width item
+    # next to (horizontal) or under (vertical) the label
+    fraction_x: float = 0.0
+    fraction_y: float = 0.0
+    fraction_anchor: str = "w"
+    fraction_font: tuple[str, int] = FRACTION_FONT
+
+
+def base_size(orientation: Orientation, scale: float = 1.0) -> tuple[int, int]:
+    """Default canvas size for *orientation* at display *scale*."""
+    w, h = _BASE[orientation]
+    return round(w * scale), round(h * scale)
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def compute_layout(
+    width: int,
+    height: int,
+    orientation: Orientation,
+    scale: float = 1.0,
+    platform: str = sys.platform,
+) -> Layout:
+    """Lay out a *width* × *height* canvas at display *scale*.
+
+    The label grows and shrinks with the window, relative to the default
+    size, but never below ``TIME_FONT``.  Font sizes are in points, which
+    Tk already scales to the display, so only the window's growth beyond
+    its default size enlarges them.
+    """
+    base_w, base_h = _BASE[orientation]
+    factor = max(scale, min(width / base_w, height / base_h))
+    axis = height if orientation is Orientation.VERTICAL else width
+    gap = _TEXT_GAP.get(platform, WIN_GAP) * factor
+    font_size = round(TIME_FONT[1] * factor / scale)
+    fraction_size = round(FRACTION_FONT[1] * factor / scale)
+    # Points to pixels, as Tk converts them on this display
+    label_px = font_size * BASE_DPI * scale / 72
+    fraction_px = fraction_size * BASE_DPI * scale / 72
+    text_x, text_y = width / 2, gap
+    if orientation is Orientation.VERTICAL:
+        fraction = (text_x, text_y + label_px / 2, "n")
+    else:
+        # Right after the centred label, roughly on its baseline
+        fraction = (
+            text_x + _LABEL_EMS * label_px / 2,
+            text_y + (label_px - fraction_px) / 4,
+            "w",
+        )
+    return Layout(
+        width=width,
+        height=height,
+        axis=axis,
+        text_x=text_x,
+        text_y=text_y,
+        font=(TIME_FONT[0], font_size),
+        lead=max(1, round(scale)),
+        fraction_x=fraction[0],
+        fraction_y=fraction[1],
+        fraction_anchor=fraction[2],
+        fraction_font=(FRACTION_FONT[0], fraction_size),
+    )
+
+
+def dpi_scale(widget: Any) -> float:
+    """Display scaling of *widget*'s screen relative to 96 dpi."""
+    try:
+        return max(1.0, widget.winfo_fpixels("1i") / BASE_DPI)
+    except (AttributeError, ValueError):
+        return 1.0
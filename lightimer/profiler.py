@@ -0,0 +1,101 @@
+"""Low-overhead frame-timing profiler for the render loop."""
+
+from __future__ import annotations
+
+import math
+from array import array
+
+# ~9 min of frames at 120 fps, 25 bytes each
+DEFAULT_CAPACITY: int = 1 << 16
+
+# Upper edges (ms) of the lateness histogram buckets
+_BUCKETS_MS: tuple[float, ...] = (1, 2, 4, 8, 16, 33, 66, 133, 266, math.inf)
+
+
+class FrameProfiler:
+    """Record when each frame was due, when it ran and how long it took.
+
+    Samples go into preallocated ring buffers (``array`` columns), so
+    recording a frame allocates nothing and the oldest frames are
+    overwritten once *capacity* frames have been seen.  A frame counts as
+    late when it starts more than *late_after* seconds after schedule.
+    """
+
+    def __init__(
+        self, capacity: int = DEFAULT_CAPACITY, late_after: float = 0.008
+    ) -> None:
+        self.capacity = capacity
+        self.late_after = late_after
+        self.count = 0
+        self._scheduled = array("d", bytes(8 * capacity))
+        self._actual = array("d", bytes(8 * capacity))
+        self._render = array("d", bytes(8 * capacity))
+        self._late = array("B", bytes(capacity))
+
+    def record(self, scheduled: float, actual: float, render: float) -> None:
+        """Store one frame: due time, start time and render duration (s)."""
+        i = self.count % self.capacity
+        self._scheduled[i] = scheduled
+        self._actual[i] = actual
+        self._render[i] = render
+        self._late[i] = actual - scheduled > self.late_after
+        self.count += 1
+
+    # ── analysis ──────────────────────────────────────────────────────
+
+    def frames(self) -> list[tuple[float, float, float, bool]]:
+        """Buffered frames, oldest first, as (scheduled, actual, render, late)."""
+        n = min(self.count, self.capacity)
+        first = self.count - n
+        return [
+            (
+                self._scheduled[j],
+                self._actual[j],
+                self._render[j],
+                bool(self._late[j]),
+            )
+            for j in (i % self.capacity for i in range(first, first + n))
+        ]
+
+    def histogram(self) -> list[tuple[float, int]]:
+        """Lateness histogram as (upper edge in ms, frame count) pairs."""
+        counts = [0] * len(_BUCKETS_MS)
+        for scheduled, actual, _, _ in self.frames():
+            late_ms = (actual - scheduled) * 1000
+            for k, edge in enumerate(_BUCKETS_MS):
+                if late_ms < edge:
+                    counts[k] += 1
+                    break
+        return list(zip(_BUCKETS_MS, counts))
+
+    def worst(self, n: int = 10) -> list[tuple[float, float, float, bool]]:
+        """The *n* frames that started latest relative to their schedule."""
+        return sorted(self.frames(), key=lambda f: f[0] - f[1])[:n]
+
+    def report(self) -> str:
+        """Return a human-readable summary, histogram and worst frames."""
+        frames = self.frames()
+        late = sum(1 for f in frames if f[3])
+        lines = [
+            f"frames recorded: {self.count} (buffered: {len(frames)})",
+            f"late frames (> {self.late_after * 1000:.1f} ms): {late}",
+            "",
+            "lateness histogram:",
+        ]
+        lower = 0.0
+        for edge, count in self.histogram():
+            lines.append(f"  {lower:6.0f} - {edge:6.0f} ms  {count:8d}")
+            lower = edge
+
+        lines += ["", "worst frames (scheduled s, late ms, render ms):"]
+        for scheduled, actual, render, _ in self.worst():
+            lines.append(
+                f"  {scheduled:14.3f}  {(actual - scheduled) * 1000:8.2f}"
+                f"  {render * 1000:8.3f}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str) -> None:
+        """Write :meth:`report` to *path*."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.report())
@@ -0,0 +1,254 @@
+"""Compact binary recording of a session's input events and timer transitions.
+
+A log starts with a header describing the app (initial period, number
+of windows, screen size, and as JSON the options that change what it
+does: agenda, fullscreen, centiseconds, frame scheduling) followed by
+little-endian records, each stamped with seconds on the timer clock
+since recording began:
+
+* input records name the event handler that ran, the window it ran in
+  and the event fields the handlers look at;
+* call records name an entry point that is not a Tk handler (a remote
+  command, a sync update, a later launch, a journal resume) and hold
+  its arguments as JSON;
+* transition records hold a timer event and the resulting state.
+
+:mod:`lightimer.replay` feeds a log back through a headless app under
+virtual time.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import time
+from typing import IO, Any, Iterator, NamedTuple
+
+from lightimer.timer import StaticTimer
+
+MAGIC = b"LTRC"
+VERSION = 2
+
+# Handlers that can be recorded, by their index in the log
+HANDLERS: tuple[str, ...] = (
+    "_on_click",
+    "_on_double_click",
+    "_on_motion_start",
+    "_on_motion",
+    "_on_motion_stop",
+    "_on_toggle",
+    "_on_lean",
+    "_on_change_time",
+    "_on_close",
+    "_on_help",
+    "_on_next_segment",
+    "_on_prev_segment",
+    "_on_configure",
+)
+_HANDLER_IDS = {name: i for i, name in enumerate(HANDLERS)}
+
+# Entry points other than event handlers, by their index in the log
+CALLS: tuple[str, ...] = (
+    "handle_command",
+    "follow",
+    "apply_launch",
+    "resume",
+    "set_duration",
+)
+_CALL_IDS = {name: i for i, name in enumerate(CALLS)}
+
+TIMER_EVENTS: tuple[str, ...] = ("set", "reset", "start", "stop", "seek", "timesup")
+_TIMER_EVENT_IDS = {name: i for i, name in enumerate(TIMER_EVENTS)}
+
+INPUT, TRANSITION, CALL = 1, 2, 3
+
+# wall-clock start, timer clock at the start, initial period, windows,
+# screen width and height, length of the JSON options that follow
+_HEADER = struct.Struct("<4sBdddBHHI")
+# time, kind, then per kind: handler, window, char, x, y, x_root, y_root,
+# width, height / event, running, period, remaining / entry point and
+# length of the JSON arguments that follow
+_PREFIX = struct.Struct("<dB")
+_INPUT = struct.Struct("<BBIiiiiii")
+_TRANSITION = struct.Struct("<B?dd")
+_CALL = struct.Struct("<BI")
+_BODIES = {INPUT: _INPUT, TRANSITION: _TRANSITION, CALL: _CALL}
+
+
+class Header(NamedTuple):
+    wall: float
+    t0: float  # timer clock when recording began
+    period: float
+    windows: int
+    screen: tuple[int, int]
+    options: dict[str, Any]
+
+
+class InputRecord(NamedTuple):
+    t: float
+    handler: str
+    window: int
+    char: str
+    x: int
+    y: int
+    x_root: int
+    y_root: int
+    width: int
+    height: int
+
+
+class CallRecord(NamedTuple):
+    t: float
+    name: str
+    args: list[Any]
+
+
+class TransitionRecord(NamedTuple):
+    t: float
+    event: str
+    running: bool
+    period: float
+    remaining: float
+
+
+class Recorder:
+    """Write a session log to *path*.
+
+    :meth:`attach` starts recording an app; after that the app reports
+    its input through :meth:`input` and :meth:`call` and the timer its
+    transitions.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file: IO[bytes] = open(path, "wb")
+        self._timer: StaticTimer | None = None
+        self._t0 = 0.0
+        self.records = 0
+
+    def attach(self, app: Any) -> None:
+        """Write the header for *app* and subscribe to its timer."""
+        self._timer = app.timer
+        self._t0 = app.timer.clock()
+        agenda = app.agenda
+        options = json.dumps(
+            {
+                "agenda": None
+                if agenda is None
+                else [[s.title, s.duration, s.gap] for s in agenda.segments],
+                "fullscreen": app.windows[0].fullscreen,
+                "centiseconds": app.centiseconds,
+                "adaptive": app.adaptive,
+                "max_fps": app.max_fps,
+            }
+        ).encode()
+        self._file.write(
+            _HEADER.pack(
+                MAGIC,
+                VERSION,
+                time.time(),
+                self._t0,
+                app.duration,
+                len(app.windows),
+                app.master.winfo_screenwidth(),
+                app.master.winfo_screenheight(),
+                len(options),
+            )
+            + options
+        )
+        app.timer.listeners.append(self._on_timer_event)
+
+    def input(self, handler: str, window: int, event: Any) -> None:
+        """Record that *handler* ran for *event* in window number *window*."""
+        char = getattr(event, "char", "") or ""
+        self._write(
+            INPUT,
+            _INPUT.pack(
+                _HANDLER_IDS[handler],
+                window,
+                ord(char[0]) if char else 0,
+                *(
+                    _int_field(event, name)
+                    for name in ("x", "y", "x_root", "y_root", "width", "height")
+                ),
+            ),
+        )
+
+    def call(self, name: str, *args: Any) -> None:
+        """Record that the entry point *name* was called with *args*."""
+        payload = json.dumps(args).encode()
+        self._write(CALL, _CALL.pack(_CALL_IDS[name], len(payload)) + payload)
+
+    def close(self) -> None:
+        if self._timer is not None and self._on_timer_event in self._timer.listeners:
+            self._timer.listeners.remove(self._on_timer_event)
+        self._file.close()
+
+    def _on_timer_event(self, event: str, timer: StaticTimer) -> None:
+        period, remaining, running = timer.state()
+        body = _TRANSITION.pack(_TIMER_EVENT_IDS[event], running, period, remaining)
+        self._write(TRANSITION, body)
+
+    def _write(self, kind: int, body: bytes) -> None:
+        t = self._timer.clock() - self._t0 if self._timer is not None else 0.0
+        self._file.write(_PREFIX.pack(t, kind) + body)
+        self.records += 1
+
+
+def _int_field(event: Any, name: str) -> int:
+    value = getattr(event, name, 0)
+    return value if isinstance(value, int) else 0
+
+
+Record = InputRecord | CallRecord | TransitionRecord
+
+
+def read_log(path: str) -> tuple[Header, list[Record]]:
+    """Read a session log, raising ``ValueError`` if it is not one."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < _HEADER.size:
+        raise ValueError("truncated session log")
+    magic, version, wall, t0, period, windows, sw, sh, size = _HEADER.unpack_from(
+        data
+    )
+    if magic != MAGIC:
+        raise ValueError("not a lightimer session log")
+    if version != VERSION:
+        raise ValueError(f"session log version {version}, expected {VERSION}")
+    offset = _HEADER.size + size
+    try:
+        options = json.loads(data[_HEADER.size : offset])
+    except ValueError:
+        raise ValueError("truncated session log") from None
+    return Header(wall, t0, period, windows, (sw, sh), options), list(
+        _records(data, offset)
+    )
+
+
+def _records(data: bytes, offset: int) -> Iterator[Record]:
+    while offset + _PREFIX.size <= len(data):
+        t, kind = _PREFIX.unpack_from(data, offset)
+        body = _BODIES.get(kind)
+        if body is None:
+            raise ValueError(f"unknown record kind {kind} at byte {offset}")
+        offset += _PREFIX.size
+        if offset + body.size > len(data):
+            return  # cut off by a crash: keep what is complete
+        fields = body.unpack_from(data, offset)
+        offset += body.size
+        if kind == CALL:
+            name, size = fields
+            if offset + size > len(data):
+                return
+            args = json.loads(data[offset : offset + size])
+            offset += size
+            yield CallRecord(t, CALLS[name], args)
+        elif kind == INPUT:
+            handler, window, char, *rest = fields
+            yield InputRecord(
+                t, HANDLERS[handler], window, chr(char) if char else "", *rest
+            )
+        else:
+            event, running, period, remaining = fields
+            yield TransitionRecord(t, TIMER_EVENTS[event], running, period, remaining)
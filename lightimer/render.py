@@ -0,0 +1,72 @@
+"""Dirty-tracking render layer on top of a Tk canvas."""
+
+from __future__ import annotations
+
+from typing import Any
+
+_UNSET = object()
+
+
+class CanvasRenderer:
+    """Forward canvas updates to Tk only when they change something.
+
+    Every ``coords``/``itemconfig`` call is a round trip into the Tcl
+    interpreter.  The renderer remembers the last coordinates and options
+    applied to each item and drops updates that would re-send the same
+    values.  ``issued`` and ``skipped`` count the Tcl calls made and saved.
+    """
+
+    def __init__(self, canvas: Any) -> None:
+        self.canvas = canvas
+        self._coords: dict[int, tuple[float, ...]] = {}
+        self._options: dict[int, dict[str, Any]] = {}
+        self._dirty: bool = False
+        self.issued: int = 0
+        self.skipped: int = 0
+
+    # ── item updates ──────────────────────────────────────────────────
+
+    def coords(self, item: int, *coords: float) -> None:
+        """Move *item* to *coords* unless it is already there."""
+        if self._coords.get(item) == coords:
+            self.skipped += 1
+            return
+        self._coords[item] = coords
+        self.canvas.coords(item, *coords)
+        self._issue()
+
+    def itemconfig(self, item: int, **options: Any) -> None:
+        """Apply those *options* of *item* that differ from the last ones."""
+        applied = self._options.setdefault(item, {})
+        changed = {k: v for k, v in options.items() if applied.get(k, _UNSET) != v}
+        if not changed:
+            self.skipped += 1
+            return
+        applied.update(changed)
+        self.canvas.itemconfig(item, **changed)
+        self._issue()
+
+    def flush(self) -> None:
+        """Let Tk process the pending redraw, if anything was changed."""
+        if not self._dirty:
+            self.skipped += 1
+            return
+        self._dirty = False
+        self.canvas.update_idletasks()
+        self.issued += 1
+
+    def invalidate(self) -> None:
+        """Forget all cached state, e.g. after the canvas was reconfigured."""
+        self._coords.clear()
+        self._options.clear()
+
+    # ── statistics ────────────────────────────────────────────────────
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of Tcl calls issued and skipped so far."""
+        return {"issued": self.issued, "skipped": self.skipped}
+
+    def _issue(self) -> None:
+        self._dirty = True
+        self.issued += 1
+
@@ -0,0 +1,200 @@
+"""Replay a recorded session through a headless app under virtual time.
+
+Usage::
+
+    python -m lightimer.replay SESSION.log [--verbose]
+
+The app is built with the recorded options.  Input and call records
+are fed to the same ``LightimerApp`` handlers and entry points that ran
+when the session was recorded, with the virtual clock advanced to each
+record's timestamp, so frames and expiry happen exactly as scheduled but
+without waiting.  The timer transitions of the replay are compared with
+the recorded ones; the first mismatch is reported, which is where a
+change in behaviour shows up.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from dataclasses import dataclass, field
+
+from lightimer.agenda import Agenda, Segment
+from lightimer.headless import (
+    HeadlessEvent,
+    HeadlessImage,
+    HeadlessRoot,
+    HeadlessToplevel,
+    RecordingCanvas,
+)
+from lightimer.instance import Launch
+from lightimer.recorder import (
+    CallRecord,
+    Header,
+    InputRecord,
+    TransitionRecord,
+    read_log,
+)
+from lightimer.timer import TimerState
+from lightimer.ui import LightimerApp
+
+# Expiry is detected on the first frame past zero, which may fall on a
+# slightly different instant in real and virtual time
+_TOLERANCE_S = 0.05
+
+# Inputs this close together were queued together, and Tk handled them
+# all before running any idle callback (see LightimerApp._flush_keys)
+_BURST_S = 0.001
+
+
+@dataclass
+class ReplayResult:
+    """What happened when a log was replayed."""
+
+    inputs: int = 0
+    recorded: list[TransitionRecord] = field(default_factory=list)
+    replayed: list[TransitionRecord] = field(default_factory=list)
+    frames: int = 0
+    virtual_s: float = 0.0
+    wall_s: float = 0.0
+
+    @property
+    def diverged_at(self) -> int | None:
+        """Index of the first transition that differs, or ``None``."""
+        for i, (a, b) in enumerate(zip(self.recorded, self.replayed)):
+            if (
+                a.event != b.event
+                or a.running != b.running
+                or a.period != b.period
+                or abs(a.remaining - b.remaining) > _TOLERANCE_S
+            ):
+                return i
+        if len(self.recorded) != len(self.replayed):
+            return min(len(self.recorded), len(self.replayed))
+        return None
+
+
+def replay(path: str) -> ReplayResult:
+    """Replay the session log at *path* and compare its transitions."""
+    started = time.perf_counter()
+    header, records = read_log(path)
+    options = header.options
+    agenda = options["agenda"]
+    root = HeadlessRoot(screen=header.screen)
+    app = LightimerApp(
+        root,
+        defer_assets=True,
+        clock=root.clock,
+        canvas_factory=RecordingCanvas,
+        windows=header.windows,
+        window_factory=HeadlessToplevel,
+        image_factory=HeadlessImage,
+        agenda=None if agenda is None else Agenda(Segment(*s) for s in agenda),
+        fullscreen=options["fullscreen"],
+        centiseconds=options["centiseconds"],
+        adaptive=options["adaptive"],
+        max_fps=options["max_fps"],
+    )
+    if app.duration != header.period:
+        app.set_duration(header.period)
+
+    result = ReplayResult()
+
+    def on_timer_event(event: str, timer) -> None:
+        period, remaining, running = timer.state()
+        result.replayed.append(
+            TransitionRecord(root.clock(), event, running, period, remaining)
+        )
+
+    app.timer.listeners.append(on_timer_event)
+    for record in records:
+        if isinstance(record, TransitionRecord):
+            result.recorded.append(record)
+            continue
+        if record.t - root.clock() > _BURST_S:
+            result.frames += root.advance(record.t - root.clock())
+        if isinstance(record, CallRecord):
+            _call(app, header, record)
+        else:
+            _dispatch(app, record)
+        result.inputs += 1
+    # Let a countdown that was still running play out
+    if app.timer.is_running and not root.destroyed:
+        result.frames += root.advance(max(0.0, app.timer.get_remaining()) + 1)
+
+    result.virtual_s = root.clock()
+    result.wall_s = time.perf_counter() - started
+    return result
+
+
+def _dispatch(app: LightimerApp, record: InputRecord) -> None:
+    window = app.windows[min(record.window, len(app.windows) - 1)]
+    event = HeadlessEvent(
+        widget=window.canvas,
+        char=record.char,
+        x=record.x,
+        y=record.y,
+        x_root=record.x_root,
+        y_root=record.y_root,
+        width=record.width,
+        height=record.height,
+    )
+    getattr(app, record.handler)(event)
+
+
+def _call(app: LightimerApp, header: Header, record: CallRecord) -> None:
+    args = record.args
+    if record.name == "follow":
+        state, at = args
+        # The recorded clock reading, on the replay's clock
+        app.follow(TimerState(*state), at - header.t0)
+    elif record.name == "apply_launch":
+        (launch,) = args
+        app.apply_launch(Launch(*launch))
+    elif record.name == "resume":
+        state, *placement = args
+        app.resume(TimerState(*state), *placement)
+    else:
+        getattr(app, record.name)(*args)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("log", help="session log written by --record")
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="list every transition"
+    )
+    args = parser.parse_args(argv)
+    try:
+        result = replay(args.log)
+    except (OSError, ValueError) as exc:
+        print(f"Cannot replay {args.log}: {exc}", file=sys.stderr)
+        return 2
+
+    if args.verbose:
+        for record in result.replayed:
+            print(
+                f"{record.t:10.3f}s  {record.event:<8} "
+                f"{record.remaining:9.3f}s left of {record.period:g}"
+            )
+    speedup = result.virtual_s / result.wall_s if result.wall_s else float("inf")
+    print(
+        f"{result.inputs} inputs, {len(result.replayed)} transitions, "
+        f"{result.frames} frames: {result.virtual_s:.1f}s replayed in "
+        f"{result.wall_s * 1000:.1f} ms ({speedup:,.0f}x)"
+    )
+    index = result.diverged_at
+    if index is None:
+        print("replay matches the recording")
+        return 0
+    recorded = result.recorded[index] if index < len(result.recorded) else None
+    replayed = result.replayed[index] if index < len(result.replayed) else None
+    print(f"diverged at transition {index}:")
+    print(f"  recorded: {recorded}")
+    print(f"  replayed: {replayed}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""Change-driven frame scheduling for the level bar."""
+
+from __future__ import annotations
+
+import math
+
+from lightimer.config import RGB_MAX
+
+# Small overshoot so a wakeup lands just *after* a boundary, not on it
+_EPSILON_S = 1e-6
+
+
+def _until_next_step(position: float, step: float) -> float:
+    """Return the distance from *position* to the next multiple of *step*."""
+    return (math.floor(position / step) + 1) * step - position
+
+
+def next_change_delay(
+    elapsed: float,
+    remaining: float,
+    duration: float,
+    axis: int,
+    fade_steps: int,
+    color_steps: int = RGB_MAX,
+    label_step: float = 1.0,
+) -> float:
+    """Seconds until the next *visible* change of a running timer.
+
+    A frame only needs to be drawn when at least one of these happens:
+
+    * the level bar moves by one fade step (``1 / fade_steps`` of a pixel
+      along an *axis* px long bar),
+    * the red/green gradient moves by one of its *color_steps* per half,
+    * the label ticks over: to the next second, or with a *label_step*
+      of 0.01 to the next hundredth, or
+    * the countdown expires.
+    """
+    if duration <= 0 or remaining < 0:
+        return 0.0
+
+    level_step = duration / (axis * fade_steps)
+    # Colour channels are rounded, so they flip half-way between two units
+    color_step = duration / (2 * color_steps)
+
+    delay = min(
+        _until_next_step(elapsed, level_step),
+        _until_next_step(elapsed + color_step / 2, color_step),
+        # The label truncates, so it (and expiry) flips at whole steps
+        remaining % label_step,
+    )
+    return delay + _EPSILON_S
+
+
+def next_frame_ms(delay: float, min_ms: int) -> int:
+    """Convert *delay* seconds into an ``after()`` interval of at least *min_ms*."""
+    return max(min_ms, math.ceil(delay * 1000))
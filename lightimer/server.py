@@ -0,0 +1,279 @@
+"""Local asyncio server streaming timer state to external displays and tools.
+
+Two listeners run on a background thread next to the Tk mainloop:
+
+* a line-delimited JSON socket: every state change is pushed as one JSON
+  object per line, and clients may send commands such as
+  ``{"cmd": "start"}`` or ``{"cmd": "set", "seconds": 300}``;
+* an HTTP endpoint with ``GET /events`` (server-sent events),
+  ``GET /state`` and ``POST /command`` taking the same JSON commands.
+
+State changes are fanned out from :class:`~lightimer.timer.StaticTimer`
+listener callbacks straight into the writers of all subscribers, so no
+client is polled and nothing runs between changes.  The listener, on the
+timer's own thread, also keeps the latest state for new subscribers and
+``GET /state``: the server thread never reads the timer itself.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+from lightimer.config import SERVER_PORT
+from lightimer.timer import StaticTimer, TimerState
+
+logger = logging.getLogger(__name__)
+
+COMMANDS = frozenset({"start", "stop", "reset", "set"})
+
+# Subscribers that fall this far behind are disconnected
+_MAX_BACKLOG_BYTES = 64 * 1024
+_MAX_BODY_BYTES = 64 * 1024
+
+Dispatch = Callable[[str, "float | None"], None]
+
+
+def state_message(event: str, state: TimerState) -> dict[str, Any]:
+    """Build the message published for *event* with the timer in *state*."""
+    period, remaining, running = state
+    return {
+        "event": event,
+        "period": period,
+        "remaining": round(remaining, 3),
+        "running": running,
+        "time": time.time(),
+    }
+
+
+def parse_command(data: bytes | str) -> tuple[str, float | None]:
+    """Decode a JSON command, raising ``ValueError`` when it is invalid."""
+    try:
+        message = json.loads(data)
+        command = message["cmd"]
+        seconds = message.get("seconds")
+    except (ValueError, KeyError, TypeError, AttributeError):
+        raise ValueError("expected a JSON object with a 'cmd' key") from None
+    if command not in COMMANDS:
+        raise ValueError(f"unknown command {command!r}")
+    if command == "set":
+        if not isinstance(seconds, (int, float)) or seconds <= 0:
+            raise ValueError("'set' needs a positive number of 'seconds'")
+        return command, float(seconds)
+    return command, None
+
+
+class StateServer:
+    """Publish *timer* transitions and accept remote commands.
+
+    Commands are handed to *dispatch* as ``dispatch(command, seconds)`` on
+    the server thread; it is up to the caller to marshal them onto the UI
+    thread.  Port ``0`` picks a free port; the bound ports are available
+    as ``port`` and ``http_port`` once :meth:`start` returns.
+    """
+
+    def __init__(
+        self,
+        timer: StaticTimer,
+        dispatch: Dispatch,
+        host: str = "127.0.0.1",
+        port: int = SERVER_PORT,
+        http_port: int | None = None,
+    ) -> None:
+        self.timer = timer
+        self.dispatch = dispatch
+        self.host = host
+        self.port = port
+        if http_port is None:
+            http_port = port + 1 if port else 0
+        self.http_port = http_port
+        # The timer state and the timer clock reading it was taken at
+        self._state = (timer.state(), timer.clock())
+        self._json_writers: set[asyncio.StreamWriter] = set()
+        self._sse_writers: set[asyncio.StreamWriter] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stopped: asyncio.Event | None = None
+        self._ready = threading.Event()
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(
+            target=self._run, name="lightimer-server", daemon=True
+        )
+
+    # ── lifecycle ─────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        """Bind both listeners on a background thread and subscribe."""
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+        self._state = (self.timer.state(), self.timer.clock())
+        self.timer.listeners.append(self._on_timer_event)
+
+    def close(self) -> None:
+        """Unsubscribe, disconnect all clients and stop the thread."""
+        if self._on_timer_event in self.timer.listeners:
+            self.timer.listeners.remove(self._on_timer_event)
+        if self._loop is not None and self._stopped is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+            self._thread.join(timeout=2.0)
+
+    @property
+    def subscribers(self) -> int:
+        """Number of currently connected subscribers."""
+        return len(self._json_writers) + len(self._sse_writers)
+
+    def publish(self, event: str) -> None:
+        """Push the latest state tagged with *event* to all subscribers.
+
+        Safe to call from any thread.
+        """
+        if self._loop is None:
+            return
+        message = state_message(event, self._current())
+        self._loop.call_soon_threadsafe(self._broadcast, message)
+
+    def _on_timer_event(self, event: str, timer: StaticTimer) -> None:
+        # Runs on the timer's thread, the only one that reads the timer
+        self._state = (timer.state(), timer.clock())
+        self.publish(event)
+
+    def _current(self) -> TimerState:
+        """The latest state, run on to now if the timer is running."""
+        state, taken = self._state
+        if not state.running:
+            return state
+        return state._replace(remaining=state.remaining - (self.timer.clock() - taken))
+
+    # ── server thread ─────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        try:
+            asyncio.run(self._main())
+        except BaseException as exc:  # reported to start()
+            self._error = exc
+            self._ready.set()
+
+    async def _main(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        json_server = await asyncio.start_server(
+            self._serve_json, self.host, self.port
+        )
+        http_server = await asyncio.start_server(
+            self._serve_http, self.host, self.http_port
+        )
+        self.port = json_server.sockets[0].getsockname()[1]
+        self.http_port = http_server.sockets[0].getsockname()[1]
+        logger.info(
+            "state server on %s:%d (http %d)", self.host, self.port, self.http_port
+        )
+        self._ready.set()
+
+        async with json_server, http_server:
+            await self._stopped.wait()
+            for writer in self._json_writers | self._sse_writers:
+                writer.close()
+
+    def _broadcast(self, message: dict[str, Any]) -> None:
+        payload = json.dumps(message, separators=(",", ":"))
+        line = (payload + "\n").encode()
+        event = f"event: {message['event']}\ndata: {payload}\n\n".encode()
+        targets = ((self._json_writers, line), (self._sse_writers, event))
+        for writers, data in targets:
+            for writer in list(writers):
+                if writer.transport.get_write_buffer_size() > _MAX_BACKLOG_BYTES:
+                    logger.warning("dropping slow subscriber")
+                    writers.discard(writer)
+                    writer.close()
+                else:
+                    writer.write(data)
+
+    def _snapshot(self) -> dict[str, Any]:
+        return state_message("state", self._current())
+
+    def _command(self, data: bytes) -> dict[str, Any]:
+        try:
+            command, seconds = parse_command(data)
+        except ValueError as exc:
+            return {"error": str(exc)}
+        self.dispatch(command, seconds)
+        return {"ok": command}
+
+    # ── JSON lines ────────────────────────────────────────────────────
+
+    async def _serve_json(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        writer.write((json.dumps(self._snapshot()) + "\n").encode())
+        self._json_writers.add(writer)
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    writer.write((json.dumps(self._command(line)) + "\n").encode())
+        except ConnectionError:
+            pass
+        finally:
+            self._json_writers.discard(writer)
+            writer.close()
+
+    # ── HTTP / server-sent events ─────────────────────────────────────
+
+    async def _serve_http(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            request = await reader.readline()
+            headers = {}
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            method, path, *_ = request.decode("latin-1").split() or ("", "")
+        except (ConnectionError, ValueError):
+            writer.close()
+            return
+
+        if method == "GET" and path == "/events":
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: text/event-stream\r\n"
+                b"Cache-Control: no-cache\r\n"
+                b"Connection: keep-alive\r\n\r\n"
+            )
+            snapshot = json.dumps(self._snapshot())
+            writer.write(f"event: state\ndata: {snapshot}\n\n".encode())
+            self._sse_writers.add(writer)
+            try:
+                await reader.read()  # until the client goes away
+            except ConnectionError:
+                pass
+            finally:
+                self._sse_writers.discard(writer)
+                writer.close()
+            return
+
+        if method == "GET" and path == "/state":
+            status, body = "200 OK", self._snapshot()
+        elif method == "POST" and path == "/command":
+            try:
+                length = int(headers.get("content-length", "0") or 0)
+                if not 0 <= length <= _MAX_BODY_BYTES:
+                    raise ValueError(f"Content-Length {length} out of range")
+                body = self._command(await reader.readexactly(length))
+            except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+                body = {"error": "invalid Content-Length"}
+            status = "400 Bad Request" if "error" in body else "200 OK"
+        else:
+            status, body = "404 Not Found", {"error": "not found"}
+        data = json.dumps(body).encode()
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode()
+            + data
+        )
+        await writer.drain()
+        writer.close()
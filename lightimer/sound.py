@@ -1,30 +1,168 @@
-"""Platform-aware notification sound playback."""
+"""Platform-aware notification sound playback.
+
+:class:`AudioProcess` plays the sound in a helper process, so decoding
+and mixing never compete with the render loop for the interpreter.
+"""
 
 from __future__ import annotations
 
 import logging
 import sys
 import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable
 
 from lightimer.config import SOUND_PATH
 from lightimer.utils import resource_path
 
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.context import SpawnContext
+
 logger = logging.getLogger(__name__)
 
+_SUPPORTED_PLATFORMS = {"linux", "win32"}
+
 
-def _play_with_pygame(sound_path: str) -> None:
+def _load_with_pygame(sound_path: str) -> Any:
     import pygame
 
     if not pygame.mixer.get_init():
         pygame.mixer.init()
 
-    pygame.mixer.music.load(resource_path(sound_path))
-    pygame.mixer.music.play()
+    # Sound (unlike mixer.music) decodes the whole file up front
+    return pygame.mixer.Sound(resource_path(sound_path))
+
+
+def _spawn_context() -> SpawnContext:
+    # Imported on first use: multiprocessing is slow to import and the
+    # first frame does not need it
+    import multiprocessing
+
+    # A fresh interpreter: forking a process that talks to an X server or
+    # holds Tcl state is unsafe, and the helper needs neither
+    return multiprocessing.get_context("spawn")
+
+
+def _serve_audio(
+    conn: Connection, sound_path: str, loader: Callable[[str], Any]
+) -> None:
+    """Run in the helper process: load the sound, then play it on request.
+
+    Replies on *conn* with ``("ready", error)`` once loaded (*error* is
+    ``None`` or why the sound could not be loaded) and ``("played",
+    requested_at)`` for each request served.
+    """
+    sound = None
+    try:
+        sound = loader(sound_path)
+    except Exception as exc:
+        conn.send(("ready", f"{type(exc).__name__}: {exc}"))
+    else:
+        conn.send(("ready", None))
+    while True:
+        try:
+            requested_at = conn.recv()
+        except (EOFError, OSError):
+            break  # the UI process is gone
+        if requested_at is None:
+            break
+        if sound is not None:
+            sound.play()
+            conn.send(("played", requested_at))
+
+
+class AudioProcess:
+    """Long-lived audio helper process with the notification sound preloaded.
+
+    ``start()`` spawns the process, which imports pygame, initialises the
+    mixer and decodes *sound_path*; ``play()`` writes the request stamp
+    to a pipe and returns.  A thread here only reads the replies, setting
+    ``ready`` and recording the delay between each request and the start
+    of playback in ``latencies`` (seconds).
+
+    *loader* runs in the helper process, so it must be a module-level
+    function; :func:`lightimer.headless.load_silent_sound` needs no sound
+    hardware.
+    """
+
+    def __init__(
+        self,
+        sound_path: str = SOUND_PATH,
+        loader: Callable[[str], Any] = _load_with_pygame,
+    ) -> None:
+        self.sound_path = sound_path
+        self.latencies: list[float] = []
+        self.ready = threading.Event()
+        context = _spawn_context()
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=_serve_audio,
+            args=(child_conn, sound_path, loader),
+            name="lightimer-audio",
+            daemon=True,
+        )
+        self._child_conn = child_conn
+        self._reader = threading.Thread(
+            target=self._read, name="lightimer-audio-replies", daemon=True
+        )
+        self._closed = False
+
+    def start(self) -> None:
+        """Spawn the helper process and begin preloading the sound."""
+        if sys.platform not in _SUPPORTED_PLATFORMS:
+            logger.warning("No sound player available for platform %s", sys.platform)
+            self.ready.set()
+            return
+        self._process.start()
+        # The helper holds its end now; ours must not keep the pipe open
+        self._child_conn.close()
+        self._reader.start()
+
+    def play(self, requested_at: float | None = None) -> None:
+        """Request playback; *requested_at* is a ``time.perf_counter()`` stamp."""
+        if requested_at is None:
+            requested_at = time.perf_counter()
+        if self._closed:
+            return
+        try:
+            self._conn.send(requested_at)
+        except OSError:
+            logger.warning("Audio process is gone; notification not played")
+
+    def close(self) -> None:
+        """Stop the helper after pending requests have been served."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._process.is_alive():
+            try:
+                self._conn.send(None)
+            except OSError:
+                pass
+            self._process.join(timeout=1.0)
+            if self._process.is_alive():
+                self._process.terminate()
+        if self._reader.is_alive():
+            self._reader.join(timeout=1.0)
+        self._child_conn.close()
+        self._conn.close()
 
+    def _read(self) -> None:
+        while True:
+            try:
+                reply, value = self._conn.recv()
+            except (EOFError, OSError):
+                break  # the helper has exited
+            if reply == "ready":
+                if value is not None:
+                    logger.error(
+                        "Cannot load notification sound %s: %s", self.sound_path, value
+                    )
+                self.ready.set()
+            elif reply == "played":
+                latency = time.perf_counter() - value
+                self.latencies.append(latency)
+                logger.debug("timesup sound started after %.1f ms", latency * 1000)
+        self.ready.set()
 
-def play_notification(sound_path: str = SOUND_PATH) -> None:
-    """Play the *timesup* notification sound in a background thread."""
-    if sys.platform not in {"linux", "win32"}:
-        logger.warning("No sound player available for platform %s", sys.platform)
-        return
-    threading.Thread(target=_play_with_pygame, args=(sound_path,), daemon=True).start()
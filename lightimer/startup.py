@@ -0,0 +1,38 @@
+"""Start-up time measurement."""
+
+from __future__ import annotations
+
+import time
+
+
+class StartupProfile:
+    """Wall-time breakdown of the application start-up, phase by phase.
+
+    Each ``mark()`` closes the current phase, which started at the previous
+    mark (or at *start*, ``time.perf_counter()`` by default).
+    """
+
+    def __init__(self, start: float | None = None) -> None:
+        self.start = time.perf_counter() if start is None else start
+        self._last = self.start
+        self.phases: list[tuple[str, float]] = []
+
+    def mark(self, phase: str) -> None:
+        """Record that *phase* has just finished."""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    def total(self) -> float:
+        """Seconds from *start* up to the last mark."""
+        return self._last - self.start
+
+    def report(self) -> str:
+        """Return a human-readable table of all phases in milliseconds."""
+        width = max((len(name) for name, _ in self.phases), default=0)
+        lines = [
+            f"{name:<{width}}  {seconds * 1000:8.1f} ms"
+            for name, seconds in self.phases
+        ]
+        lines.append(f"{'total':<{width}}  {self.total() * 1000:8.1f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,367 @@
+"""Leader/follower synchronization of timers on several machines over UDP.
+
+The leader multicasts a compact binary snapshot of its timer (period,
+remaining, running flag and the leader clock reading it was taken at)
+whenever the timer changes state, and repeats it as a heartbeat once a
+second.  Followers never see per-frame traffic: they let their own
+:class:`~lightimer.timer.StaticTimer` run and only correct it when a
+snapshot says it is off by more than a few milliseconds.
+
+To map leader clock readings onto their own clock, followers probe the
+leader with unicast pings and estimate the clock offset NTP-style from
+the four timestamps of each exchange, keeping the sample with the
+shortest round trip.
+"""
+
+from __future__ import annotations
+
+import abc
+import collections
+import itertools
+import logging
+import random
+import select
+import socket
+import struct
+import threading
+import time
+from typing import Callable
+
+from lightimer.config import (
+    SYNC_GROUP,
+    SYNC_HEARTBEAT_S,
+    SYNC_PING_S,
+    SYNC_PORT,
+    SYNC_TOLERANCE_S,
+)
+from lightimer.timer import Clock, StaticTimer, TimerState
+
+logger = logging.getLogger(__name__)
+
+# ── wire format ───────────────────────────────────────────────────────
+# Every datagram starts with magic, version, kind, session id, sequence.
+
+MAGIC = b"LT"
+VERSION = 1
+
+STATE, PING, PONG = 1, 2, 3
+
+_STATE = struct.Struct("!2sBBII?ddd")  # running, period, remaining, sent
+_PING = struct.Struct("!2sBBIId")  # t0
+_PONG = struct.Struct("!2sBBIIddd")  # t0, t1, t2
+_FORMATS = {STATE: _STATE, PING: _PING, PONG: _PONG}
+
+_MAX_DATAGRAM = 64
+
+Follow = Callable[[TimerState, float], None]
+
+
+def encode(kind: int, session: int, seq: int, *fields: float) -> bytes:
+    """Pack one datagram of *kind*."""
+    return _FORMATS[kind].pack(MAGIC, VERSION, kind, session, seq, *fields)
+
+
+def decode(data: bytes) -> tuple:
+    """Unpack a datagram into ``(kind, session, seq, *fields)``.
+
+    Raises ``ValueError`` for anything that is not a datagram of ours.
+    """
+    if len(data) < 4 or data[:2] != MAGIC or data[2] != VERSION:
+        raise ValueError("not a lightimer sync datagram")
+    fmt = _FORMATS.get(data[3])
+    if fmt is None or len(data) != fmt.size:
+        raise ValueError(f"malformed datagram of kind {data[3]}")
+    return fmt.unpack(data)[2:]
+
+
+def estimate(t0: float, t1: float, t2: float, t3: float) -> tuple[float, float]:
+    """Clock offset and round-trip time of one ping exchange.
+
+    *t0* and *t3* are the follower's clock when the ping left and the
+    pong arrived, *t1* and *t2* the leader's clock when it received the
+    ping and sent the pong.  The offset is what to add to a follower
+    clock reading to get the leader's.
+    """
+    offset = ((t1 - t0) + (t2 - t3)) / 2
+    rtt = (t3 - t0) - (t2 - t1)
+    return offset, rtt
+
+
+def apply_state(
+    timer: StaticTimer,
+    state: TimerState,
+    at: float,
+    tolerance: float = SYNC_TOLERANCE_S,
+) -> bool:
+    """Bring *timer* to *state*, which was current at *timer* clock *at*.
+
+    Nothing is touched while the timer is within *tolerance* seconds of
+    the target, so heartbeats do not disturb a timer that is in sync.
+    Returns ``True`` when the timer was adjusted.
+    """
+    period, remaining, running = state
+    if running:
+        remaining -= timer.clock() - at
+    changed = False
+    if period != timer.state().period:
+        timer.set(period)
+        changed = True
+    if (
+        changed
+        or running != timer.is_running
+        or abs(timer.get_remaining() - remaining) > tolerance
+    ):
+        timer.stop()
+        timer.seek(period - remaining)
+        if running:
+            timer.start()
+        changed = True
+    return changed
+
+
+def _multicast_socket(interface: str, ttl: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+    sock.setsockopt(
+        socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(interface)
+    )
+    return sock
+
+
+class _Node(abc.ABC):
+    """Socket thread shared by leader and follower."""
+
+    def __init__(self, name: str) -> None:
+        self._stopped = threading.Event()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def close(self) -> None:
+        """Stop the socket thread and release the sockets."""
+        self._stopped.set()
+        self._wake_w.send(b"\0")
+        self._thread.join(timeout=2.0)
+        for sock in self._sockets() + [self._wake_r, self._wake_w]:
+            sock.close()
+
+    def _run(self) -> None:
+        sockets = self._sockets() + [self._wake_r]
+        while not self._stopped.is_set():
+            readable, _, _ = select.select(sockets, [], [], self._timeout())
+            for sock in readable:
+                if sock is self._wake_r:
+                    continue
+                try:
+                    data, addr = sock.recvfrom(_MAX_DATAGRAM)
+                    self._receive(sock, decode(data), addr)
+                except (OSError, ValueError) as exc:
+                    logger.debug("sync: dropped datagram: %s", exc)
+            self._tick()
+
+    @abc.abstractmethod
+    def _sockets(self) -> list[socket.socket]:
+        ...
+
+    @abc.abstractmethod
+    def _timeout(self) -> float | None:
+        ...
+
+    @abc.abstractmethod
+    def _receive(self, sock: socket.socket, message: tuple, addr: tuple) -> None:
+        ...
+
+    @abc.abstractmethod
+    def _tick(self) -> None:
+        ...
+
+
+class SyncLeader(_Node):
+    """Multicast the state of *timer* to followers and answer their pings.
+
+    Snapshots go out on every timer transition and every *heartbeat*
+    seconds, so followers that join late or miss a datagram catch up.
+    The leader must be created and started on the thread that drives
+    *timer*: that thread takes the snapshots, and the sync thread only
+    sends the latest one on.
+    """
+
+    def __init__(
+        self,
+        timer: StaticTimer,
+        group: str = SYNC_GROUP,
+        port: int = SYNC_PORT,
+        interface: str = "0.0.0.0",
+        heartbeat: float = SYNC_HEARTBEAT_S,
+        ttl: int = 1,
+    ) -> None:
+        super().__init__("lightimer-sync-leader")
+        self.timer = timer
+        self.clock = timer.clock
+        self.group = (group, port)
+        self.heartbeat = heartbeat
+        self.session = random.getrandbits(32)
+        self._seq = itertools.count(1)
+        self._lock = threading.Lock()
+        self._next_beat = 0.0
+        self._snapshot = (timer.state(), self.clock())
+        self._sock = _multicast_socket(interface, ttl)
+        self._sock.bind((interface, 0))
+
+    def start(self) -> None:
+        """Send the first snapshot and follow *timer* from now on."""
+        self.timer.listeners.append(self._on_timer_event)
+        self._snapshot = (self.timer.state(), self.clock())
+        self.publish()
+        self._thread.start()
+
+    def close(self) -> None:
+        if self._on_timer_event in self.timer.listeners:
+            self.timer.listeners.remove(self._on_timer_event)
+        super().close()
+
+    def publish(self) -> None:
+        """Multicast the last timer snapshot.  Safe to call from any thread."""
+        with self._lock:
+            (period, remaining, running), taken = self._snapshot
+            sent = self.clock()
+            if running:
+                remaining -= sent - taken
+            datagram = encode(
+                STATE, self.session, next(self._seq), running, period, remaining, sent
+            )
+            self._next_beat = sent + self.heartbeat
+            try:
+                self._sock.sendto(datagram, self.group)
+            except OSError as exc:
+                logger.warning("sync: cannot send state: %s", exc)
+
+    def _on_timer_event(self, event: str, timer: StaticTimer) -> None:
+        # Runs on the timer's thread, the only one that reads the timer
+        self._snapshot = (timer.state(), self.clock())
+        self.publish()
+
+    # ── socket thread ─────────────────────────────────────────────────
+
+    def _sockets(self) -> list[socket.socket]:
+        return [self._sock]
+
+    def _timeout(self) -> float:
+        return max(0.0, self._next_beat - self.clock())
+
+    def _receive(self, sock: socket.socket, message: tuple, addr: tuple) -> None:
+        t1 = self.clock()
+        kind, session, seq, *fields = message
+        if kind == PING:
+            t2 = self.clock()
+            sock.sendto(encode(PONG, self.session, seq, fields[0], t1, t2), addr)
+
+    def _tick(self) -> None:
+        if self.clock() >= self._next_beat:
+            self.publish()
+
+
+class SyncFollower(_Node):
+    """Receive leader snapshots and hand them to *follow*.
+
+    *follow* is called on the sync thread as ``follow(state, at)`` where
+    *at* is the reading of *clock* at which *state* was current on the
+    leader; :func:`apply_state` turns that into timer adjustments.
+    *clock* must be the clock of the timer being driven.
+    """
+
+    def __init__(
+        self,
+        follow: Follow,
+        clock: Clock = time.perf_counter,
+        group: str = SYNC_GROUP,
+        port: int = SYNC_PORT,
+        interface: str = "0.0.0.0",
+        ping_interval: float = SYNC_PING_S,
+        samples: int = 8,
+    ) -> None:
+        super().__init__("lightimer-sync-follower")
+        self.follow = follow
+        self.clock = clock
+        self.ping_interval = ping_interval
+        self.offset: float | None = None  # leader clock minus ours
+        self.rtt: float | None = None
+        self.leader: tuple[str, int] | None = None
+        self._session: int | None = None
+        self._last_seq = 0
+        self._samples: collections.deque[tuple[float, float]] = collections.deque(
+            maxlen=samples
+        )
+        self._pings = itertools.count(1)
+        self._next_ping = 0.0
+
+        self._group_sock = socket.socket(
+            socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP
+        )
+        self._group_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._group_sock.bind(("", port))
+        membership = socket.inet_aton(group) + socket.inet_aton(interface)
+        self._group_sock.setsockopt(
+            socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership
+        )
+        # Pongs come back unicast, so each follower needs a port of its own
+        self._ping_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._ping_sock.bind((interface, 0))
+
+    def start(self) -> None:
+        """Start listening for the leader."""
+        self._thread.start()
+
+    # ── socket thread ─────────────────────────────────────────────────
+
+    def _sockets(self) -> list[socket.socket]:
+        return [self._group_sock, self._ping_sock]
+
+    def _timeout(self) -> float | None:
+        if self.leader is None:
+            return None
+        return max(0.0, self._next_ping - self.clock())
+
+    def _receive(self, sock: socket.socket, message: tuple, addr: tuple) -> None:
+        now = self.clock()
+        kind, session, seq, *fields = message
+        if kind == STATE:
+            self._on_state(session, seq, fields, addr, now)
+        elif kind == PONG and session == self._session:
+            offset, rtt = estimate(*fields, now)
+            self._samples.append((rtt, offset))
+            # The shortest round trip has the least asymmetric delay
+            self.rtt, self.offset = min(self._samples)
+
+    def _on_state(
+        self, session: int, seq: int, fields: list, addr: tuple, now: float
+    ) -> None:
+        if session != self._session:
+            logger.info("sync: following leader at %s:%d", *addr)
+            self._session = session
+            self._last_seq = 0
+            self._samples.clear()
+            self.offset = self.rtt = None
+            self.leader = addr
+            self._next_ping = now
+        elif seq <= self._last_seq:
+            return  # reordered or duplicated
+        self._last_seq = seq
+
+        running, period, remaining, sent = fields
+        # Until the first pong, assume the snapshot arrived instantly
+        offset = sent - now if self.offset is None else self.offset
+        self.follow(TimerState(period, remaining, running), sent - offset)
+
+    def _tick(self) -> None:
+        if self.leader is None or self.clock() < self._next_ping:
+            return
+        t0 = self.clock()
+        datagram = encode(PING, self._session, next(self._pings), t0)
+        try:
+            self._ping_sock.sendto(datagram, self.leader)
+        except OSError as exc:
+            logger.warning("sync: cannot ping leader: %s", exc)
+        # Probe quickly until the sample window is full, then settle down
+        full = len(self._samples) == self._samples.maxlen
+        self._next_ping = t0 + (self.ping_interval if full else 0.05)
@@ -4,18 +4,56 @@ from __future__ import annotations
 
 import logging
 import time
+from typing import Callable, NamedTuple
 
 logger = logging.getLogger(__name__)
 
+# A clock returns the current time in seconds from an arbitrary epoch
+Clock = Callable[[], float]
+
+# Two-digit strings for the label: a lookup instead of a format per frame
+_TWO_DIGITS = tuple(f"{n:02d}" for n in range(100))
+_FRACTIONS = tuple("." + digits for digits in _TWO_DIGITS)
+
+
+class TimerState(NamedTuple):
+    """Snapshot of a :class:`StaticTimer`."""
+
+    period: float
+    remaining: float
+    running: bool
+
+
+class VirtualClock:
+    """A clock that only moves when told to — for tests and simulations."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock *seconds* forward."""
+        self.now += seconds
+
 
 class StaticTimer:
-    """A simple wall-clock countdown timer.
+    """A simple monotonic countdown timer.
 
     The timer measures elapsed/remaining time by capturing a timestamp at
     ``start()`` and computing deltas on the fly — no background thread needed.
+    Time is read from *clock*, a monotonic high-resolution counter by
+    default, so wall-clock adjustments (NTP steps, DST) cannot affect it.
+
+    Callables in ``listeners`` are called as ``listener(event, timer)``
+    after every state transition, *event* being one of ``"set"``,
+    ``"reset"``, ``"start"``, ``"stop"``, ``"seek"`` or ``"timesup"``.
     """
 
-    def __init__(self, period: float) -> None:
+    def __init__(self, period: float, clock: Clock = time.perf_counter) -> None:
+        self.clock = clock
+        self.listeners: list[Callable[[str, StaticTimer], None]] = []
         self.set(period)
 
     # ── public API ────────────────────────────────────────────────────
@@ -23,25 +61,56 @@ class StaticTimer:
     def set(self, period: float) -> None:
         """Set a new countdown *period* (seconds) and reset."""
         self._period: float = period
-        self.reset()
+        self._rewind()
+        self._emit("set")
 
     def reset(self) -> None:
         """Reset the timer to the full period without starting it."""
-        self._remaining: float = self._period
-        self._timestamp: float = 0.0
-        self.is_running: bool = False
+        self._rewind()
+        self._emit("reset")
 
     def start(self) -> None:
         """Start (or resume) the countdown."""
         logger.debug("timer start: %.2fs remaining", self.get_remaining())
-        self._timestamp = time.time()
+        self._timestamp = self.clock()
         self.is_running = True
+        self._emit("start")
 
     def stop(self) -> None:
         """Pause the countdown, preserving the remaining time."""
         logger.debug("timer stop")
+        was_running = self.is_running
         self._remaining = self.get_remaining()
         self.is_running = False
+        if was_running:
+            self._emit("stop")
+
+    def expire(self) -> None:
+        """Stop the countdown because it has run out."""
+        logger.debug("timer expired")
+        self._remaining = self.get_remaining()
+        self.is_running = False
+        self._emit("timesup")
+
+    def seek(self, elapsed: float) -> None:
+        """Jump to *elapsed* seconds into the period, keeping the run state."""
+        self._remaining = self._period - elapsed
+        if self.is_running:
+            self._timestamp = self.clock()
+        self._emit("seek")
+
+    def state(self) -> TimerState:
+        """Return a snapshot of the current state."""
+        return TimerState(self._period, self.get_remaining(), self.is_running)
+
+    def _rewind(self) -> None:
+        self._remaining: float = self._period
+        self._timestamp: float = 0.0
+        self.is_running: bool = False
+
+    def _emit(self, event: str) -> None:
+        for listener in self.listeners:
+            listener(event, self)
 
     # ── queries ───────────────────────────────────────────────────────
 
@@ -49,12 +118,18 @@ class StaticTimer:
         """Seconds remaining (keeps ticking while running)."""
         if not self.is_running:
             return self._remaining
-        return self._timestamp + self._remaining - time.time()
+        return self._timestamp + self._remaining - self.clock()
 
     def get_elapsed(self) -> float:
         """Seconds elapsed since the timer was (re)set."""
         return self._period - self.get_remaining()
 
+    def deadline(self) -> float | None:
+        """Clock time at which the countdown reaches zero, if it is running."""
+        if not self.is_running:
+            return None
+        return self._timestamp + self._remaining
+
     def is_time_up(self) -> bool:
         """Return ``True`` when the countdown has expired."""
         return self.get_remaining() < 0
@@ -65,4 +140,16 @@ class StaticTimer:
     def format(remaining: float) -> str:
         """Format *remaining* seconds as ``MM:SS``."""
         minutes, seconds = divmod(int(remaining), 60)
+        if 0 <= minutes < 100:
+            return _TWO_DIGITS[minutes] + ":" + _TWO_DIGITS[seconds]
         return f"{minutes:02d}:{seconds:02d}"
+
+    @staticmethod
+    def format_centiseconds(remaining: float) -> tuple[str, str]:
+        """Format *remaining* seconds as ``MM:SS`` and ``.cc``.
+
+        The two parts are drawn as separate items, so a frame that only
+        moves the hundredths leaves the ``MM:SS`` text alone.
+        """
+        seconds, centis = divmod(int(max(remaining, 0.0) * 100), 100)
+        return StaticTimer.format(seconds), _FRACTIONS[centis]
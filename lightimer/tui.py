@@ -0,0 +1,458 @@
+"""Terminal front end: the level bar and label drawn with curses.
+
+For venues that drive a console display from a headless box over SSH.
+Neither tkinter nor pygame is imported: without ``--sound-file`` the
+time-up notification is the terminal bell.
+
+The bar drains the way it does in the Tk window, one eighth of a cell
+at a time: the cell at its edge shows a block character covering the
+elapsed fraction, much like the fading lead line of the Tk bar.  Each
+frame is composed in memory and compared with the previous one, and only
+the cells that differ are written to the terminal.
+"""
+
+from __future__ import annotations
+
+import curses
+import logging
+import os
+import time
+from typing import Any, Callable
+
+from lightimer import entry as digit_entry
+from lightimer.colors import ColorTable
+from lightimer.config import (
+    BG_COLOR,
+    INIT_DURATION_S,
+    MAX_FPS,
+    Orientation,
+    TIME_COLOR,
+)
+from lightimer.scheduler import next_change_delay, next_frame_ms
+from lightimer.timer import Clock, StaticTimer
+
+logger = logging.getLogger(__name__)
+
+# Block characters covering the left / lower k eighths of a cell
+LEFT_EIGHTHS = " ▏▎▍▌▋▊▉"
+LOWER_EIGHTHS = " ▁▂▃▄▅▆▇█"
+EIGHTHS = 8
+
+TIMESUP_COLOR = "#ff0000"
+STATUS = (
+    " Lightimer  space start/stop · enter reset · 0-9 mm:ss · t turn · l lean"
+    " · esc quit"
+)
+
+_ESCAPE = 27
+_ENTER_KEYS = frozenset({10, 13, curses.KEY_ENTER})
+
+# A row as its characters and the curses attribute of each cell
+Row = tuple[str, tuple[int, ...]]
+
+
+# ── colours ───────────────────────────────────────────────────────────
+
+
+def _rgb(color: str) -> tuple[int, int, int]:
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+
+
+def terminal_color(color: str, colors: int) -> int:
+    """The terminal colour number closest to ``#rrggbb`` *color*.
+
+    With 256 colours that is the nearest entry of the xterm 6×6×6 cube,
+    otherwise one of the eight basic colours.
+    """
+    r, g, b = _rgb(color)
+    if colors >= 256:
+        if r == g == b and 0 < r < 255:
+            return 232 + min(23, r * 24 // 256)  # grey ramp
+        r, g, b = (round(c * 5 / 255) for c in (r, g, b))
+        return 16 + 36 * r + 6 * g + b
+    if r == g == b:
+        return curses.COLOR_BLACK if r < 64 else curses.COLOR_WHITE
+    if g > 2 * r:
+        return curses.COLOR_GREEN
+    if r > 2 * g:
+        return curses.COLOR_RED
+    return curses.COLOR_YELLOW
+
+
+class Palette:
+    """Curses attributes for ``(foreground, background)`` colour pairs.
+
+    Colour pairs are allocated on first use, one per pair of terminal
+    colours: the many gradient shades that look the same on the terminal
+    share an attribute, so a frame only rewrites cells whose colour
+    visibly changed.  Terminals without colour
+    get reverse video for any background other than black, which still
+    shows the bar and its sub-cell edge.
+    """
+
+    def __init__(
+        self,
+        colors: int,
+        max_pairs: int,
+        init_pair: Callable[[int, int, int], None],
+        color_pair: Callable[[int], int],
+        reverse: int = 0,
+    ) -> None:
+        self.colors = colors
+        self.max_pairs = max_pairs
+        self._init_pair = init_pair
+        self._color_pair = color_pair
+        self._reverse = reverse
+        self._attrs: dict[tuple[str, str], int] = {}
+        self._pairs: dict[tuple[int, int], int] = {}
+
+    @classmethod
+    def from_curses(cls) -> Palette:
+        """The palette of the terminal curses was initialised on."""
+        colors = curses.COLORS if curses.has_colors() else 0
+        if colors:
+            curses.start_color()
+        return cls(
+            colors,
+            curses.COLOR_PAIRS if colors else 0,
+            curses.init_pair,
+            curses.color_pair,
+            curses.A_REVERSE,
+        )
+
+    def attr(self, fg: str, bg: str) -> int:
+        key = (fg, bg)
+        attr = self._attrs.get(key)
+        if attr is None:
+            attr = self._attrs[key] = self._allocate(fg, bg)
+        return attr
+
+    def _allocate(self, fg: str, bg: str) -> int:
+        if not self.colors:
+            return 0 if bg == BG_COLOR else self._reverse
+        key = (terminal_color(fg, self.colors), terminal_color(bg, self.colors))
+        attr = self._pairs.get(key)
+        if attr is None:
+            pair = len(self._pairs) + 1
+            if pair >= self.max_pairs:
+                return 0
+            self._init_pair(pair, *key)
+            attr = self._pairs[key] = self._color_pair(pair)
+        return attr
+
+
+# ── rendering ─────────────────────────────────────────────────────────
+
+
+class CellRenderer:
+    """Write frames to a curses *window*, touching only changed cells.
+
+    ``written`` counts the cells sent to the terminal and ``skipped`` the
+    unchanged ones left alone.
+    """
+
+    def __init__(self, window: Any) -> None:
+        self.window = window
+        self._rows: list[Row] = []
+        self.written = 0
+        self.skipped = 0
+
+    def draw(self, rows: list[Row]) -> None:
+        """Show *rows*, writing runs of changed cells with the same attribute."""
+        previous = self._rows
+        changed = False
+        for y, row in enumerate(rows):
+            old = previous[y] if y < len(previous) else None
+            if old is row or old == row:
+                self.skipped += len(row[0])
+                continue
+            changed = True
+            self._draw_row(y, row, old)
+        self._rows = rows
+        if changed:
+            self.window.refresh()
+
+    def invalidate(self) -> None:
+        """Forget what is on screen, e.g. after the terminal was resized."""
+        self._rows = []
+        self.window.erase()
+
+    def _draw_row(self, y: int, row: Row, old: Row | None) -> None:
+        chars, attrs = row
+        old_chars, old_attrs = old if old is not None else ("", ())
+        n = len(chars)
+        x = 0
+        old_n = len(old_chars)
+
+        def same(i: int) -> bool:
+            return i < old_n and chars[i] == old_chars[i] and attrs[i] == old_attrs[i]
+
+        while x < n:
+            if same(x):
+                self.skipped += 1
+                x += 1
+                continue
+            # Extend the run while cells change and share the attribute
+            end = x + 1
+            while end < n and attrs[end] == attrs[x] and not same(end):
+                end += 1
+            try:
+                self.window.addstr(y, x, chars[x:end], attrs[x])
+            except curses.error:
+                pass  # writing the bottom-right cell moves the cursor off-screen
+            self.written += end - x
+            x = end
+
+
+# ── application ───────────────────────────────────────────────────────
+
+
+class TerminalApp:
+    """The countdown in a terminal, with the key bindings of the Tk app.
+
+    :meth:`run` takes over the terminal until the timer is closed with
+    Escape.  :meth:`open` and :meth:`mainloop` do the same on a given
+    curses-like *screen* and :class:`Palette`, which is how the tests
+    drive it.
+    """
+
+    def __init__(
+        self,
+        *,
+        lean: bool = False,
+        sound_file: str | None = None,
+        adaptive: bool = True,
+        max_fps: int = MAX_FPS,
+        clock: Clock = time.perf_counter,
+    ) -> None:
+        self.lean = lean
+        self.adaptive = adaptive
+        self._frame_ms = max(1, 1000 // max_fps)
+        self.orientation = Orientation.HORIZONTAL
+        self.entry = digit_entry.Entry(INIT_DURATION_S)
+        self.timer = StaticTimer(self.duration, clock=clock)
+        self.colors = ColorTable()
+        self.closed = False
+        self.bell: Callable[[], None] = curses.beep
+
+        # Only load an audio player (and pygame) for an explicit sound
+        self.audio = None
+        if sound_file is not None:
+            from lightimer.sound import AudioProcess
+
+            self.audio = AudioProcess(sound_file)
+
+        self.screen: Any = None
+        self.palette: Palette | None = None
+        self.renderer: CellRenderer | None = None
+        self.size = (0, 0)
+
+    @property
+    def duration(self) -> float:
+        return self.entry.duration
+
+    def set_duration(self, seconds: float) -> None:
+        """Stop the timer and make *seconds* the new countdown duration."""
+        self.timer.stop()
+        self.entry = digit_entry.Entry(seconds)
+        self.timer.set(seconds)
+
+    # ── terminal ──────────────────────────────────────────────────────
+
+    def run(self) -> None:
+        """Take over the terminal and run until closed."""
+        os.environ.setdefault("ESCDELAY", "25")  # Escape quits without a lag
+        curses.wrapper(self._run)
+
+    def _run(self, screen: Any) -> None:
+        try:
+            curses.curs_set(0)
+        except curses.error:
+            pass  # the terminal cannot hide its cursor
+        self.open(screen, Palette.from_curses())
+        if self.audio is not None:
+            self.audio.start()
+        self.mainloop()
+
+    def open(self, screen: Any, palette: Palette) -> None:
+        """Draw on *screen* with the colours of *palette*."""
+        self.screen = screen
+        self.palette = palette
+        self.renderer = CellRenderer(screen)
+        screen.keypad(True)
+        self._resize()
+
+    def mainloop(self) -> None:
+        """Handle keys and draw frames until the timer is closed."""
+        self.redraw()
+        while not self.closed:
+            self.screen.timeout(self._next_frame_ms() if self.timer.is_running else -1)
+            key = self.screen.getch()
+            # Keys typed in a burst are all handled before the next frame
+            self.screen.timeout(0)
+            while key != -1 and not self.closed:
+                self.handle_key(key)
+                key = self.screen.getch()
+            if self.closed:
+                break
+            if self.timer.is_running and self.timer.is_time_up():
+                self.timer.expire()
+                self._notify_timesup()
+            self.redraw()
+        if self.audio is not None:
+            self.audio.close()
+
+    def _resize(self) -> None:
+        self.size = self.screen.getmaxyx()[::-1]
+        self.renderer.invalidate()
+
+    # ── keys ──────────────────────────────────────────────────────────
+
+    def handle_key(self, key: int) -> None:
+        """Act on one key code as returned by ``getch()``."""
+        if key == ord(" "):
+            self._on_click()
+        elif key in _ENTER_KEYS:
+            self._on_double_click()
+        elif key == ord("t"):
+            self.orientation = (
+                Orientation.VERTICAL
+                if self.orientation is Orientation.HORIZONTAL
+                else Orientation.HORIZONTAL
+            )
+        elif key == ord("l"):
+            self.lean = not self.lean
+        elif ord("0") <= key <= ord("9"):
+            self._on_change_time(key - ord("0"))
+        elif key == _ESCAPE:
+            self.closed = True
+        elif key == curses.KEY_RESIZE:
+            self._resize()
+        else:
+            logger.info("Help requested (key %d)", key)
+
+    def _on_click(self) -> None:
+        if self.timer.is_time_up():
+            return
+        if self.timer.is_running:
+            self.timer.stop()
+        else:
+            self.entry = digit_entry.clear(self.entry)
+            self.timer.start()
+
+    def _on_double_click(self) -> None:
+        if self.duration == 0:
+            return
+        self.timer.stop()
+        self.timer.reset()
+        self.entry = digit_entry.clear(self.entry)
+
+    def _on_change_time(self, digit: int) -> None:
+        if self.timer.is_running:
+            self.timer.stop()
+        if not self.entry.typing:
+            self.timer.reset()  # a new entry starts from the full bar
+        self.entry = digit_entry.press(self.entry, digit)
+        self.timer.set(self.duration)
+
+    def _notify_timesup(self) -> None:
+        if self.audio is not None:
+            self.audio.play(time.perf_counter())
+        else:
+            self.bell()
+
+    # ── frame scheduling ──────────────────────────────────────────────
+
+    def _next_frame_ms(self) -> int:
+        """Milliseconds until the next visible change of the running timer."""
+        if not self.adaptive:
+            return self._frame_ms
+        width, height = self._bar_size()
+        cells = width if self.orientation is Orientation.HORIZONTAL else height
+        delay = next_change_delay(
+            self.timer.get_elapsed(),
+            self.timer.get_remaining(),
+            self.duration,
+            cells,
+            EIGHTHS,
+            self.colors.steps,
+        )
+        return next_frame_ms(delay, self._frame_ms)
+
+    # ── drawing ───────────────────────────────────────────────────────
+
+    def _bar_size(self) -> tuple[int, int]:
+        width, height = self.size
+        return width, height if self.lean else max(1, height - 1)
+
+    def redraw(self) -> None:
+        """Compose the frame and write the cells that changed."""
+        self.renderer.draw(self.frame())
+
+    def frame(self) -> list[Row]:
+        """The screen as rows of characters and attributes."""
+        width, height = self._bar_size()
+        if width <= 0:
+            return []
+        remaining = self.timer.get_remaining()
+        time_up = self.duration == 0 or self.timer.is_time_up()
+        if time_up:
+            color = BG_COLOR
+            level = 0.0
+        else:
+            elapsed = self.timer.get_elapsed()
+            index = self.colors.index(elapsed, remaining, self.duration / 2)
+            color = self.colors.color(index)
+            axis = width if self.orientation is Orientation.HORIZONTAL else height
+            level = elapsed * axis / self.duration
+
+        rows = self._bar_rows(width, height, level, color)
+        if self.entry.digits[0] != digit_entry.BLANK:
+            label = self.entry.label
+        else:
+            label = self.timer.format(max(0.0, remaining))
+        y = height // 2
+        fg = TIMESUP_COLOR if time_up else TIME_COLOR
+        rows[y] = self._with_label(rows[y], label, fg, color)
+        if not self.lean:
+            status = STATUS[:width].ljust(width)
+            rows.append((status, (self.palette.attr(TIME_COLOR, BG_COLOR),) * width))
+        return rows
+
+    def _bar_rows(self, width: int, height: int, level: float, color: str) -> list[Row]:
+        attr = self.palette.attr
+        black = attr(BG_COLOR, BG_COLOR)
+        lit = attr(BG_COLOR, color)
+        cell = int(level)
+        eighths = int((level - cell) * EIGHTHS)
+        if self.orientation is Orientation.HORIZONTAL:
+            # The elapsed part is black: the edge cell shows it as a black
+            # left block on the bar colour
+            edge = LEFT_EIGHTHS[eighths] if cell < width else ""
+            chars = " " * cell + edge + " " * (width - cell - 1)
+            attrs = (black,) * cell + (lit,) * (width - cell)
+            row = (chars[:width], attrs[:width])
+            return [row] * height
+
+        blank_row = (" " * width, (black,) * width)
+        lit_row = (" " * width, (lit,) * width)
+        rows = [blank_row] * min(cell, height) + [lit_row] * max(0, height - cell)
+        if cell < height:
+            # The lit part of the edge row is a lower block in bar colour
+            rows[cell] = (
+                LOWER_EIGHTHS[EIGHTHS - eighths] * width,
+                (attr(color, BG_COLOR),) * width,
+            )
+        return rows
+
+    def _with_label(self, row: Row, label: str, fg: str, color: str) -> Row:
+        """*row* with *label* centred on it, over the bar where it is lit."""
+        chars, attrs = row
+        x = max(0, (len(chars) - len(label)) // 2)
+        label = label[: len(chars) - x]
+        end = x + len(label)
+        lit = self.palette.attr(BG_COLOR, color)
+        on_bar = self.palette.attr(fg, color)
+        on_black = self.palette.attr(fg, BG_COLOR)
+        label_attrs = tuple(on_bar if a == lit else on_black for a in attrs[x:end])
+        return chars[:x] + label + chars[end:], attrs[:x] + label_attrs + attrs[end:]
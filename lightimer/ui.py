@@ -3,114 +3,146 @@
 from __future__ import annotations
 
 import logging
+import queue
 import sys
+import time
 import tkinter as tk
+from typing import TYPE_CHECKING, Any, Callable
 
+from lightimer import entry as digit_entry
+from lightimer.colors import ColorTable
 from lightimer.config import (
     BG_COLOR,
-    HEIGHT_H,
-    HEIGHT_V,
+    CENTISECONDS_BELOW_S,
+    FADE_STEPS,
     ICON_PATH,
     INIT_DURATION_S,
     LEVEL_COLOR,
-    LIN_GAP,
+    MAX_FPS,
     Orientation,
-    REFRESH_CYCLE_MS,
-    RGB_MAX,
+    POST_POLL_MS,
+    SOUND_PATH,
     TIME_COLOR,
-    TIME_FONT,
-    WIDTH_H,
-    WIDTH_V,
-    WIN_GAP,
     WIN_OFFSET_X,
     WIN_OFFSET_Y,
 )
-from lightimer.sound import play_notification
-from lightimer.timer import StaticTimer
-from lightimer.utils import interpolate_color, resource_path
+from lightimer.glyphs import GlyphCache, glyph_height, layout
+from lightimer.layout import base_size, compute_layout, dpi_scale
+from lightimer.render import CanvasRenderer
+from lightimer.scheduler import next_change_delay, next_frame_ms
+from lightimer.timer import Clock, StaticTimer, TimerState
+from lightimer.utils import resource_path
+
+if TYPE_CHECKING:
+    # Only for annotations: the first frame does not need these modules
+    from lightimer.agenda import Agenda, Slot
+    from lightimer.instance import Launch
+    from lightimer.journal import Journal, JournalEntry
+    from lightimer.profiler import FrameProfiler
+    from lightimer.recorder import Recorder
 
 logger = logging.getLogger(__name__)
 
-# ── Orientation look-up tables ────────────────────────────────────────
-_DIMENSIONS: dict[Orientation, tuple[int, int]] = {
-    Orientation.VERTICAL: (WIDTH_V, HEIGHT_V),
-    Orientation.HORIZONTAL: (WIDTH_H, HEIGHT_H),
-}
 
-_LEVEL_AXIS: dict[Orientation, int] = {
-    Orientation.VERTICAL: HEIGHT_V,
-    Orientation.HORIZONTAL: WIDTH_H,
-}
+class TimerWindow:
+    """One window showing the timer: its canvas, items and placement.
 
-_TEXT_GAP: dict[str, int] = {
-    "linux": LIN_GAP,
-    "win32": WIN_GAP,
-}
+    All windows of an app show the same countdown; each has its own
+    orientation, position, size and lean mode.  Window sizes start at the
+    configured defaults times the display *scale*; the window can be
+    resized freely and everything drawn follows its :attr:`layout`.
 
-# Number of digits in the MM:SS entry (0‥3)
-_NUM_DIGITS = 4
+    A *fullscreen* window is a projector view: the bar covers the whole
+    screen and the label is composed of digit sprites pre-rendered into
+    images from *image_factory* (see :mod:`lightimer.glyphs`), so a label
+    change swaps images instead of rasterising a huge font.
 
-
-class LightimerApp(tk.Frame):
-    """Main application frame for the Lightimer countdown UI."""
-
-    # ── construction ──────────────────────────────────────────────────
+    With *centiseconds*, the hundredths shown in the last minute are a
+    separate text item in a fixed-width font at a fixed anchor, so a
+    frame that changes only them re-lays out three characters and leaves
+    the ``MM:SS`` item alone.  The projector view sizes its digits for
+    ``MM:SS.cc`` from the start.
+    """
 
     def __init__(
         self,
-        master: tk.Tk,
+        master: tk.Misc,
         *,
-        lean: bool = False,
-        sound_file: str | None = None,
+        lean: bool,
+        canvas_factory: Callable[..., Any],
+        index: int = 0,
+        label: str = "",
+        fullscreen: bool = False,
+        image_factory: Callable[..., Any] = tk.PhotoImage,
+        scale: float = 1.0,
+        centiseconds: bool = False,
     ) -> None:
-        super().__init__(master)
-        self.master: tk.Tk = master
+        self.master = master
         self.lean = lean
-        self.sound_file = sound_file
-
-        self._configure_window()
-
-        self.duration: float = INIT_DURATION_S
-        self._pre_dur: float = self.duration
-        self.timer = StaticTimer(self.duration)
-
+        self.fullscreen = fullscreen
+        self.centiseconds = centiseconds
+        self.scale = scale
         self.orientation = Orientation.VERTICAL
+        self._offset_x = self._offset_y = 0
+        # Input applied once per frame: drag target, new canvas size
+        self._drag_to: tuple[int, int] | None = None
+        self._resize_to: tuple[int, int] | None = None
 
-        # Window positions per orientation (width, height, x, y)
+        # Window sizes and positions per orientation (width, height, x, y);
+        # further windows start next to / above the first one
         sw = self.master.winfo_screenwidth()
         sh = self.master.winfo_screenheight()
+        self._screen = (sw, sh)
+        vw, vh = base_size(Orientation.VERTICAL, scale)
+        hw, hh = base_size(Orientation.HORIZONTAL, scale)
+        offset_x, offset_y = round(WIN_OFFSET_X * scale), round(WIN_OFFSET_Y * scale)
         self._win_pos: dict[Orientation, list[int]] = {
             Orientation.VERTICAL: [
-                WIDTH_V,
-                HEIGHT_V,
-                sw - (WIDTH_V + WIN_OFFSET_X),
-                sh // 2 - HEIGHT_V // 2,
+                vw,
+                vh,
+                sw - (index + 1) * (vw + offset_x),
+                sh // 2 - vh // 2,
             ],
             Orientation.HORIZONTAL: [
-                WIDTH_H,
-                HEIGHT_H,
-                sw - 3 * WIDTH_H // 2,
-                sh - (HEIGHT_H + WIN_OFFSET_Y),
+                hw,
+                hh,
+                sw - 3 * hw // 2,
+                sh - (index + 1) * (hh + offset_y),
             ],
         }
-        self._apply_geometry()
-        self.pack()
+        self.layout = compute_layout(*self.size, self.orientation, scale)
 
-        # Digit-entry state
-        self._cstate: int = 0
-        self._cdigits: list[str | int] = ["-", "-", "-", "-"]
+        # Projector label: sprites, the text they show and its colour
+        self.glyphs = GlyphCache(image_factory)
+        self.digits: list[int] = []
+        self.label = label
+        self.fraction = ""  # the ``.cc`` shown after the label, if any
+        self._label_fill = TIME_COLOR
 
-        self._build_canvas()
-        self._bind_events()
-        self.redraw_canvas()
+        self._configure_window()
+        self.apply_geometry()
+        self._build_canvas(canvas_factory, label)
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Width and height of the canvas."""
+        if self.fullscreen:
+            return self._screen
+        w, h = self._win_pos[self.orientation][:2]
+        return w, h
+
+    @property
+    def axis(self) -> int:
+        """Length of the canvas along which the bar moves."""
+        return self.layout.axis
 
     # ── window helpers ────────────────────────────────────────────────
 
     def _configure_window(self) -> None:
         self.master.title("Lightimer")
-        icon = tk.PhotoImage(file=resource_path(ICON_PATH))
-        self._icon_ref = icon  # prevent GC
-        self.master.call("wm", "iconphoto", self.master._w, icon)
+        if self.fullscreen:
+            self.master.attributes("-fullscreen", True)
+            return
         self.master.attributes("-topmost", True)
 
         if self.lean:
@@ -122,14 +154,27 @@ class LightimerApp(tk.Frame):
             if sys.platform == "linux":
                 self.master.attributes("-type", "dialog")
 
-    def _apply_geometry(self) -> None:
+    def apply_geometry(self) -> None:
+        if self.fullscreen:
+            return
         d = self._win_pos[self.orientation]
         self.master.geometry(f"{d[0]}x{d[1]}+{d[2]}+{d[3]}")
 
+    def placement(self) -> tuple[Orientation, int, int]:
+        """Orientation and position of the window."""
+        x, y = self._win_pos[self.orientation][2:]
+        return self.orientation, x, y
+
+    def restore_placement(self, orientation: Orientation, x: int, y: int) -> None:
+        """Move the window back to a :meth:`placement`."""
+        self.orientation = orientation
+        self._win_pos[orientation][2:] = [x, y]
+        self._turned()
+
     # ── canvas setup ──────────────────────────────────────────────────
 
-    def _build_canvas(self) -> None:
-        w, h = _DIMENSIONS[self.orientation]
+    def _build_canvas(self, canvas_factory: Callable[..., Any], label: str) -> None:
+        w, h = self.size
         highlight_opts: dict = (
             dict(
                 highlightbackground=TIME_COLOR,
@@ -137,81 +182,176 @@ class LightimerApp(tk.Frame):
                 highlightcolor=TIME_COLOR,
                 relief=tk.FLAT,
             )
-            if self.lean
+            if self.lean and not self.fullscreen
             else dict(highlightthickness=0)
         )
 
-        self.canvas = tk.Canvas(
-            self, width=w, height=h, bd=0, bg=BG_COLOR, **highlight_opts
+        self.canvas = canvas_factory(
+            self.master, width=w, height=h, bd=0, bg=BG_COLOR, **highlight_opts
         )
         self.level = self.canvas.create_rectangle(0, 0, w, h, fill=LEVEL_COLOR, width=0)
         self.lead_line = self.canvas.create_rectangle(
-            0, 0, w, 1, fill=LEVEL_COLOR, width=0
+            0, 0, w, self.layout.lead, fill=LEVEL_COLOR, width=0
         )
-
-        gap = _TEXT_GAP.get(sys.platform, WIN_GAP)
+        # The canvas follows the window when it is resized
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.render = CanvasRenderer(self.canvas)
+
+        self.fraction_text: int | None = None
+        if self.fullscreen:
+            self.text = None
+            self._draw_label()
+            return
         self.text = self.canvas.create_text(
-            w / 2,
-            gap,
-            text=self.timer.format(self.duration),
-            font=TIME_FONT,
+            self.layout.text_x,
+            self.layout.text_y,
+            text=label,
+            font=self.layout.font,
             fill=TIME_COLOR,
         )
-        self.canvas.pack()
-
-    def _bind_events(self) -> None:
-        c = self.canvas
-        c.bind("<Button-3>", self._on_click)
-        c.bind("<ButtonPress-1>", self._on_motion_start)
-        c.bind("<B1-Motion>", self._on_motion)
-        c.bind("<ButtonRelease-1>", self._on_motion_stop)
-        c.bind("<space>", self._on_click)
-        c.bind("<Double-Button-3>", self._on_double_click)
-        c.bind("<Return>", self._on_double_click)
-        c.bind("<KP_Enter>", self._on_double_click)
-        c.bind("t", self._on_toggle)
-        if sys.platform == "win32":
-            c.bind("l", self._on_lean)
-        c.bind("<Key>", self._on_change_time)
-        c.bind("<Escape>", self._on_close)
-        c.bind("<F1>", self._on_help)
-        c.focus_set()
+        if self.centiseconds:
+            self.fraction_text = self.canvas.create_text(
+                self.layout.fraction_x,
+                self.layout.fraction_y,
+                text="",
+                anchor=self.layout.fraction_anchor,
+                font=self.layout.fraction_font,
+                fill=TIME_COLOR,
+            )
 
-    # ── canvas orientation ────────────────────────────────────────────
+    # ── size ──────────────────────────────────────────────────────────
 
-    def _config_canvas_for(self, orient: Orientation) -> None:
-        w, h = _DIMENSIONS[orient]
-        self.canvas.config(width=w, height=h)
+    def note_size(self, width: int, height: int) -> None:
+        """Note a new canvas size; :meth:`apply_pending` adopts it."""
+        self._resize_to = None if (width, height) == self.size else (width, height)
 
-    def _redraw_level(self, level: float, color: str) -> None:
-        """Redraw the level bar with sub-pixel fade for smooth motion.
+    def apply_pending(self) -> bool:
+        """Apply the input noted since the last frame.
 
-        A 1 px leading-edge line is drawn at the boundary between the
-        black background and the coloured rectangle.  Its colour is
-        interpolated between *color* and black according to the
-        fractional pixel position, so the bar appears to glide smoothly
-        rather than jumping whole pixels.
+        The window is moved to the last drag position and takes on the
+        last noted size.  Returns ``True`` if it was resized.
         """
-        w, h = _DIMENSIONS[self.orientation]
-        pixel_pos = int(level)
-        frac = level - pixel_pos
-
-        if self.orientation is Orientation.VERTICAL:
-            self.canvas.coords(self.level, 0, pixel_pos + 1, w, h)
-            self.canvas.coords(self.lead_line, 0, pixel_pos, w, pixel_pos + 1)
+        if self._drag_to is not None:
+            w, h = self.size
+            x, y = self._drag_to
+            self._drag_to = None
+            self.master.geometry(f"{w}x{h}+{x}+{y}")
+        if self._resize_to is None:
+            return False
+        size, self._resize_to = self._resize_to, None
+        return self.resize(*size)
+
+    def resize(self, width: int, height: int) -> bool:
+        """Adopt a new canvas size and lay the window out for it.
+
+        A fullscreen window also drops its glyph cache so the label is
+        re-rendered at the new size.  Returns ``True`` if the size did
+        change.
+        """
+        if (width, height) == self.size:
+            return False
+        if self.fullscreen:
+            self._screen = (width, height)
+            self.glyphs.clear()
         else:
-            self.canvas.coords(self.level, pixel_pos + 1, 0, w, h)
-            self.canvas.coords(self.lead_line, pixel_pos, 0, pixel_pos + 1, h)
+            self._win_pos[self.orientation][:2] = [width, height]
+        self._relayout()
+        return True
+
+    def _relayout(self) -> None:
+        self.layout = compute_layout(*self.size, self.orientation, self.scale)
+        if self.text is None:
+            self._draw_label()
+        else:
+            self.render.coords(self.text, self.layout.text_x, self.layout.text_y)
+            self.render.itemconfig(self.text, font=self.layout.font)
+        if self.fraction_text is not None:
+            layout = self.layout
+            self.render.coords(self.fraction_text, layout.fraction_x, layout.fraction_y)
+            self.render.itemconfig(
+                self.fraction_text,
+                anchor=layout.fraction_anchor,
+                font=layout.fraction_font,
+            )
 
-        # Fade the leading-edge line: full colour at frac=0 → black at frac≈1
-        faded_color = interpolate_color(color, frac)
+    # ── label ─────────────────────────────────────────────────────────
 
-        self.canvas.itemconfig(self.level, fill=color)
-        self.canvas.itemconfig(self.lead_line, fill=faded_color)
+    def set_label(
+        self,
+        text: str | None = None,
+        fill: str | None = None,
+        fraction: str | None = None,
+    ) -> None:
+        """Show *text* and then *fraction* in *fill*; any may be left as it is.
 
-    # ── event handlers ────────────────────────────────────────────────
+        *fraction* is the ``.cc`` of centisecond mode, ``""`` for none; it
+        is ignored unless the window was made with *centiseconds*.
+        """
+        if self.text is not None:
+            options = {"text": text, "fill": fill}
+            self.render.itemconfig(
+                self.text, **{k: v for k, v in options.items() if v is not None}
+            )
+            if self.fraction_text is not None:
+                options = {"text": fraction, "fill": fill}
+                self.render.itemconfig(
+                    self.fraction_text,
+                    **{k: v for k, v in options.items() if v is not None},
+                )
+            return
+        text = self.label if text is None else text
+        fill = self._label_fill if fill is None else fill
+        if fraction is None or not self.centiseconds:
+            fraction = self.fraction
+        if (text, fill, fraction) == (self.label, self._label_fill, self.fraction):
+            return
+        self.label, self._label_fill, self.fraction = text, fill, fraction
+        self._draw_label()
+
+    @property
+    def digit_height(self) -> int:
+        """Height of the projector label's digits in pixels."""
+        if self.centiseconds:
+            return glyph_height(*self._screen, chars=len("00:00.00"))
+        return glyph_height(*self._screen)
+
+    def _draw_label(self) -> None:
+        w, h = self._screen
+        height = self.digit_height
+        atlas = self.glyphs.get(height, self._label_fill)
+        text = "".join(
+            c if c in atlas.images else "-" for c in self.label + self.fraction
+        )
+        while len(self.digits) < len(text):
+            self.digits.append(self.canvas.create_image(0, 0, anchor=tk.NW))
+        corners = layout(text, height, w, h)
+        for i, item in enumerate(self.digits):
+            if i < len(text):
+                self.render.coords(item, *corners[i])
+                self.render.itemconfig(item, image=atlas.images[text[i]])
+            else:
+                self.render.itemconfig(item, image="")
 
-    def _on_lean(self, event: tk.Event) -> None:
+    # ── canvas orientation ────────────────────────────────────────────
+
+    def toggle_orientation(self) -> None:
+        self.orientation = (
+            Orientation.HORIZONTAL
+            if self.orientation is Orientation.VERTICAL
+            else Orientation.VERTICAL
+        )
+        self._turned()
+
+    def _turned(self) -> None:
+        self._resize_to = None
+        self.apply_geometry()
+        w, h = self.size
+        self.canvas.config(width=w, height=h)
+        self._relayout()
+
+    def toggle_lean(self) -> None:
+        if self.fullscreen:
+            return
         self.lean = not self.lean
         pos = self._win_pos[self.orientation]
         if self.lean:
@@ -222,164 +362,717 @@ class LightimerApp(tk.Frame):
                 relief=tk.FLAT,
             )
             _winpos_offset_add(pos, self.master)
-            self._apply_geometry()
+            self.apply_geometry()
             self.master.overrideredirect(True)
         else:
             self.master.overrideredirect(False)
             self.canvas.config(highlightthickness=0)
             _winpos_offset_sub(pos, self.master)
-            self._apply_geometry()
+            self.apply_geometry()
+
+    # ── dragging ──────────────────────────────────────────────────────
+
+    def drag_start(self, x: int, y: int) -> None:
+        self._offset_x = x
+        self._offset_y = y
+        self._drag_to = None
+
+    def drag(self, x_root: int, y_root: int) -> None:
+        """Note where the pointer is; :meth:`apply_pending` moves the window."""
+        if not self.fullscreen:
+            self._drag_to = (x_root - self._offset_x, y_root - self._offset_y)
+
+    def drag_stop(self, x_root: int, y_root: int) -> None:
+        if self.fullscreen:
+            return
+        self._drag_to = None
+        pos = self._win_pos[self.orientation]
+        pos[2:] = [x_root - self._offset_x, y_root - self._offset_y]
+        self.apply_geometry()
+
+    # ── drawing ───────────────────────────────────────────────────────
+
+    def redraw_level(self, pixel_pos: int, color: str, lead_color: str) -> None:
+        """Move the level bar to *pixel_pos* and its lead line just above it."""
+        layout = self.layout
+        w, h, lead = layout.width, layout.height, layout.lead
+        if self.orientation is Orientation.VERTICAL:
+            self.render.coords(self.level, 0, pixel_pos + lead, w, h)
+            self.render.coords(self.lead_line, 0, pixel_pos, w, pixel_pos + lead)
+        else:
+            self.render.coords(self.level, pixel_pos + lead, 0, w, h)
+            self.render.coords(self.lead_line, pixel_pos, 0, pixel_pos + lead, h)
+        self.render.itemconfig(self.level, fill=color)
+        self.render.itemconfig(self.lead_line, fill=lead_color)
+
+
+class LightimerApp:
+    """Main application for the Lightimer countdown UI.
+
+    The app draws on a canvas created by *canvas_factory* inside *master*.
+    By default that is a real ``tk.Canvas`` in a ``tk.Tk`` root; passing a
+    :class:`~lightimer.headless.HeadlessRoot` together with
+    :class:`~lightimer.headless.RecordingCanvas` runs the app without any
+    display or Tcl interpreter.
+
+    With *windows* > 1, further :class:`TimerWindow` instances are opened
+    in windows made by *window_factory* (``tk.Toplevel``).  They all share
+    one timer and one render tick: the colour, label and bar position are
+    computed once per frame and applied to every window.
+
+    With *centiseconds*, the label reads ``MM:SS.cc`` once less than
+    ``CENTISECONDS_BELOW_S`` remain, and frames are scheduled for every
+    hundredth from then on.
+
+    The notification sound is played by *audio_factory*'s player, by
+    default an :class:`~lightimer.sound.AudioProcess` outside the UI
+    process.  The player is made on first use, normally by
+    :meth:`load_assets`, so that the first frame does not wait for
+    :mod:`multiprocessing` to be imported.
+    """
+
+    # ── construction ──────────────────────────────────────────────────
+
+    def __init__(
+        self,
+        master: tk.Tk,
+        *,
+        lean: bool = False,
+        sound_file: str | None = None,
+        adaptive: bool = True,
+        max_fps: int = MAX_FPS,
+        defer_assets: bool = False,
+        clock: Clock = time.perf_counter,
+        canvas_factory: Callable[..., Any] = tk.Canvas,
+        profiler: FrameProfiler | None = None,
+        agenda: Agenda | None = None,
+        windows: int = 1,
+        window_factory: Callable[[Any], Any] = tk.Toplevel,
+        journal: Journal | None = None,
+        fullscreen: bool = False,
+        image_factory: Callable[..., Any] = tk.PhotoImage,
+        recorder: Recorder | None = None,
+        centiseconds: bool = False,
+        audio_factory: Callable[[str], Any] | None = None,
+    ) -> None:
+        self.master: tk.Tk = master
+        self.recorder = recorder
+        self.sound_file = sound_file
+        self.centiseconds = centiseconds
+
+        # Frame scheduling: redraw only on visible changes (adaptive) or at
+        # a fixed rate, never faster than *max_fps*
+        self.adaptive = adaptive
+        self.max_fps = max_fps
+        self._frame_ms: int = max(1, 1000 // max_fps)
+        self._frame_job: str | None = None
+        self._frame_due: float | None = None
+        self.profiler = profiler
+
+        self._audio_factory = audio_factory
+        self._audio: Any = None
+        self._assets_loaded = False
+
+        # Agenda mode: one timer runs through all segments back to back
+        self.agenda = agenda
+        self._slot: Slot | None = None
+
+        # Digit-entry state; its duration is the countdown period
+        self.entry = digit_entry.Entry(
+            INIT_DURATION_S if agenda is None else agenda.total
+        )
+        self.timer = StaticTimer(self.duration, clock=clock)
+        self.colors = ColorTable()
+
+        # Input coalescing: window drags and resizes are applied at most
+        # once per frame, and digits typed in a burst with one redraw
+        self._input_job: str | None = None
+        self._key_job: str | None = None
+        self._pending_keys: list[str] = []
+        # Calls from server, sync and instance threads, run by poll_posts()
+        self._posted: queue.SimpleQueue[tuple[Callable[..., Any], tuple]] = (
+            queue.SimpleQueue()
+        )
+
+        self.scale = dpi_scale(master)
+        self.windows: list[TimerWindow] = []
+        for index in range(max(1, windows)):
+            window_master = master if index == 0 else window_factory(master)
+            self.add_window(
+                window_master,
+                lean=lean,
+                canvas_factory=canvas_factory,
+                fullscreen=fullscreen,
+                image_factory=image_factory,
+            )
+
+        # Recording starts before the resume, which is an input of its own
+        if recorder is not None:
+            recorder.attach(self)
+
+        # Resume where a previous run left off, then journal every change
+        self.journal = journal
+        if journal is not None:
+            self._restore(journal.read())
+            self.timer.listeners.append(self._on_timer_event)
+        self.redraw_canvas()
+        if self.timer.is_running:
+            self._on_time_running()
+
+        if not defer_assets:
+            self.load_assets()
+
+    def add_window(
+        self,
+        master: tk.Misc,
+        *,
+        lean: bool = False,
+        canvas_factory: Callable[..., Any] = tk.Canvas,
+        fullscreen: bool = False,
+        image_factory: Callable[..., Any] = tk.PhotoImage,
+    ) -> TimerWindow:
+        """Open another view of the timer in *master*."""
+        window = TimerWindow(
+            master,
+            lean=lean,
+            canvas_factory=canvas_factory,
+            index=len(self.windows),
+            label=self.timer.format(self.timer.get_remaining()),
+            fullscreen=fullscreen,
+            image_factory=image_factory,
+            scale=self.scale,
+            centiseconds=self.centiseconds,
+        )
+        self.windows.append(window)
+        self._bind_events(window.canvas)
+        master.protocol("WM_DELETE_WINDOW", lambda: self.close_window(window))
+        return window
+
+    def close_window(self, window: TimerWindow) -> None:
+        """Close *window*; closing the main window or the last one quits."""
+        if window.master is self.master or len(self.windows) == 1:
+            self._on_close(None)
+            return
+        self.windows.remove(window)
+        window.master.destroy()
+
+    def mainloop(self) -> None:
+        """Run the event loop of the master window."""
+        self.master.mainloop()
+
+    def load_assets(self) -> None:
+        """Load everything the first frame does not need.
+
+        The window icon is decoded and the audio player is started, which
+        imports pygame and preloads the notification sound in a helper
+        process.  Called from the constructor unless *defer_assets* is
+        set, in which case the caller runs it once the first frame is up.
+        """
+        icon = tk.PhotoImage(file=resource_path(ICON_PATH))
+        self._icon_ref = icon  # prevent GC
+        for window in self.windows:
+            self.master.call("wm", "iconphoto", window.master._w, icon)
+        # Warm up the mixer and decode the sound long before time is up
+        self.audio.start()
+        self._assets_loaded = True
+
+    @property
+    def audio(self) -> Any:
+        """The notification player, made on first use."""
+        if self._audio is None:
+            self._audio = self._make_audio(self.sound_file or SOUND_PATH)
+        return self._audio
+
+    @audio.setter
+    def audio(self, player: Any) -> None:
+        self._audio = player
+
+    def _make_audio(self, sound_file: str) -> Any:
+        factory = self._audio_factory
+        if factory is None:
+            from lightimer.sound import AudioProcess as factory
+        return factory(sound_file)
+
+    @property
+    def duration(self) -> float:
+        """The countdown period, as last set or typed."""
+        return self.entry.duration
+
+    # ── primary window ────────────────────────────────────────────────
+
+    @property
+    def canvas(self) -> Any:
+        return self.windows[0].canvas
+
+    @property
+    def render(self) -> CanvasRenderer:
+        return self.windows[0].render
+
+    @property
+    def level(self) -> int:
+        return self.windows[0].level
+
+    @property
+    def lead_line(self) -> int:
+        return self.windows[0].lead_line
+
+    @property
+    def text(self) -> int:
+        return self.windows[0].text
+
+    @property
+    def orientation(self) -> Orientation:
+        return self.windows[0].orientation
+
+    def _window_of(self, event: tk.Event | None) -> TimerWindow:
+        """The window an *event* happened in (the first one by default)."""
+        widget = getattr(event, "widget", None)
+        for window in self.windows:
+            if window.canvas is widget:
+                return window
+        return self.windows[0]
+
+    def _set_title(self, title: str) -> None:
+        for window in self.windows:
+            window.master.title(title)
+
+    def _set_label(self, **options: Any) -> None:
+        for window in self.windows:
+            window.set_label(**options)
+
+    # ── events ────────────────────────────────────────────────────────
+
+    def _bind_events(self, c: Any) -> None:
+        on = self._handler
+        c.bind("<Button-3>", on("_on_click"))
+        c.bind("<ButtonPress-1>", on("_on_motion_start"))
+        c.bind("<B1-Motion>", on("_on_motion"))
+        c.bind("<ButtonRelease-1>", on("_on_motion_stop"))
+        c.bind("<space>", on("_on_click"))
+        c.bind("<Double-Button-3>", on("_on_double_click"))
+        c.bind("<Return>", on("_on_double_click"))
+        c.bind("<KP_Enter>", on("_on_double_click"))
+        c.bind("t", on("_on_toggle"))
+        if sys.platform == "win32":
+            c.bind("l", on("_on_lean"))
+        c.bind("<Key>", on("_on_change_time"))
+        c.bind("<Escape>", on("_on_close"))
+        c.bind("<F1>", on("_on_help"))
+        c.bind("<Next>", on("_on_next_segment"))
+        c.bind("<Prior>", on("_on_prev_segment"))
+        c.bind("<Configure>", on("_on_configure"))
+        c.focus_set()
+
+    def _handler(self, name: str) -> Callable[[tk.Event], None]:
+        """The event handler *name*, recording its events if requested."""
+        method = getattr(self, name)
+        if self.recorder is None:
+            return method
+
+        def record(event: tk.Event) -> None:
+            window = self.windows.index(self._window_of(event))
+            self.recorder.input(name, window, event)
+            method(event)
+
+        return record
+
+    def _record_call(self, name: str, *args: Any) -> None:
+        if self.recorder is not None:
+            self.recorder.call(name, *args)
+
+    # ── event handlers ────────────────────────────────────────────────
+
+    def _on_lean(self, event: tk.Event) -> None:
+        self._flush_keys()
+        self._window_of(event).toggle_lean()
+        self._save_state()
 
     def _on_motion_start(self, event: tk.Event) -> None:
-        self._offset_x = event.x
-        self._offset_y = event.y
+        self._window_of(event).drag_start(event.x, event.y)
 
     def _on_motion(self, event: tk.Event) -> None:
-        w, h = _DIMENSIONS[self.orientation]
-        x = self.master.winfo_pointerx() - self._offset_x
-        y = self.master.winfo_pointery() - self._offset_y
-        self.master.geometry(f"{w}x{h}+{x}+{y}")
+        self._window_of(event).drag(event.x_root, event.y_root)
+        self._schedule_input()
 
     def _on_motion_stop(self, event: tk.Event) -> None:
-        w, h = _DIMENSIONS[self.orientation]
-        pos = self._win_pos[self.orientation]
-        pos[:] = [
-            w,
-            h,
-            self.master.winfo_pointerx() - self._offset_x,
-            self.master.winfo_pointery() - self._offset_y,
-        ]
+        # The final position is applied right away, pending frame or not
+        self._window_of(event).drag_stop(event.x_root, event.y_root)
+        self._save_state()
+
+    def _schedule_input(self) -> None:
+        if self._input_job is None:
+            self._input_job = self.master.after(self._frame_ms, self._apply_input)
+
+    def _apply_input(self) -> None:
+        self._input_job = None
+        resized = [window.apply_pending() for window in self.windows]
+        if any(resized):
+            self.redraw_canvas()
+
+    def _on_configure(self, event: tk.Event) -> None:
+        # Resizing sends a storm of these; only the last size is laid out
+        self._window_of(event).note_size(event.width, event.height)
+        self._schedule_input()
 
     def _on_help(self, event: tk.Event) -> None:
         logger.info("Help requested (F1)")
 
     def _on_close(self, event: tk.Event) -> None:
+        if self._audio is not None:
+            self._audio.close()
         self.master.destroy()
 
     def _on_toggle(self, event: tk.Event) -> None:
-        self.orientation = (
-            Orientation.HORIZONTAL
-            if self.orientation is Orientation.VERTICAL
-            else Orientation.VERTICAL
-        )
-        self._apply_geometry()
-        self._config_canvas_for(self.orientation)
+        self._flush_keys()
+        self._window_of(event).toggle_orientation()
+        self._save_state()
         self.redraw_canvas()
-        if self._cstate != 0:
-            self.canvas.itemconfig(self.text, text="%s%s:%s%s" % tuple(self._cdigits))
+        if self.entry.typing:
+            self._set_label(text=self.entry.label, fraction="")
 
     def _on_click(self, event: tk.Event) -> None:
+        self._flush_keys()
         if self.timer.is_time_up():
             return
         if self.timer.is_running:
             self.timer.stop()
         else:
-            self._creset()
+            self.entry = digit_entry.clear(self.entry)
             self.timer.start()
+            self._cancel_frame()
             self._on_time_running()
 
     def _on_double_click(self, event: tk.Event) -> None:
+        self._flush_keys()
         if self.duration == 0:
             return
         self.timer.stop()
         self.timer.reset()
-        self._creset()
+        self.entry = digit_entry.clear(self.entry)
+        self.redraw_canvas()
+
+    def _on_next_segment(self, event: tk.Event) -> None:
+        self._seek_segment(+1)
+
+    def _on_prev_segment(self, event: tk.Event) -> None:
+        self._seek_segment(-1)
+
+    def _seek_segment(self, step: int) -> None:
+        """Jump to the start of the segment *step* positions away."""
+        self._flush_keys()
+        if self.agenda is None:
+            return
+        current = self.agenda.locate(self.timer.get_elapsed()).index
+        index = min(max(current + step, 0), len(self.agenda) - 1)
+        self.timer.seek(self.agenda.start_of(index))
+        self._slot = None  # a jump is no segment end, so no chime
         self.redraw_canvas()
 
     def _on_time_running(self) -> None:
+        self._frame_job = None
         if not self.timer.is_running:
             return
-        self.master.after(REFRESH_CYCLE_MS, self._on_time_running)
+        started = self.timer.clock()
         self.redraw_canvas()
+        if self.profiler is not None:
+            due = started if self._frame_due is None else self._frame_due
+            self.profiler.record(due, started, self.timer.clock() - started)
         if self.timer.is_time_up():
-            self.timer.stop()
+            self.timer.expire()
             self._notify_timesup()
+            return
+        delay_ms = self._next_frame_ms()
+        self._frame_due = self.timer.clock() + delay_ms / 1000
+        self._frame_job = self.master.after(delay_ms, self._on_time_running)
 
     def _on_change_time(self, event: tk.Event) -> None:
         if not event.char or not event.char.isdigit():
             self._on_help(event)
             return
+        # Tk runs idle callbacks only once all queued events are handled,
+        # so a burst of digits (or key auto-repeat) is entered in one go
+        self._pending_keys.append(event.char)
+        if self._key_job is None:
+            self._key_job = self.master.after_idle(self._on_keys_idle)
+
+    def _on_keys_idle(self) -> None:
+        self._key_job = None
+        self._flush_keys()
+
+    def _flush_keys(self) -> None:
+        """Enter the digits typed since the last flush, then redraw once.
+
+        Other handlers call this first, so keys act in the order typed.
+        """
+        if self._key_job is not None:
+            self.master.after_cancel(self._key_job)
+            self._key_job = None
+        if not self._pending_keys:
+            return
+        chars, self._pending_keys = self._pending_keys, []
         if self.timer.is_running:
             self.timer.stop()
-        self._apply_digit(self._cstate, event.char)
-        self.canvas.itemconfig(self.text, text="%s%s:%s%s" % tuple(self._cdigits))
+        if self.agenda is not None:
+            # Typing a duration leaves agenda mode
+            self.agenda = None
+            self._slot = None
+            self._set_title("Lightimer")
+        for char in chars:
+            if not self.entry.typing:
+                self.timer.reset()  # a new entry starts from the full bar
+            self.entry = digit_entry.press(self.entry, int(char))
         self.timer.set(self.duration)
+        self.redraw_canvas()
+        self._set_label(text=self.entry.label, fraction="")
 
-    # ── drawing ───────────────────────────────────────────────────────
+    # ── remote control ────────────────────────────────────────────────
 
-    def redraw_canvas(self) -> None:
-        """Update the level bar, colour, and remaining-time label."""
-        if self.duration == 0 or self.timer.is_time_up():
-            self.canvas.itemconfig(self.level, fill="black")
-            self.canvas.itemconfig(self.lead_line, fill="black")
-            self.canvas.update_idletasks()
-            return
+    def post(self, func: Callable[..., Any], *args: Any) -> None:
+        """Have ``func(*args)`` run on the UI thread; safe from any thread.
 
-        half = self.duration / 2
-        elapsed = self.timer.get_elapsed()
-        remaining = self.timer.get_remaining()
+        Tk is not thread-safe, so other threads must not call ``after()``
+        either; posted calls are run by :meth:`poll_posts`.
+        """
+        self._posted.put((func, args))
+
+    def poll_posts(self, interval_ms: int = POST_POLL_MS) -> None:
+        """Run the calls posted so far, then again every *interval_ms*."""
+        while True:
+            try:
+                func, args = self._posted.get_nowait()
+            except queue.Empty:
+                break
+            func(*args)
+        self.master.after(interval_ms, self.poll_posts, interval_ms)
+
+    def handle_command(self, command: str, seconds: float | None = None) -> None:
+        """Apply a remote *command*: ``start``, ``stop``, ``reset`` or ``set``.
+
+        ``set`` takes the new duration in *seconds*.
+        """
+        self._record_call("handle_command", command, seconds)
+        if command == "start":
+            if not self.timer.is_running:
+                self._on_click(None)
+        elif command == "stop":
+            if self.timer.is_running:
+                self._on_click(None)
+        elif command == "reset":
+            self._on_double_click(None)
+        elif command == "set" and seconds is not None and seconds > 0:
+            self._set_duration(seconds)
+        else:
+            raise ValueError(f"invalid command {command!r}")
 
-        red = int(round(min(RGB_MAX, (elapsed / half) * RGB_MAX)))
-        green = max(0, int(round(min(RGB_MAX, (remaining / half) * RGB_MAX))))
+    def set_duration(self, seconds: float) -> None:
+        """Stop the timer and make *seconds* the new countdown duration."""
+        self._record_call("set_duration", seconds)
+        self._set_duration(seconds)
 
-        level_size = _LEVEL_AXIS[self.orientation]
-        level = (elapsed * level_size) / self.duration
-        color = f"#{red:02x}{green:02x}00"
-        self._redraw_level(level, color)
+    def _set_duration(self, seconds: float) -> None:
+        # Also reached from recorded entry points, which must not be
+        # recorded twice
+        self._flush_keys()
+        self.timer.stop()
+        self.agenda = None
+        self._slot = None
+        self._set_title("Lightimer")
+        self.entry = digit_entry.Entry(seconds)
+        self.timer.set(seconds)
+        self.redraw_canvas()
 
-        self.canvas.itemconfig(
-            self.text,
-            text=self.timer.format(remaining),
-            fill=TIME_COLOR,
-        )
-        self.canvas.update_idletasks()
+    def set_sound(self, sound_file: str) -> None:
+        """Use *sound_file* for the time-up notification from now on."""
+        if self._audio is not None:
+            self._audio.close()
+        self.sound_file = sound_file
+        self._audio = self._make_audio(sound_file)
+        if self._assets_loaded:
+            self.audio.start()
+
+    def apply_launch(self, launch: Launch) -> None:
+        """Take the options of a later launch and bring the windows up."""
+        self._record_call("apply_launch", launch)
+        if launch.duration is not None:
+            self._set_duration(launch.duration)
+        if launch.lean:
+            for window in self.windows:
+                if not window.lean:
+                    window.toggle_lean()
+            self._save_state()
+        if launch.sound_file is not None and launch.sound_file != self.sound_file:
+            self.set_sound(launch.sound_file)
+        for window in self.windows:
+            window.master.deiconify()
+            window.master.lift()
+
+    def follow(self, state: TimerState, at: float) -> None:
+        """Mirror a leader timer that was in *state* at timer clock *at*."""
+        from lightimer.sync import apply_state  # only needed with --follow
+
+        self._record_call("follow", state, at)
+        was_up = self.timer.is_time_up()
+        if not apply_state(self.timer, state, at):
+            return
+        if state.period != self.duration:
+            self.entry = digit_entry.Entry(state.period)
+        self._cancel_frame()
+        if self.timer.is_running:
+            self._on_time_running()
+        elif self.timer.is_time_up() and not was_up:
+            self.timer.expire()
+            self.redraw_canvas()
+            self._notify_timesup()
+        else:
+            self.redraw_canvas()
 
-    # ── digit entry ───────────────────────────────────────────────────
+    # ── journal ───────────────────────────────────────────────────────
 
-    def _creset(self) -> None:
-        self._cstate = 0
-        self._cdigits = ["-", "-", "-", "-"]
+    def _on_timer_event(self, event: str, timer: StaticTimer) -> None:
+        self._save_state()
 
-    def _apply_digit(self, position: int, char: str) -> None:
-        """Set the digit at *position* (0‥3) and advance the entry state.
+    def _save_state(self) -> None:
+        if self.journal is None:
+            return
+        orientation, x, y = self.windows[0].placement()
+        self.journal.write(self.timer.state(), orientation.value, x, y)
 
-        Digit positions correspond to ``M0 M1 : S0 S1``.
-        """
-        digit = int(char)
+    def _restore(self, entry: JournalEntry | None) -> None:
+        if entry is None:
+            return
+        state = entry.state(self.journal.wall())
+        if self.agenda is not None and state.period != self.agenda.total:
+            return  # journalled for another agenda
+        self.resume(state, entry.orientation, entry.x, entry.y)
+
+    def resume(self, state: TimerState, orientation: int, x: int, y: int) -> None:
+        """Take on a journalled timer *state* and window placement."""
+        from lightimer.sync import apply_state  # only needed with --journal
+
+        self._record_call("resume", state, orientation, x, y)
+        self.entry = digit_entry.Entry(state.period)
+        apply_state(self.timer, state, self.timer.clock())
+        try:
+            placement = Orientation(orientation)
+        except ValueError:
+            return
+        self.windows[0].restore_placement(placement, x, y)
+
+    # ── frame scheduling ──────────────────────────────────────────────
+
+    def _next_frame_ms(self) -> int:
+        """Milliseconds until the next frame of the running timer."""
+        if not self.adaptive:
+            return self._frame_ms
+        # The longest bar needs the most frequent updates
+        axis = max(window.axis for window in self.windows)
+        elapsed, remaining, length = self._progress()
+        delay = next_change_delay(
+            elapsed,
+            remaining,
+            length,
+            axis,
+            self.colors.fade_steps or FADE_STEPS,
+            self.colors.steps,
+            label_step=(
+                0.01
+                if self.centiseconds and remaining < CENTISECONDS_BELOW_S
+                else 1.0
+            ),
+        )
+        return next_frame_ms(delay, self._frame_ms)
 
-        # Position-specific multipliers: [10min, 1min, 10sec, 1sec]
-        multipliers = [600, 60, 10, 1]
+    def _cancel_frame(self) -> None:
+        self._frame_due = None
+        if self._frame_job is not None:
+            self.master.after_cancel(self._frame_job)
+            self._frame_job = None
 
-        if position == 0:
-            # Starting a new entry — reset first
-            self.timer.reset()
-            self._creset()
-            self.redraw_canvas()
+    # ── drawing ───────────────────────────────────────────────────────
 
-        if position == 2 and digit > 5:
-            # Tens-of-seconds must be 0‥5
+    def redraw_canvas(self) -> None:
+        """Update the level bar, colour, and remaining-time label."""
+        if self.duration == 0 or self.timer.is_time_up():
+            for window in self.windows:
+                window.render.itemconfig(window.level, fill="black")
+                window.render.itemconfig(window.lead_line, fill="black")
+                window.render.flush()
             return
 
-        self._cdigits[position] = digit
-
-        if position == 0:
-            self._pre_dur = digit * multipliers[position]
+        elapsed, remaining, length = self._progress()
+        half = length / 2
+        color_index = self.colors.index(elapsed, remaining, half)
+        if self.centiseconds and remaining < CENTISECONDS_BELOW_S:
+            label, fraction = self.timer.format_centiseconds(remaining)
         else:
-            self._pre_dur += digit * multipliers[position]
+            label, fraction = self.timer.format(remaining), ""
+
+        # Windows with bars of the same length share the level computation
+        levels: dict[int, tuple[int, str, str]] = {}
+        for window in self.windows:
+            axis = window.axis
+            if axis not in levels:
+                levels[axis] = self._level_args((elapsed * axis) / length, color_index)
+            window.redraw_level(*levels[axis])
+            window.set_label(text=label, fill=TIME_COLOR, fraction=fraction)
+            window.render.flush()
+
+    def _redraw_level(self, level: float, color_index: int) -> None:
+        """Redraw the level bar of every window at *level* pixels."""
+        args = self._level_args(level, color_index)
+        for window in self.windows:
+            window.redraw_level(*args)
+
+    def _level_args(self, level: float, color_index: int) -> tuple[int, str, str]:
+        """Bar position, colour and lead-line colour for *level* pixels.
 
-        if self._pre_dur != 0:
-            self.duration = self._pre_dur
+        A 1 px leading-edge line is drawn at the boundary between the
+        black background and the coloured rectangle.  Its colour is
+        faded from the level colour to black according to the
+        fractional pixel position, so the bar appears to glide smoothly
+        rather than jumping whole pixels.
+        """
+        pixel_pos = int(level)
+        frac = level - pixel_pos
+        # Fade the leading-edge line: full colour at frac=0 → black at frac≈1
+        return (
+            pixel_pos,
+            self.colors.color(color_index),
+            self.colors.fade(color_index, frac),
+        )
 
-        self._cstate = (position + 1) % _NUM_DIGITS
+    def _progress(self) -> tuple[float, float, float]:
+        """Elapsed, remaining and total seconds of what the bar shows.
+
+        Without an agenda that is the whole countdown; with one, it is the
+        current talk or changeover gap.
+        """
+        elapsed = self.timer.get_elapsed()
+        if self.agenda is None:
+            return elapsed, self.timer.get_remaining(), self.duration
+        slot = self.agenda.locate(elapsed)
+        if self._slot is None or slot[:2] != self._slot[:2]:
+            self._enter_slot(slot)
+        return slot.elapsed, slot.remaining, slot.length
+
+    def _enter_slot(self, slot: Slot) -> None:
+        previous, self._slot = self._slot, slot
+        segment = self.agenda.segments[slot.index]
+        if slot.in_gap:
+            upcoming = self.agenda.segments[min(slot.index + 1, len(self.agenda) - 1)]
+            self._set_title(f"Lightimer — changeover, next: {upcoming.title}")
+        else:
+            number = f"{slot.index + 1}/{len(self.agenda)}"
+            self._set_title(f"Lightimer — {number} {segment.title}".rstrip())
+        if previous is not None and not previous.in_gap and slot[:2] > previous[:2]:
+            # A talk ran out and the agenda moved on by itself
+            self.audio.play(time.perf_counter())
 
     # ── notifications ─────────────────────────────────────────────────
 
     def _notify_timesup(self) -> None:
-        if self.sound_file:
-            play_notification(self.sound_file)
-        else:
-            play_notification()
-        self.canvas.itemconfig(self.text, fill="red")
+        self.audio.play(time.perf_counter())
+        self._set_label(fill="red", fraction=".00" if self.centiseconds else None)
 
 
 # ── module-level helpers ──────────────────────────────────────────────
@@ -1,13 +1,63 @@
 """A handy countdown timer for mastering time management in Lightning talks or other short presentations."""
 
 import argparse
+import os
 import sys
-import tkinter as tk
+import time
+from typing import Any
 
-from lightimer.ui import LightimerApp
+_START = time.perf_counter()
+
+
+def _duration(text: str) -> float:
+    """Parse ``MM:SS`` into seconds."""
+    minutes, _, seconds = text.rpartition(":")
+    # Plain digits only: int() would also take signs and spaces
+    if not seconds.isdecimal() or not (minutes == "" or minutes.isdecimal()):
+        raise argparse.ArgumentTypeError(f"expected MM:SS, got {text!r}")
+    total = int(minutes or 0) * 60 + int(seconds)
+    if (minutes and int(seconds) >= 60) or total <= 0:
+        raise argparse.ArgumentTypeError(f"expected MM:SS, got {text!r}")
+    return float(total)
+
+
+def _positive(text: str) -> int:
+    """Parse a positive integer."""
+    try:
+        number = int(text)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {text!r}")
+    return number
+
+
+def _serve_port(text: str) -> int:
+    """Parse the ``--serve`` port, which needs the next port free as well."""
+    try:
+        number = int(text)
+    except ValueError:
+        number = 0
+    if not 0 < number < 65535:
+        raise argparse.ArgumentTypeError(f"expected a port below 65535, got {text!r}")
+    return number
+
+
+def _address(text: str) -> tuple[str, int]:
+    """Parse ``ADDR:PORT`` into a host and port."""
+    host, _, port = text.rpartition(":")
+    try:
+        number = int(port)
+    except ValueError:
+        number = -1
+    if not host or not 0 < number < 65536:
+        raise argparse.ArgumentTypeError(f"expected ADDR:PORT, got {text!r}")
+    return host, number
 
 
 def _parse_args(argv: list[str]) -> argparse.Namespace:
+    from lightimer.config import MAX_FPS, SERVER_PORT, SYNC_GROUP, SYNC_PORT
+
     parser = argparse.ArgumentParser(description="Lightimer countdown timer")
     parser.add_argument(
         "-l",
@@ -21,15 +71,395 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
         dest="sound_file",
         help="path to a WAV or MP3 file used for the times-up notification",
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "-d",
+        "--duration",
+        type=_duration,
+        metavar="MM:SS",
+        help="countdown duration (default: 05:00)",
+    )
+    parser.add_argument(
+        "--new-instance",
+        dest="new_instance",
+        action="store_true",
+        help="start another timer even if one is running already; otherwise "
+        "--lean, --sound-file and --duration are passed to the running one",
+    )
+    parser.add_argument(
+        "-a",
+        "--agenda",
+        metavar="FILE",
+        help="run a schedule of back-to-back segments, one 'MM:SS [+MM:SS] title' "
+        "per line",
+    )
+    parser.add_argument(
+        "-f",
+        "--fullscreen",
+        action="store_true",
+        help="projector mode: fill the screen with the bar and a large label",
+    )
+    parser.add_argument(
+        "--centiseconds",
+        action="store_true",
+        help="show hundredths of a second (MM:SS.cc) during the last minute",
+    )
+    parser.add_argument(
+        "-w",
+        "--windows",
+        type=_positive,
+        default=1,
+        metavar="N",
+        help="show the timer in N synchronized windows (default: 1)",
+    )
+    parser.add_argument(
+        "--tui",
+        action="store_true",
+        help="draw the timer in the terminal with curses instead of a window, "
+        "e.g. over SSH; the time-up sound is the terminal bell unless "
+        "--sound-file is given",
+    )
+    parser.add_argument(
+        "--max-fps",
+        dest="max_fps",
+        type=_positive,
+        default=MAX_FPS,
+        help=f"upper bound for the redraw rate (default: {MAX_FPS})",
+    )
+    parser.add_argument(
+        "--fixed-rate",
+        dest="fixed_rate",
+        action="store_true",
+        help="redraw at the maximum frame rate instead of only on visible changes",
+    )
+    parser.add_argument(
+        "--serve",
+        nargs="?",
+        type=_serve_port,
+        const=SERVER_PORT,
+        metavar="PORT",
+        help="stream the timer state as JSON lines on PORT and as server-sent "
+        "events on PORT+1 (default: %(const)s)",
+    )
+    sync = parser.add_mutually_exclusive_group()
+    sync.add_argument(
+        "--lead",
+        action="store_true",
+        help="multicast the timer state so that --follow instances on other "
+        "machines show the same countdown",
+    )
+    sync.add_argument(
+        "--follow",
+        action="store_true",
+        help="mirror the timer of a --lead instance on the network",
+    )
+    parser.add_argument(
+        "--sync-group",
+        dest="sync_group",
+        type=_address,
+        default=f"{SYNC_GROUP}:{SYNC_PORT}",
+        metavar="ADDR:PORT",
+        help="multicast group of --lead/--follow (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--journal",
+        nargs="?",
+        const=os.path.join(os.path.expanduser("~"), ".lightimer-journal"),
+        metavar="PATH",
+        help="keep the timer state in a journal file and resume from it after "
+        "a crash or restart (default: %(const)s)",
+    )
+    history = os.path.join(os.path.expanduser("~"), ".lightimer-history.db")
+    parser.add_argument(
+        "--history",
+        nargs="?",
+        const=history,
+        metavar="PATH",
+        help="keep a history of talks (duration, overrun, pauses) in an SQLite "
+        "database (default: %(const)s)",
+    )
+    parser.add_argument(
+        "--history-stats",
+        dest="history_stats",
+        nargs="?",
+        const=history,
+        metavar="PATH",
+        help="print overrun and pause statistics of the talk history and exit "
+        "(default: %(const)s)",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        help="record input events and timer transitions to PATH; replay the "
+        "session with python -m lightimer.replay PATH",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="lightimer-profile.txt",
+        metavar="PATH",
+        help="record frame timings and write a latency report to PATH on exit "
+        "(default: %(const)s)",
+    )
+    parser.add_argument(
+        "--startup-profile",
+        dest="startup_profile",
+        action="store_true",
+        help="print the time spent in each start-up phase to stderr",
+    )
+    args = parser.parse_args(argv)
+    if args.tui:
+        window_only = {
+            "--agenda": args.agenda,
+            "--fullscreen": args.fullscreen,
+            "--centiseconds": args.centiseconds,
+            "--windows": args.windows != 1,
+            "--serve": args.serve is not None,
+            "--lead": args.lead,
+            "--follow": args.follow,
+            "--journal": args.journal,
+            "--record": args.record,
+            "--profile": args.profile,
+        }
+        used = [option for option, value in window_only.items() if value]
+        if used:
+            parser.error(f"--tui cannot be combined with {', '.join(used)}")
+    return args
+
+
+def _run_tui(args: argparse.Namespace, history: Any, profile: Any) -> None:
+    from lightimer.tui import TerminalApp
+
+    app = TerminalApp(
+        lean=args.lean,
+        sound_file=args.sound_file,
+        adaptive=not args.fixed_rate,
+        max_fps=args.max_fps,
+    )
+    if args.duration is not None:
+        app.set_duration(args.duration)
+    profile.mark("build terminal app")
+    if args.startup_profile:
+        print(profile.report(), file=sys.stderr)
+
+    tracker = None
+    if history is not None:
+        from lightimer.history import SessionTracker
+
+        tracker = SessionTracker(history.add)
+        app.timer.listeners.append(tracker)
+    app.run()
+    if tracker is not None:
+        tracker.finish()
+        history.close()
 
 
 def main() -> None:
+    from lightimer.startup import StartupProfile
+
+    profile = StartupProfile(start=_START)
     args = _parse_args(sys.argv[1:])
+    profile.mark("parse arguments")
+
+    if args.history_stats:
+        import sqlite3
+
+        from lightimer import history
+
+        try:
+            print(history.report(history.stats(args.history_stats)))
+        except (sqlite3.Error, OSError) as exc:
+            sys.exit(f"Cannot read history {args.history_stats}: {exc}")
+        return
+
+    claimed = None
+    if not (args.tui or args.new_instance):
+        from lightimer import instance as single
+
+        sock = single.claim()
+        if sock is None:
+            # The instance may run in another directory
+            sound_file = args.sound_file and os.path.abspath(args.sound_file)
+            launch = single.Launch(args.lean, sound_file, args.duration)
+            if single.forward(launch):
+                print("Lightimer is already running; passed on to it.", file=sys.stderr)
+                return
+            # The port is held by something else: run without the check
+        else:
+            claimed = sock
+
+    history = None
+    if args.history:
+        import sqlite3
+
+        from lightimer.history import HistoryStore
+
+        try:
+            history = HistoryStore(args.history)
+        except (sqlite3.Error, OSError) as exc:
+            sys.exit(f"Cannot open history {args.history}: {exc}")
+
+    if args.tui:
+        _run_tui(args, history, profile)
+        return
+
+    # Only what is needed to draw the first frame is imported up front;
+    # pygame and the sound are loaded by the app once the bar is visible.
+    import tkinter as tk
+
+    from lightimer.ui import LightimerApp
+    from lightimer.utils import enable_dpi_awareness
+
+    agenda = None
+    if args.agenda:
+        from lightimer.agenda import Agenda
+
+        try:
+            agenda = Agenda.load(args.agenda)
+        except (OSError, ValueError) as exc:
+            sys.exit(f"Cannot load agenda {args.agenda}: {exc}")
+
+    journal = None
+    if args.journal:
+        from lightimer.journal import Journal
+
+        try:
+            journal = Journal(args.journal)
+        except (OSError, ValueError) as exc:
+            sys.exit(f"Cannot open journal {args.journal}: {exc}")
+
+    recorder = None
+    if args.record:
+        from lightimer.recorder import Recorder
+
+        try:
+            recorder = Recorder(args.record)
+        except OSError as exc:
+            sys.exit(f"Cannot record to {args.record}: {exc}")
+
+    profiler = None
+    if args.profile:
+        from lightimer.profiler import FrameProfiler
+
+        profiler = FrameProfiler(late_after=1 / args.max_fps)
+    profile.mark("import modules")
+    enable_dpi_awareness()
     root = tk.Tk()
-    app = LightimerApp(master=root, lean=args.lean, sound_file=args.sound_file)
+    profile.mark("create Tk root")
+    app = LightimerApp(
+        master=root,
+        lean=args.lean,
+        sound_file=args.sound_file,
+        adaptive=not args.fixed_rate,
+        max_fps=args.max_fps,
+        defer_assets=True,
+        profiler=profiler,
+        agenda=agenda,
+        windows=args.windows,
+        journal=journal,
+        fullscreen=args.fullscreen,
+        recorder=recorder,
+        centiseconds=args.centiseconds,
+    )
+    profile.mark("build window")
+    if args.duration is not None:
+        app.set_duration(args.duration)
+    tracker = None
+    if history is not None:
+        from lightimer.history import SessionTracker
+
+        tracker = SessionTracker(history.add)
+        app.timer.listeners.append(tracker)
+    root.update()
+    profile.mark("first frame")
+    app.load_assets()
+    profile.mark("load icon, start audio")
+
+    server = None
+    if args.serve is not None:
+        from lightimer.server import StateServer
+
+        def dispatch(command: str, seconds: float | None) -> None:
+            # Runs on the server thread; the UI thread picks it up
+            app.post(app.handle_command, command, seconds)
+
+        server = StateServer(app.timer, dispatch, port=args.serve)
+        server.start()
+
+    instance = None
+    if claimed is not None:
+        from lightimer.instance import InstanceServer, Launch
+
+        def launched(launch: Launch) -> None:
+            # Runs on the instance thread, like dispatch() above
+            app.post(app.apply_launch, launch)
+
+        instance = InstanceServer(claimed, launched)
+        instance.start()
+
+    sync = None
+    if args.lead or args.follow:
+        from lightimer import sync as lightimer_sync
+
+        group, port = args.sync_group
+        if args.lead:
+            sync = lightimer_sync.SyncLeader(app.timer, group=group, port=port)
+        else:
+
+            def follow(*state_at) -> None:
+                # Runs on the sync thread, like dispatch() above
+                app.post(app.follow, *state_at)
+
+            sync = lightimer_sync.SyncFollower(
+                follow, clock=app.timer.clock, group=group, port=port
+            )
+        sync.start()
+
+    if args.startup_profile:
+        import threading
+
+        def report() -> None:
+            profile.mark("preload sound")
+            print(profile.report(), file=sys.stderr)
+
+        def await_sound() -> None:
+            # Waits off the UI thread, which keeps handling events meanwhile
+            app.audio.ready.wait(timeout=10.0)
+            app.post(report)
+
+        threading.Thread(
+            target=await_sound, name="lightimer-profile", daemon=True
+        ).start()
+
+    if args.startup_profile or any(
+        thread is not None for thread in (server, instance, sync)
+    ):
+        app.poll_posts()
+
     app.mainloop()
 
+    if instance is not None:
+        instance.close()
+    if server is not None:
+        server.close()
+    if sync is not None:
+        sync.close()
+
+    if journal is not None:
+        journal.close()
+    if recorder is not None:
+        recorder.close()
+    if tracker is not None:
+        tracker.finish()
+        history.close()
+
+    if profiler is not None:
+        profiler.dump(args.profile)
+
 
 if __name__ == "__main__":
+    if getattr(sys, "frozen", False):
+        import multiprocessing
+
+        # The audio helper process starts this executable again
+        multiprocessing.freeze_support()
     main()
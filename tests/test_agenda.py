@@ -0,0 +1,129 @@
+"""Unit tests for lightimer.agenda."""
+
+import unittest
+from unittest import mock
+
+from lightimer.agenda import Agenda, Segment
+from lightimer.headless import HeadlessRoot, RecordingCanvas
+from lightimer.ui import LightimerApp
+
+SCHEDULE = """
+# lightning talks
+05:00 +01:00 Opening
+03:30 Second talk
+10:00 +00:30 Keynote
+"""
+
+
+class TestAgenda(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cut = Agenda.parse(SCHEDULE)
+
+    # ── parsing ───────────────────────────────────────────────────────
+
+    def test_parse(self) -> None:
+        self.assertEqual(
+            self.cut.segments,
+            (
+                Segment("Opening", 300, 60),
+                Segment("Second talk", 210, 0),
+                Segment("Keynote", 600, 30),
+            ),
+        )
+        self.assertEqual(self.cut.total, 1200)
+
+    def test_parse_errors_name_the_line(self) -> None:
+        with self.assertRaisesRegex(ValueError, "line 2: expected MM:SS"):
+            Agenda.parse("05:00 A\n5 minutes B")
+        with self.assertRaisesRegex(ValueError, "seconds out of range"):
+            Agenda.parse("04:75 A")
+        with self.assertRaisesRegex(ValueError, "line 3: zero duration '00:00'"):
+            Agenda.parse("05:00 A\n\n00:00 +01:00 B")
+        with self.assertRaises(ValueError):
+            Agenda.parse("# nothing")
+
+    # ── lookup ────────────────────────────────────────────────────────
+
+    def test_locate(self) -> None:
+        self.assertEqual(self.cut.locate(0), (0, False, 0, 300, 300))
+        self.assertEqual(self.cut.locate(330), (0, True, 30, 30, 60))
+        self.assertEqual(self.cut.locate(360), (1, False, 0, 210, 210))
+        self.assertEqual(self.cut.locate(1200), (2, True, 30, 0, 30))
+        self.assertEqual(self.cut.locate(-5).index, 0)
+
+    def test_start_of(self) -> None:
+        self.assertEqual([self.cut.start_of(i) for i in range(3)], [0, 360, 570])
+
+    def test_large_agenda_seeks_in_log_time(self) -> None:
+        agenda = Agenda(Segment(f"talk {i}", 300, 30) for i in range(1000))
+        comparisons = 0
+
+        class Start(float):
+            """A slot start that counts the comparisons of the search."""
+
+            def __lt__(self, other: float) -> bool:
+                nonlocal comparisons
+                comparisons += 1
+                return float(self) < other
+
+            def __gt__(self, other: float) -> bool:
+                nonlocal comparisons
+                comparisons += 1
+                return float(self) > other
+
+        agenda._starts = [Start(t) for t in agenda._starts]
+        for i in range(10_000):
+            slot = agenda.locate(i * 33.0)
+        self.assertEqual(slot.index, 999)
+        # Binary search over 2000 slots: at most 11 comparisons a seek
+        self.assertLessEqual(comparisons, 11 * 10_000)
+        self.assertGreater(comparisons, 0)
+
+
+class TestAgendaApp(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.app = LightimerApp(
+            self.root,
+            defer_assets=True,
+            clock=self.root.clock,
+            canvas_factory=RecordingCanvas,
+            agenda=Agenda.parse(SCHEDULE),
+        )
+        self.app.audio = mock.Mock()
+        self.canvas = self.app.canvas
+
+    def _label(self) -> str:
+        return self.canvas.itemcget(self.app.text, "text")
+
+    def test_segments_advance_without_input(self) -> None:
+        self.assertEqual(self.root.title(), "Lightimer — 1/3 Opening")
+        self.canvas.key("space", " ")
+        self.root.advance(301)
+        self.assertEqual(
+            self.root.title(), "Lightimer — changeover, next: Second talk"
+        )
+        self.assertEqual(self._label(), "00:59")
+        self.app.audio.play.assert_called_once()
+        self.root.advance(60)
+        self.assertEqual(self.root.title(), "Lightimer — 2/3 Second talk")
+        self.assertEqual(self._label(), "03:29")
+
+    def test_page_down_skips_to_next_segment(self) -> None:
+        self.canvas.key("Next")
+        self.assertEqual(self.root.title(), "Lightimer — 2/3 Second talk")
+        self.assertEqual(self._label(), "03:30")
+        self.canvas.key("Prior")
+        self.assertEqual(self._label(), "05:00")
+        self.app.audio.play.assert_not_called()
+
+    def test_typing_a_duration_leaves_agenda_mode(self) -> None:
+        self.canvas.type("1")
+        self.root.update()
+        self.assertIsNone(self.app.agenda)
+        self.assertEqual(self.root.title(), "Lightimer")
+        self.assertEqual(self.app.duration, 600)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Unit tests for lightimer.colors.ColorTable."""
+
+import unittest
+
+from lightimer.colors import ColorTable
+from lightimer.config import FADE_STEPS, RGB_MAX
+from lightimer.utils import interpolate_color
+
+
+def _formatted(elapsed: float, remaining: float, half: float) -> str:
+    """The gradient colour as it used to be formatted on every frame."""
+    red = int(round(min(RGB_MAX, (elapsed / half) * RGB_MAX)))
+    green = max(0, int(round(min(RGB_MAX, (remaining / half) * RGB_MAX))))
+    return f"#{red:02x}{green:02x}00"
+
+
+class TestColorTable(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.cut = ColorTable()
+
+    # ── gradient ──────────────────────────────────────────────────────
+
+    def test_gradient_matches_formatted_colors(self) -> None:
+        for duration in (1, 7.3, 300, 5999):
+            half = duration / 2
+            for i in range(10_001):
+                elapsed = duration * i / 10_000
+                remaining = duration - elapsed
+                index = self.cut.index(elapsed, remaining, half)
+                self.assertEqual(
+                    self.cut.color(index), _formatted(elapsed, remaining, half)
+                )
+
+    def test_gradient_end_points(self) -> None:
+        self.assertEqual(self.cut.gradient[0], "#00ff00")
+        self.assertEqual(self.cut.gradient[RGB_MAX], "#ffff00")
+        self.assertEqual(self.cut.gradient[-1], "#ff0000")
+
+    # ── fade ──────────────────────────────────────────────────────────
+
+    def test_fade_matches_interpolation(self) -> None:
+        fracs = [i / 1000 for i in range(1000)] + [1 / 3, 0.5 - 1e-12, 1 - 1e-9]
+        for index, color in enumerate(self.cut.gradient):
+            for frac in fracs:
+                self.assertEqual(
+                    self.cut.fade(index, frac), interpolate_color(color, frac)
+                )
+
+    def test_quantised_fade_matches_interpolation_on_steps(self) -> None:
+        table = ColorTable(fade_steps=FADE_STEPS)
+        self.assertEqual(len(table.fades), len(table.gradient) * FADE_STEPS)
+        for index, color in enumerate(table.gradient):
+            for shade in range(FADE_STEPS):
+                frac = shade / FADE_STEPS
+                self.assertEqual(
+                    table.fade(index, frac), interpolate_color(color, frac)
+                )
+
+    def test_quantised_fade_stays_within_index(self) -> None:
+        table = ColorTable(fade_steps=FADE_STEPS)
+        self.assertEqual(table.fade(0, 0.9999), table.fade(0, 1 - 1e-9))
+        self.assertNotEqual(table.fade(0, 0.9999), table.fade(1, 0.0))
+
+    # ── resolution ────────────────────────────────────────────────────
+
+    def test_custom_resolution(self) -> None:
+        coarse = ColorTable(steps=8, fade_steps=4)
+        self.assertEqual(len(coarse.gradient), 17)
+        self.assertEqual(len(coarse.fades), 17 * 4)
+        self.assertEqual(coarse.color(coarse.index(0, 10, 5)), "#00ff00")
+        self.assertEqual(coarse.color(coarse.index(10, 0, 5)), "#ff0000")
+
+
+if __name__ == "__main__":
+    unittest.main()
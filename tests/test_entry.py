@@ -0,0 +1,134 @@
+"""Tests for lightimer.entry, including an exhaustive search of key sequences."""
+
+import unittest
+
+from lightimer.config import INIT_DURATION_S
+from lightimer.entry import _MULTIPLIERS, BLANK, NUM_DIGITS, Entry, clear, press
+
+CLEAR = -1  # any key that abandons the entry: start, reset, a new duration
+KEYS = tuple(range(10)) + (CLEAR,)
+MAX_LENGTH = 8
+
+
+def step(entry: Entry, key: int) -> Entry:
+    return clear(entry) if key == CLEAR else press(entry, key)
+
+
+def check_state(entry: Entry) -> None:
+    position, digits = entry.position, entry.digits
+    assert 0 <= position < NUM_DIGITS, entry
+    typed = [d != BLANK for d in digits]
+    if position:
+        assert typed == [i < position for i in range(NUM_DIGITS)], entry
+    else:
+        assert all(typed) or not any(typed), entry
+    assert all(BLANK <= d <= 9 for d in digits), entry
+    assert digits[2] <= 5, entry
+    assert entry.entered == sum(
+        d * m for d, m in zip(digits, _MULTIPLIERS) if d != BLANK
+    ), entry
+    assert entry.duration > 0, entry
+    if entry.entered:
+        assert entry.duration == entry.entered, entry
+    # What is shown is what was entered, blanks counting as zeroes
+    label = entry.label
+    assert len(label) == 5 and label[2] == ":", entry
+    minutes, seconds = label.replace("-", "0").split(":")
+    assert int(minutes) * 60 + int(seconds) == entry.entered, entry
+
+
+def check_step(before: Entry, key: int, after: Entry) -> None:
+    if key == CLEAR:
+        assert after == Entry(before.duration), (before, after)
+        return
+    if before.position == 2 and key > 5:
+        assert after is before, (before, key)
+        return
+    assert after.position == (before.position + 1) % NUM_DIGITS, (before, key)
+    assert after.digits[before.position] == key, (before, key)
+    if before.position:
+        assert after.digits[: before.position] == before.digits[: before.position]
+    if not after.entered:
+        assert after.duration == before.duration, (before, key)
+
+
+def explore(start: Entry, max_length: int) -> tuple[int, int, int]:
+    """Check every sequence of up to *max_length* keys from *start*.
+
+    Entries are values, so sequences that reach the same entry continue
+    identically: each distinct entry is expanded once (breadth first),
+    which covers all ``len(KEYS) ** n`` sequences of each length *n*.
+    Returns the number of distinct entries, of transitions checked and of
+    entries first reached by a sequence of *max_length* keys.
+    """
+    check_state(start)
+    seen = {start}
+    frontier = [start]
+    transitions = 0
+    for _ in range(max_length):
+        successors = []
+        for entry in frontier:
+            for key in KEYS:
+                after = step(entry, key)
+                transitions += 1
+                check_step(entry, key, after)
+                if after not in seen:
+                    check_state(after)
+                    seen.add(after)
+                    successors.append(after)
+        frontier = successors
+    return len(seen), transitions, len(frontier)
+
+
+class TestEntry(unittest.TestCase):
+    def test_digits_fill_from_the_left(self) -> None:
+        entry = Entry(300)
+        for digit, label, duration in (
+            (1, "1-:--", 600),
+            (2, "12:--", 720),
+            (3, "12:3-", 750),
+            (4, "12:34", 754),
+        ):
+            entry = press(entry, digit)
+            self.assertEqual((entry.label, entry.duration), (label, duration))
+        self.assertFalse(entry.typing)
+
+    def test_fifth_digit_starts_a_new_entry(self) -> None:
+        entry = Entry(300)
+        for digit in (1, 2, 3, 4, 5):
+            entry = press(entry, digit)
+        self.assertEqual((entry.label, entry.duration), ("5-:--", 3000))
+
+    def test_tens_of_seconds_above_five_are_ignored(self) -> None:
+        entry = press(press(Entry(300), 0), 1)
+        self.assertIs(press(entry, 6), entry)
+        self.assertEqual(press(entry, 5).label, "01:5-")
+
+    def test_all_zero_entry_keeps_the_duration(self) -> None:
+        entry = Entry(300)
+        for _ in range(NUM_DIGITS):
+            entry = press(entry, 0)
+        self.assertEqual((entry.label, entry.duration), ("00:00", 300))
+
+    def test_clear_keeps_the_duration(self) -> None:
+        entry = clear(press(Entry(300), 2))
+        self.assertEqual(entry, Entry(1200))
+        self.assertEqual(entry.label, "--:--")
+
+    def test_every_sequence_up_to_eight_keys(self) -> None:
+        sequences = sum(len(KEYS) ** n for n in range(MAX_LENGTH + 1))
+        self.assertGreater(sequences, 200_000_000)
+        for start in (Entry(INIT_DURATION_S), Entry(0.5)):
+            distinct, transitions, new = explore(start, MAX_LENGTH + 1)
+            # One more key reaches nothing new, so the entries checked are
+            # all there are and the invariants hold for sequences of any
+            # length
+            self.assertEqual(new, 0)
+            # Each entry is expanded once: the work is a tiny fraction of
+            # enumerating the sequences
+            self.assertEqual(transitions, len(KEYS) * distinct)
+            self.assertLess(transitions, sequences // 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""Tests for lightimer.glyphs."""
+
+import unittest
+
+from lightimer.glyphs import CHARS, GlyphAtlas, GlyphCache, glyph_height, layout
+from lightimer.headless import HeadlessImage
+
+
+class TestGlyphs(unittest.TestCase):
+    def test_label_fits_a_4k_screen(self) -> None:
+        height = glyph_height(3840, 2160)
+        corners = layout("12:34", height, 3840, 2160)
+        self.assertGreater(height, 1000)
+        self.assertGreaterEqual(corners[0][0], 0)
+        self.assertLessEqual(corners[-1][0] + round(0.55 * height), 3840)
+        self.assertEqual(corners[0][1], (2160 - height) // 2)
+
+    def test_narrow_screen_limits_height(self) -> None:
+        self.assertLess(glyph_height(400, 2160), 200)
+
+    def test_atlas_renders_segments(self) -> None:
+        atlas = GlyphAtlas(80, "#777777", HeadlessImage)
+        self.assertEqual(set(atlas.images), set(CHARS))
+        self.assertEqual(len(atlas.images["8"].puts), 7)
+        self.assertEqual(len(atlas.images["1"].puts), 2)
+        self.assertEqual(len(atlas.images[":"].puts), 2)
+        self.assertEqual(len(atlas.images["."].puts), 1)
+        self.assertEqual(atlas.images["0"].width(), 44)
+        for color, rect in atlas.images["8"].puts:
+            self.assertEqual(color, "#777777")
+            self.assertTrue(0 <= rect[0] < rect[2] <= 44)
+            self.assertTrue(0 <= rect[1] < rect[3] <= 80)
+
+    def test_cache_builds_each_atlas_once(self) -> None:
+        built = []
+
+        def factory(**size):
+            built.append(size)
+            return HeadlessImage(**size)
+
+        cache = GlyphCache(factory)
+        first = cache.get(100, "#777777")
+        self.assertIs(cache.get(100, "#777777"), first)
+        self.assertEqual(len(built), len(CHARS))
+        cache.get(100, "red")
+        self.assertEqual(len(cache), 2)
+        cache.clear()
+        self.assertIsNot(cache.get(100, "#777777"), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
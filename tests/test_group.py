@@ -0,0 +1,125 @@
+"""Tests for lightimer.group.TimerGroup."""
+
+import unittest
+
+from lightimer.group import TimerGroup
+from lightimer.headless import HeadlessRoot
+
+
+class TestTimerGroup(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.group = TimerGroup(clock=self.root.clock, scheduler=self.root)
+        self.events: list[tuple] = []
+        self.group.listeners.append(self._on_event)
+
+    def _on_event(self, key, event: str, timer) -> None:
+        self.events.append((key, event, self.root.clock()))
+
+    def _timesups(self) -> list[tuple]:
+        return [(key, t) for key, event, t in self.events if event == "timesup"]
+
+    def test_timers_expire_at_their_deadlines(self) -> None:
+        for key, period in (("a", 30), ("b", 10), ("c", 20)):
+            self.group.add(key, period).start()
+        self.root.advance(60)
+        self.assertEqual(
+            [(k, round(t, 3)) for k, t in self._timesups()],
+            [("b", 10), ("c", 20), ("a", 30)],
+        )
+        self.assertTrue(all(self.group[k].get_remaining() <= 0 for k in "abc"))
+
+    def test_one_wakeup_at_a_time(self) -> None:
+        for i in range(100):
+            self.group.add(i, 10 + i).start()
+        self.assertEqual(self.root.pending(), 1)
+        frames = self.root.advance(200)
+        self.assertEqual(frames, 100)
+        self.assertEqual(self.root.pending(), 0)
+
+    def test_stopped_timer_does_not_expire(self) -> None:
+        self.group.add("a", 10).start()
+        self.group.add("b", 20).start()
+        self.root.advance(5)
+        self.group["a"].stop()
+        self.root.advance(10)
+        self.group["a"].start()  # 5 s left
+        self.root.advance(30)
+        self.assertEqual(
+            [(k, round(t, 3)) for k, t in self._timesups()], [("b", 20), ("a", 20)]
+        )
+
+    def test_reset_set_and_remove(self) -> None:
+        self.group.add("a", 10).start()
+        self.group.add("b", 10).start()
+        self.group.add("c", 10).start()
+        self.root.advance(5)
+        self.group["a"].reset()
+        self.group["b"].set(60)
+        self.group.remove("c")
+        self.root.advance(100)
+        self.assertEqual(self._timesups(), [])
+        self.assertNotIn("c", self.group)
+        self.assertEqual(len(self.group), 2)
+
+    def test_key_added_again_ignores_its_old_deadline(self) -> None:
+        group = TimerGroup(clock=self.root.clock)
+        group.add("a", 10).start()
+        group.remove("a")
+        group.add("a", 100).start()
+        self.root.clock.advance(11)
+        self.assertEqual(group.expire_due(), [])
+        self.assertAlmostEqual(group["a"].get_remaining(), 89, places=3)
+
+    def test_compaction_while_expiring(self) -> None:
+        group = TimerGroup(clock=self.root.clock)
+        for i in range(100):
+            group.add(i, 10).start()
+        waiting = [group.add(f"w{i}", 1000) for i in range(10)]
+        # Stale entries just short of a rebuild, so expiring compacts
+        while group.pending() < 2 * 110 + 60:
+            for timer in waiting:
+                timer.stop()
+                timer.start()
+        heap = group._heap
+        self.root.clock.advance(11)
+        self.assertEqual(group.expire_due(), list(range(100)))
+        self.assertIsNot(group._heap, heap)
+        self.assertEqual(group.pending(), 10)
+        self.root.clock.advance(1000)
+        self.assertEqual(len(group.expire_due()), 10)
+
+    def test_earlier_deadline_reschedules_the_wakeup(self) -> None:
+        self.group.add("long", 100).start()
+        self.root.advance(1)
+        self.group.add("short", 5).start()
+        self.root.advance(10)
+        self.assertEqual([k for k, _ in self._timesups()], ["short"])
+        self.assertAlmostEqual(self.group.next_delay(), 89, places=3)
+
+    def test_stale_entries_are_compacted(self) -> None:
+        timers = [self.group.add(i, 1000) for i in range(10)]
+        for _ in range(100):
+            for timer in timers:
+                timer.start()
+                timer.stop()
+        self.assertLess(self.group.pending(), 100)
+        self.assertIsNone(self.group.next_deadline())
+
+    def test_polling_without_a_scheduler(self) -> None:
+        group = TimerGroup(clock=self.root.clock)
+        group.add("a", 3).start()
+        group.add("b", 1).start()
+        self.assertEqual(group.next_delay(), 1)
+        self.root.clock.advance(2)
+        self.assertEqual(group.expire_due(), ["b"])
+        self.assertEqual(group.next_delay(), 1)
+
+    def test_duplicate_key(self) -> None:
+        self.group.add("a", 1)
+        with self.assertRaises(KeyError):
+            self.group.add("a", 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+"""Tests for lightimer.history."""
+
+import os
+import random
+import sqlite3
+import tempfile
+import unittest
+
+from lightimer.history import (
+    _BY_DURATION,
+    _OVERRUN_AT_RANK,
+    HistoryStore,
+    Session,
+    SessionTracker,
+    report,
+    stats,
+)
+from lightimer.timer import StaticTimer, VirtualClock
+
+
+class TestSessionTracker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = VirtualClock()
+        self.timer = StaticTimer(300, clock=self.clock)
+        self.sessions: list[Session] = []
+        self.tracker = SessionTracker(self.sessions.append, wall=lambda: 1000.0)
+        self.timer.listeners.append(self.tracker)
+
+    def test_overrun_with_a_pause(self) -> None:
+        self.timer.start()
+        self.clock.advance(100)
+        self.timer.stop()
+        self.clock.advance(30)
+        self.timer.start()
+        self.clock.advance(200)
+        self.timer.expire()
+        self.clock.advance(15)
+        self.timer.reset()
+        self.assertEqual(self.sessions, [Session(1000.0, 300, 315, 15, 1, 30)])
+
+    def test_talk_ended_early(self) -> None:
+        self.timer.start()
+        self.clock.advance(120)
+        self.timer.set(600)
+        self.assertEqual(self.sessions, [Session(1000.0, 300, 120, 0, 0, 0)])
+
+    def test_unstarted_timer_records_nothing(self) -> None:
+        self.timer.set(600)
+        self.timer.reset()
+        self.tracker.finish()
+        self.assertEqual(self.sessions, [])
+
+    def test_finish_ends_talk_in_progress(self) -> None:
+        self.timer.start()
+        self.clock.advance(50)
+        self.timer.stop()
+        self.clock.advance(10)
+        self.tracker.finish()
+        self.tracker.finish()
+        self.assertEqual(self.sessions, [Session(1000.0, 300, 50, 0, 1, 10)])
+
+
+class TestHistoryStore(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "history.db")
+
+    def test_batched_writes_are_committed(self) -> None:
+        store = HistoryStore(self.path, batch=10)
+        for i in range(25):
+            store.add(Session(i, 300, 300 + i, i, 0, 0))
+        store.flush()
+        with sqlite3.connect(self.path) as db:
+            count = db.execute("SELECT COUNT(*) FROM sessions").fetchone()
+        self.assertEqual(count, (25,))
+        store.add(Session(25, 300, 300, 0, 0, 0))
+        store.close()
+        with sqlite3.connect(self.path) as db:
+            count = db.execute("SELECT COUNT(*) FROM sessions").fetchone()
+        self.assertEqual(count, (26,))
+
+    def test_add_does_not_wait_for_the_disk(self) -> None:
+        store = HistoryStore(self.path, batch=10_000, flush_interval=60)
+        for i in range(1000):
+            store.add(Session(i, 300, 300, 0, 0, 0))
+        # Everything is still queued for the writer thread
+        with sqlite3.connect(self.path) as db:
+            count = db.execute("SELECT COUNT(*) FROM sessions").fetchone()
+        self.assertEqual(count, (0,))
+        store.close()
+        with sqlite3.connect(self.path) as db:
+            count = db.execute("SELECT COUNT(*) FROM sessions").fetchone()
+        self.assertEqual(count, (1000,))
+
+    def test_stats_by_duration(self) -> None:
+        store = HistoryStore(self.path)
+        for overrun in range(100):
+            store.add(Session(0, 300, 300 + overrun, overrun, overrun % 2, 0))
+        store.add(Session(0, 600, 500, 0, 0, 0))
+        store.close()
+        short, long = stats(self.path)
+        self.assertEqual((short.duration, short.talks, short.overran), (300, 100, 99))
+        self.assertEqual(short.mean_overrun, 50)
+        self.assertEqual(short.percentiles, (50, 90, 99))
+        self.assertEqual((short.paused, short.mean_pauses), (50, 0.5))
+        self.assertEqual((long.talks, long.overran), (1, 0))
+        self.assertEqual(long.percentiles, (0, 0, 0))
+        self.assertIn("101 talks, 98.0% overran", report([short, long]))
+
+    def test_stats_of_many_talks(self) -> None:
+        rng = random.Random(1)
+        store = HistoryStore(self.path, batch=1000)
+        for i in range(50_000):
+            duration = rng.choice((300, 600, 1200, 1800))
+            overrun = max(0.0, rng.gauss(0, 60))
+            store.add(Session(i, duration, duration + overrun, overrun, 0, 0))
+        store.close()
+        rows = stats(self.path)
+        self.assertEqual([r.duration for r in rows], [300, 600, 1200, 1800])
+        self.assertEqual(sum(r.talks for r in rows), 50_000)
+
+    def test_stats_read_only_the_covering_index(self) -> None:
+        HistoryStore(self.path).close()
+        with sqlite3.connect(self.path) as db:
+            for query, args in ((_BY_DURATION, ()), (_OVERRUN_AT_RANK, (300, 5))):
+                plan = db.execute(f"EXPLAIN QUERY PLAN {query}", args).fetchall()
+                details = [row[-1] for row in plan]
+                self.assertTrue(
+                    all("COVERING INDEX sessions_duration" in d for d in details),
+                    details,
+                )
+
+    def test_empty_history(self) -> None:
+        HistoryStore(self.path).close()
+        self.assertEqual(report(stats(self.path)), "no talks recorded")
+
+    def test_stats_of_a_missing_file_creates_nothing(self) -> None:
+        with self.assertRaises(sqlite3.OperationalError):
+            stats(self.path)
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
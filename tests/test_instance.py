@@ -0,0 +1,52 @@
+"""Tests for lightimer.instance."""
+
+import socket
+import threading
+import unittest
+
+from lightimer.instance import InstanceServer, Launch, claim, forward
+
+
+class TestInstance(unittest.TestCase):
+    def setUp(self) -> None:
+        sock = claim(port=0)
+        self.assertIsNotNone(sock)
+        self.launches: list[Launch] = []
+        self.received = threading.Event()
+        self.server = InstanceServer(sock, self._dispatch)
+        self.server.start()
+        self.addCleanup(self.server.close)
+
+    def _dispatch(self, launch: Launch) -> None:
+        self.launches.append(launch)
+        self.received.set()
+
+    def test_second_claim_fails(self) -> None:
+        self.assertIsNone(claim(port=self.server.port))
+
+    def test_forward_delivers_the_launch(self) -> None:
+        launch = Launch(lean=True, sound_file="bell.wav", duration=600.0)
+        self.assertTrue(forward(launch, port=self.server.port))
+        self.assertEqual(self.launches, [launch])
+
+    def test_invalid_message_is_ignored(self) -> None:
+        with socket.create_connection(("127.0.0.1", self.server.port)) as sock:
+            sock.sendall(b'{"duration": -5}\n')
+            sock.shutdown(socket.SHUT_WR)
+            self.assertEqual(sock.recv(16), b"")
+        self.assertTrue(forward(Launch(), port=self.server.port))
+        self.assertEqual(self.launches, [Launch()])
+
+    def test_forward_without_instance(self) -> None:
+        port = self.server.port
+        self.server.close()
+        self.assertFalse(forward(Launch(), port=port, timeout=0.5))
+
+    def test_decode_rejects_bad_fields(self) -> None:
+        for data in (b"[]", b"nonsense", b'{"sound_file": 3}', b'{"duration": "1"}'):
+            with self.assertRaises(ValueError):
+                Launch.decode(data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Tests for lightimer.journal.Journal."""
+
+import os
+import tempfile
+import unittest
+
+from lightimer.journal import SIZE, Journal, JournalEntry
+from lightimer.timer import TimerState
+
+
+class TestJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "journal")
+
+    def _open(self) -> Journal:
+        journal = Journal(self.path)
+        self.addCleanup(journal.close)
+        return journal
+
+    def test_new_journal_is_empty(self) -> None:
+        self.assertIsNone(self._open().read())
+        self.assertEqual(os.path.getsize(self.path), SIZE)
+
+    def test_latest_entry_survives_reopening(self) -> None:
+        journal = self._open()
+        journal.write(TimerState(300, 300, False), 1, 10, 20)
+        journal.write(TimerState(300, 250, True), 2, 30, 40)
+        journal.write(TimerState(300, 240, False), 2, 50, 60)
+        entry = self._open().read()
+        self.assertEqual(entry[:3], (300, 240, False))
+        self.assertEqual(entry[4:], (2, 50, 60))
+
+    def test_torn_write_falls_back_to_previous_entry(self) -> None:
+        journal = self._open()
+        journal.write(TimerState(300, 300, False), 1, 0, 0)
+        journal.write(TimerState(300, 100, False), 1, 0, 0)
+        with open(self.path, "r+b") as f:
+            f.seek(10)  # inside the slot of even sequence numbers
+            f.write(b"\xff\xff")
+        self.assertEqual(self._open().read().remaining, 300)
+
+    def test_foreign_file_is_left_alone(self) -> None:
+        for content in (b"my notes", b"x" * SIZE):
+            with open(self.path, "wb") as f:
+                f.write(content)
+            with self.assertRaises(ValueError):
+                Journal(self.path)
+            with open(self.path, "rb") as f:
+                self.assertEqual(f.read(), content)
+
+    def test_empty_file_becomes_a_journal(self) -> None:
+        open(self.path, "wb").close()
+        journal = self._open()
+        journal.write(TimerState(300, 300, False), 1, 0, 0)
+        self.assertEqual(self._open().read().remaining, 300)
+
+    def test_running_entry_keeps_counting(self) -> None:
+        entry = JournalEntry(300, 200, True, wall=1000.0, orientation=1, x=0, y=0)
+        self.assertEqual(entry.state(now=1050.0), TimerState(300, 150, True))
+        paused = entry._replace(running=False)
+        self.assertEqual(paused.state(now=1050.0), TimerState(300, 200, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
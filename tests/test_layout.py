@@ -0,0 +1,53 @@
+"""Tests for lightimer.layout."""
+
+import unittest
+
+from lightimer.config import Orientation
+from lightimer.headless import HeadlessRoot
+from lightimer.layout import base_size, compute_layout, dpi_scale
+
+
+class TestLayout(unittest.TestCase):
+    def test_default_size_matches_classic_layout(self) -> None:
+        layout = compute_layout(116, 800, Orientation.VERTICAL, platform="linux")
+        self.assertEqual(layout.axis, 800)
+        self.assertEqual((layout.text_x, layout.text_y), (58, 20))
+        self.assertEqual(layout.font, ("Helvetica", 24))
+        self.assertEqual(layout.lead, 1)
+
+    def test_horizontal_axis_is_the_width(self) -> None:
+        layout = compute_layout(1000, 50, Orientation.HORIZONTAL)
+        self.assertEqual(layout.axis, 1000)
+
+    def test_label_grows_but_never_shrinks(self) -> None:
+        big = compute_layout(348, 2400, Orientation.VERTICAL)
+        small = compute_layout(60, 400, Orientation.VERTICAL)
+        self.assertEqual(big.font[1], 72)
+        self.assertEqual(small.font[1], 24)
+
+    def test_fraction_follows_the_label(self) -> None:
+        vertical = compute_layout(116, 800, Orientation.VERTICAL, platform="linux")
+        self.assertEqual(vertical.fraction_x, vertical.text_x)
+        self.assertGreater(vertical.fraction_y, vertical.text_y)
+        self.assertEqual(vertical.fraction_anchor, "n")
+        horizontal = compute_layout(1000, 50, Orientation.HORIZONTAL)
+        self.assertAlmostEqual(horizontal.fraction_x, 540, delta=1)
+        self.assertEqual(horizontal.fraction_anchor, "w")
+        self.assertEqual(horizontal.fraction_font, ("Courier", 14))
+
+    def test_layouts_are_cached(self) -> None:
+        compute_layout.cache_clear()
+        for _ in range(3):
+            compute_layout(300, 900, Orientation.VERTICAL, 1.5)
+        info = compute_layout.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+
+    def test_scale(self) -> None:
+        self.assertEqual(base_size(Orientation.VERTICAL, 1.5), (174, 1200))
+        self.assertEqual(dpi_scale(HeadlessRoot(dpi=144)), 1.5)
+        self.assertEqual(dpi_scale(HeadlessRoot(dpi=72)), 1.0)
+        self.assertEqual(dpi_scale(object()), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""Smoke tests for the command line in main.py."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import main
+from lightimer.timer import StaticTimer
+
+
+class _StubTerminalApp:
+    """Stands in for :class:`~lightimer.tui.TerminalApp`; runs no terminal."""
+
+    instances: list["_StubTerminalApp"] = []
+
+    def __init__(self, **options) -> None:
+        self.options = options
+        self.timer = StaticTimer(300)
+        self.durations: list[float] = []
+        self.ran = False
+        _StubTerminalApp.instances.append(self)
+
+    def set_duration(self, seconds: float) -> None:
+        self.durations.append(seconds)
+
+    def run(self) -> None:
+        self.ran = True
+
+
+@mock.patch("lightimer.tui.TerminalApp", _StubTerminalApp)
+class TestMain(unittest.TestCase):
+    def setUp(self) -> None:
+        _StubTerminalApp.instances.clear()
+
+    def _main(self, *argv: str) -> _StubTerminalApp:
+        with mock.patch("sys.argv", ["lightimer", *argv]):
+            main.main()
+        (app,) = _StubTerminalApp.instances
+        return app
+
+    def test_tui_without_history(self) -> None:
+        app = self._main("--tui", "--new-instance", "-d", "2:30")
+        self.assertTrue(app.ran)
+        self.assertEqual(app.durations, [150.0])
+        self.assertEqual(app.options["max_fps"], 125)
+
+    def test_tui_keeps_a_history(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "history.db")
+            app = self._main("--tui", "--history", path)
+            self.assertTrue(app.ran)
+            self.assertEqual(len(app.timer.listeners), 1)
+            self.assertTrue(os.path.exists(path))
+
+    def test_parse_args_rejects_window_options_with_tui(self) -> None:
+        with mock.patch("sys.stderr"), self.assertRaises(SystemExit):
+            main._parse_args(["--tui", "--fullscreen"])
+
+    def test_duration_takes_plain_minutes_and_seconds(self) -> None:
+        for text, seconds in (("2:30", 150.0), ("90", 90.0), ("00:05", 5.0)):
+            self.assertEqual(main._parse_args(["-d", text]).duration, seconds)
+        for text in ("1:-5", "-1:90", "-30", "1:60", "0:00", "1:", "+1:00", " 1:00"):
+            with mock.patch("sys.stderr"), self.assertRaises(SystemExit):
+                main._parse_args(["-d", text])
+
+    def test_windows_must_be_positive(self) -> None:
+        self.assertEqual(main._parse_args(["-w", "3"]).windows, 3)
+        for text in ("0", "-3"):
+            with mock.patch("sys.stderr"), self.assertRaises(SystemExit):
+                main._parse_args(["-w", text])
+
+    def test_max_fps_must_be_positive(self) -> None:
+        self.assertEqual(main._parse_args(["--max-fps", "30"]).max_fps, 30)
+        for text in ("0", "-5", "fast"):
+            with mock.patch("sys.stderr"), self.assertRaises(SystemExit):
+                main._parse_args(["--max-fps", text])
+
+    def test_serve_port_leaves_room_for_http(self) -> None:
+        self.assertEqual(main._parse_args(["--serve", "65534"]).serve, 65534)
+        self.assertEqual(main._parse_args(["--serve"]).serve, 47800)
+        for text in ("65535", "0", "-1", "http"):
+            with mock.patch("sys.stderr"), self.assertRaises(SystemExit):
+                main._parse_args(["--serve", text])
+
+    def test_sync_group_is_parsed(self) -> None:
+        args = main._parse_args(["--sync-group", "239.1.2.3:5000"])
+        self.assertEqual(args.sync_group, ("239.1.2.3", 5000))
+        self.assertEqual(main._parse_args([]).sync_group[1], 47810)
+        for text in ("239.1.2.3", "239.1.2.3:x", ":5000", "239.1.2.3:70000"):
+            with mock.patch("sys.stderr"), self.assertRaises(SystemExit):
+                main._parse_args(["--sync-group", text])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""Unit tests for lightimer.profiler.FrameProfiler."""
+
+import os
+import tempfile
+import unittest
+
+from lightimer.headless import HeadlessRoot, RecordingCanvas
+from lightimer.profiler import FrameProfiler
+from lightimer.ui import LightimerApp
+
+
+class TestFrameProfiler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cut = FrameProfiler(capacity=4, late_after=0.008)
+
+    # ── ring buffer ───────────────────────────────────────────────────
+
+    def test_frames_in_recording_order(self) -> None:
+        self.cut.record(1.0, 1.001, 0.0005)
+        self.cut.record(2.0, 2.020, 0.0005)
+        self.assertEqual(
+            self.cut.frames(),
+            [(1.0, 1.001, 0.0005, False), (2.0, 2.020, 0.0005, True)],
+        )
+
+    def test_oldest_frames_are_overwritten(self) -> None:
+        for i in range(10):
+            self.cut.record(float(i), float(i), 0.0)
+        self.assertEqual(self.cut.count, 10)
+        self.assertEqual([f[0] for f in self.cut.frames()], [6.0, 7.0, 8.0, 9.0])
+
+    # ── analysis ──────────────────────────────────────────────────────
+
+    def test_histogram_and_worst(self) -> None:
+        self.cut.record(0.0, 0.0005, 0.0)
+        self.cut.record(1.0, 1.050, 0.0)
+        self.cut.record(2.0, 2.003, 0.0)
+        histogram = dict(self.cut.histogram())
+        self.assertEqual(histogram[1], 1)
+        self.assertEqual(histogram[4], 1)
+        self.assertEqual(histogram[66], 1)
+        self.assertEqual(self.cut.worst(1)[0][0], 1.0)
+
+    def test_dump_writes_report(self) -> None:
+        self.cut.record(1.0, 1.050, 0.001)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "profile.txt")
+            self.cut.dump(path)
+            with open(path, encoding="utf-8") as f:
+                report = f.read()
+        self.assertIn("late frames (> 8.0 ms): 1", report)
+        self.assertIn("50.00", report)
+
+    # ── app integration ───────────────────────────────────────────────
+
+    def test_app_records_every_frame(self) -> None:
+        root = HeadlessRoot()
+        app = LightimerApp(
+            root,
+            defer_assets=True,
+            adaptive=False,
+            clock=root.clock,
+            canvas_factory=RecordingCanvas,
+            profiler=FrameProfiler(),
+        )
+        app.canvas.key("space", " ")
+        frames = root.advance(1.0) + 1
+        self.assertEqual(app.profiler.count, frames)
+        self.assertFalse(any(f[3] for f in app.profiler.frames()))
+
+
+if __name__ == "__main__":
+    unittest.main()
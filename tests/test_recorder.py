@@ -0,0 +1,180 @@
+"""Tests for lightimer.recorder and lightimer.replay."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from lightimer.agenda import Agenda
+from lightimer.headless import HeadlessImage, HeadlessRoot, RecordingCanvas
+from lightimer.instance import Launch
+from lightimer.journal import Journal
+from lightimer.recorder import (
+    CallRecord,
+    InputRecord,
+    Recorder,
+    TransitionRecord,
+    read_log,
+)
+from lightimer.replay import replay
+from lightimer.timer import TimerState
+from lightimer.ui import LightimerApp
+
+
+class TestRecorder(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "session.log")
+        self.root = HeadlessRoot()
+        self.recorder = Recorder(self.path)
+        self.app = LightimerApp(
+            self.root,
+            defer_assets=True,
+            clock=self.root.clock,
+            canvas_factory=RecordingCanvas,
+            recorder=self.recorder,
+        )
+        self.canvas = self.app.canvas
+
+    def _session(self) -> None:
+        """About 30 minutes of a speaker's day."""
+        c, root = self.canvas, self.root
+        c.type("15")
+        root.advance(2)
+        c.key("space", " ")
+        root.advance(600)
+        c.key("space", " ")  # pause for a question
+        root.advance(45)
+        c.type("t")
+        c.mouse("<ButtonPress-1>", x=5, y=5)
+        for i in range(40):
+            c.mouse("<B1-Motion>", x_root=400 + i, y_root=300)
+            root.advance(0.01)
+        c.mouse("<ButtonRelease-1>", x_root=440, y_root=300)
+        c.key("space", " ")
+        root.advance(400)
+        c.key("Return")
+        c.type("1")
+        c.key("space", " ")
+        root.advance(700)  # runs out
+
+    def test_log_contains_inputs_and_transitions(self) -> None:
+        self._session()
+        self.recorder.close()
+        header, records = read_log(self.path)
+        self.assertEqual(header.period, 300)
+        self.assertEqual(header.windows, 1)
+        inputs = [r for r in records if isinstance(r, InputRecord)]
+        transitions = [r for r in records if isinstance(r, TransitionRecord)]
+        self.assertEqual(inputs[0].handler, "_on_change_time")
+        self.assertEqual(inputs[0].char, "1")
+        self.assertEqual(transitions[-1].event, "timesup")
+        self.assertEqual(len(records), self.recorder.records)
+        self.assertLess(os.path.getsize(self.path), 5000)
+
+    def test_replay_matches_on_the_virtual_clock(self) -> None:
+        self._session()
+        self.recorder.close()
+        with mock.patch("time.sleep", side_effect=AssertionError("slept")):
+            result = replay(self.path)
+        self.assertIsNone(result.diverged_at)
+        self.assertGreater(result.virtual_s, 1600)
+        self.assertEqual(result.replayed[-1].event, "timesup")
+
+    def test_replay_reports_divergence(self) -> None:
+        self._session()
+        self.recorder.close()
+        with open(self.path, "r+b") as f:
+            data = bytearray(f.read())
+            # Turn the first typed "1" into a "2"
+            data[data.index(b"\x07\x00" + b"1\x00\x00\x00") + 2] = ord("2")
+            f.seek(0)
+            f.write(data)
+        self.assertIsNotNone(replay(self.path).diverged_at)
+
+    def test_duration_set_after_start_up_is_replayed(self) -> None:
+        # What main() does for -d 10:00 once the app is built
+        self.app.set_duration(600)
+        self.canvas.key("space", " ")
+        self.root.advance(100)
+        self.canvas.key("space", " ")
+        self.app.handle_command("set", 120)
+        self.recorder.close()
+        header, records = read_log(self.path)
+        self.assertEqual(header.period, 300)
+        calls = [(r.name, r.args) for r in records if isinstance(r, CallRecord)]
+        self.assertEqual(
+            calls, [("set_duration", [600]), ("handle_command", ["set", 120])]
+        )
+        result = replay(self.path)
+        self.assertIsNone(result.diverged_at)
+        self.assertEqual(len(result.replayed), len(result.recorded))
+
+    def test_truncated_log_keeps_complete_records(self) -> None:
+        self._session()
+        self.recorder.close()
+        records = read_log(self.path)[1]
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 3)
+        self.assertEqual(read_log(self.path)[1], records[:-1])
+
+
+class TestRecordedOptions(unittest.TestCase):
+    def test_options_and_other_entry_points_are_replayed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            log = os.path.join(tmp, "session.log")
+            agenda = Agenda.parse("05:00 Opening\n03:00 +00:30 Pitch")
+            journal = Journal(os.path.join(tmp, "journal"))
+            journal.write(TimerState(agenda.total, 400.0, False), 0, 10, 20)
+            root = HeadlessRoot(screen=(3840, 2160))
+            recorder = Recorder(log)
+            app = LightimerApp(
+                root,
+                defer_assets=True,
+                clock=root.clock,
+                canvas_factory=RecordingCanvas,
+                image_factory=HeadlessImage,
+                recorder=recorder,
+                agenda=agenda,
+                journal=journal,
+                fullscreen=True,
+                centiseconds=True,
+                adaptive=False,
+                max_fps=30,
+            )
+            root.advance(1)
+            app.handle_command("start")
+            root.advance(30)
+            app.follow(TimerState(agenda.total, 300.0, True), root.clock())
+            root.advance(20)
+            app.apply_launch(Launch(duration=90))
+            app.handle_command("start")
+            root.advance(100)
+            recorder.close()
+            journal.close()
+
+            header, records = read_log(log)
+            self.assertEqual(header.options["agenda"][1], ["Pitch", 180, 30])
+            self.assertTrue(header.options["fullscreen"])
+            self.assertTrue(header.options["centiseconds"])
+            self.assertFalse(header.options["adaptive"])
+            self.assertEqual(header.options["max_fps"], 30)
+            calls = [r.name for r in records if isinstance(r, CallRecord)]
+            self.assertEqual(
+                calls,
+                [
+                    "resume",
+                    "handle_command",
+                    "follow",
+                    "apply_launch",
+                    "handle_command",
+                ],
+            )
+            result = replay(log)
+        self.assertIsNone(result.diverged_at)
+        self.assertEqual(result.replayed[-1].event, "timesup")
+
+
+if __name__ == "__main__":
+    unittest.main()
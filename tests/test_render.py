@@ -0,0 +1,73 @@
+"""Unit tests for lightimer.render.CanvasRenderer."""
+
+import unittest
+
+from lightimer.render import CanvasRenderer
+
+
+class _CallLog:
+    """Stand-in canvas that only logs the calls it receives."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+
+    def coords(self, item, *coords) -> None:
+        self.calls.append(("coords", item, coords))
+
+    def itemconfig(self, item, **options) -> None:
+        self.calls.append(("itemconfig", item, options))
+
+    def update_idletasks(self) -> None:
+        self.calls.append(("update_idletasks",))
+
+
+class TestCanvasRenderer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.canvas = _CallLog()
+        self.cut = CanvasRenderer(self.canvas)
+
+    # ── coords ────────────────────────────────────────────────────────
+
+    def test_repeated_coords_are_skipped(self) -> None:
+        self.cut.coords(1, 0, 10, 116, 800)
+        self.cut.coords(1, 0, 10, 116, 800)
+        self.assertEqual(len(self.canvas.calls), 1)
+        self.assertEqual(self.cut.stats(), {"issued": 1, "skipped": 1})
+
+    def test_changed_coords_are_sent(self) -> None:
+        self.cut.coords(1, 0, 10, 116, 800)
+        self.cut.coords(1, 0, 11, 116, 800)
+        self.assertEqual(self.canvas.calls[-1], ("coords", 1, (0, 11, 116, 800)))
+
+    # ── itemconfig ────────────────────────────────────────────────────
+
+    def test_only_changed_options_are_sent(self) -> None:
+        self.cut.itemconfig(3, text="05:00", fill="#777777")
+        self.cut.itemconfig(3, text="04:59", fill="#777777")
+        self.assertEqual(self.canvas.calls[-1], ("itemconfig", 3, {"text": "04:59"}))
+
+    def test_items_are_tracked_separately(self) -> None:
+        self.cut.itemconfig(1, fill="#00ff00")
+        self.cut.itemconfig(2, fill="#00ff00")
+        self.assertEqual(len(self.canvas.calls), 2)
+
+    def test_invalidate_resends(self) -> None:
+        self.cut.itemconfig(1, fill="#00ff00")
+        self.cut.invalidate()
+        self.cut.itemconfig(1, fill="#00ff00")
+        self.assertEqual(len(self.canvas.calls), 2)
+
+    # ── flush ─────────────────────────────────────────────────────────
+
+    def test_flush_only_after_changes(self) -> None:
+        self.cut.flush()
+        self.assertEqual(self.canvas.calls, [])
+        self.cut.coords(1, 0, 0, 1, 1)
+        self.cut.flush()
+        self.cut.flush()
+        self.assertEqual(self.canvas.calls[-1], ("update_idletasks",))
+        self.assertEqual(self.cut.stats(), {"issued": 2, "skipped": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Unit tests for lightimer.scheduler."""
+
+import unittest
+
+from lightimer.config import RGB_MAX
+from lightimer.scheduler import next_change_delay, next_frame_ms
+from lightimer.timer import StaticTimer
+
+AXIS = 800
+FADE = 16
+
+
+def _frame(elapsed: float, duration: float) -> tuple:
+    """Everything a frame shows, quantised the way the screen sees it."""
+    remaining = duration - elapsed
+    half = duration / 2
+    red = int(round(min(RGB_MAX, (elapsed / half) * RGB_MAX)))
+    green = max(0, int(round(min(RGB_MAX, (remaining / half) * RGB_MAX))))
+    level = int(elapsed * AXIS * FADE / duration)
+    return red, green, level, StaticTimer.format(remaining)
+
+
+class TestNextChangeDelay(unittest.TestCase):
+    # ── budget ────────────────────────────────────────────────────────
+
+    def test_long_slot_sleeps_between_fade_steps(self) -> None:
+        # 20 min on 800 px: one fade step every ~94 ms, the 6th is due next
+        delay = next_change_delay(0.5, 1199.5, 1200.0, AXIS, FADE)
+        self.assertAlmostEqual(delay, 6 * 1200 / (AXIS * FADE) - 0.5, places=4)
+
+    def test_label_tick_bounds_delay(self) -> None:
+        delay = next_change_delay(0.0, 3600.0, 3600.0, 10, 1)
+        self.assertLessEqual(delay, 1.0 + 1e-3)
+
+    def test_centisecond_label_ticks_every_hundredth(self) -> None:
+        delay = next_change_delay(0.0, 59.995, 3600.0, 10, 1, label_step=0.01)
+        self.assertAlmostEqual(delay, 0.005, places=4)
+
+    def test_expired_timer_wakes_immediately(self) -> None:
+        self.assertEqual(next_change_delay(5.0, -0.1, 5.0, AXIS, FADE), 0.0)
+
+    # ── no missed changes ─────────────────────────────────────────────
+
+    def test_nothing_visible_changes_before_delay(self) -> None:
+        duration = 7.3
+        elapsed = 0.0
+        while elapsed < duration - 0.01:
+            delay = next_change_delay(
+                elapsed, duration - elapsed, duration, AXIS, FADE
+            )
+            self.assertGreater(delay, 0)
+            before = _frame(elapsed, duration)
+            # Just short of the wakeup nothing may have changed yet …
+            almost = elapsed + delay * 0.99 - 1e-6
+            self.assertEqual(_frame(almost, duration), before)
+            # … and the wakeup itself must show something new
+            self.assertNotEqual(_frame(elapsed + delay, duration), before)
+            elapsed += delay
+
+    # ── conversion ────────────────────────────────────────────────────
+
+    def test_next_frame_ms_respects_cap(self) -> None:
+        self.assertEqual(next_frame_ms(0.0001, 8), 8)
+        self.assertEqual(next_frame_ms(0.0941, 8), 95)
+
+
+if __name__ == "__main__":
+    unittest.main()
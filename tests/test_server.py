@@ -0,0 +1,137 @@
+"""Tests for lightimer.server.StateServer over loopback sockets."""
+
+import http.client
+import json
+import socket
+import threading
+import unittest
+
+from lightimer.server import StateServer, parse_command
+from lightimer.timer import StaticTimer, TimerState, VirtualClock
+
+
+class TestParseCommand(unittest.TestCase):
+    def test_valid_commands(self) -> None:
+        self.assertEqual(parse_command('{"cmd": "start"}'), ("start", None))
+        self.assertEqual(
+            parse_command(b'{"cmd": "set", "seconds": 90}'), ("set", 90.0)
+        )
+
+    def test_invalid_commands(self) -> None:
+        for data in ("nope", "[]", '{"cmd": "explode"}', '{"cmd": "set"}'):
+            with self.assertRaises(ValueError):
+                parse_command(data)
+
+
+class TestStateServer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = VirtualClock()
+        self.timer = StaticTimer(300, clock=self.clock)
+        self.commands: list[tuple] = []
+        self.cut = StateServer(
+            self.timer, lambda *cmd: self.commands.append(cmd), port=0
+        )
+        self.cut.start()
+        self.addCleanup(self.cut.close)
+
+    def _subscribe(self) -> tuple[socket.socket, object]:
+        sock = socket.create_connection(("127.0.0.1", self.cut.port), timeout=2)
+        self.addCleanup(sock.close)
+        lines = sock.makefile("r", encoding="utf-8")
+        return sock, lines
+
+    # ── JSON lines ────────────────────────────────────────────────────
+
+    def test_subscribers_get_snapshot_then_changes(self) -> None:
+        clients = [self._subscribe() for _ in range(5)]
+        for _, lines in clients:
+            snapshot = json.loads(lines.readline())
+            self.assertEqual(snapshot["event"], "state")
+            self.assertEqual(snapshot["remaining"], 300)
+
+        self.timer.start()
+        self.clock.advance(10)
+        self.timer.stop()
+        for _, lines in clients:
+            self.assertEqual(json.loads(lines.readline())["event"], "start")
+            stopped = json.loads(lines.readline())
+            self.assertEqual(stopped["event"], "stop")
+            self.assertEqual(stopped["remaining"], 290)
+            self.assertFalse(stopped["running"])
+
+    def test_commands_are_dispatched(self) -> None:
+        sock, lines = self._subscribe()
+        lines.readline()
+        sock.sendall(b'{"cmd": "set", "seconds": 120}\n{"cmd": "bogus"}\n')
+        self.assertEqual(json.loads(lines.readline()), {"ok": "set"})
+        self.assertIn("error", json.loads(lines.readline()))
+        self.assertEqual(self.commands, [("set", 120.0)])
+
+    # ── HTTP ──────────────────────────────────────────────────────────
+
+    def _http(self) -> http.client.HTTPConnection:
+        conn = http.client.HTTPConnection("127.0.0.1", self.cut.http_port, timeout=2)
+        self.addCleanup(conn.close)
+        return conn
+
+    def test_http_state_and_command(self) -> None:
+        conn = self._http()
+        conn.request("GET", "/state")
+        self.assertEqual(json.loads(conn.getresponse().read())["period"], 300)
+
+        conn = self._http()
+        conn.request("POST", "/command", body=b'{"cmd": "reset"}')
+        response = conn.getresponse()
+        self.assertEqual(response.status, 200)
+        response.read()
+        self.assertEqual(self.commands, [("reset", None)])
+
+    def test_bad_content_length_is_rejected(self) -> None:
+        for length, body in (("abc", b""), ("-1", b""), ("10", b"{}")):
+            with socket.create_connection(
+                ("127.0.0.1", self.cut.http_port), timeout=2
+            ) as sock:
+                sock.sendall(
+                    b"POST /command HTTP/1.1\r\nContent-Length: "
+                    + length.encode()
+                    + b"\r\n\r\n"
+                    + body
+                )
+                sock.shutdown(socket.SHUT_WR)
+                status = sock.makefile("rb").readline()
+            self.assertEqual(status, b"HTTP/1.1 400 Bad Request\r\n", length)
+        self.assertEqual(self.commands, [])
+
+    def test_state_is_not_read_on_the_server_thread(self) -> None:
+        readers = set()
+        state = self.timer.state
+
+        def traced_state() -> TimerState:
+            readers.add(threading.current_thread())
+            return state()
+
+        self.timer.state = traced_state
+        self.timer.start()
+        self.clock.advance(10)
+        conn = self._http()
+        conn.request("GET", "/state")
+        self.assertEqual(json.loads(conn.getresponse().read())["remaining"], 290)
+        self._subscribe()[1].readline()
+        self.assertEqual(readers, {threading.current_thread()})
+
+    def test_server_sent_events(self) -> None:
+        conn = self._http()
+        conn.request("GET", "/events")
+        response = conn.getresponse()
+        self.assertEqual(response.getheader("Content-Type"), "text/event-stream")
+        self.assertEqual(response.readline(), b"event: state\n")
+        response.readline()  # data
+        response.readline()  # blank separator
+
+        self.timer.expire()
+        self.assertEqual(response.readline(), b"event: timesup\n")
+        self.assertIn(b'"running":false', response.readline())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Unit tests for lightimer.sound.AudioProcess."""
+
+import time
+import unittest
+from unittest import mock
+
+from lightimer.headless import load_silent_sound
+from lightimer.sound import AudioProcess
+
+
+def _broken_loader(path: str) -> None:
+    # Module level, so the audio process can import it
+    raise OSError("no audio device")
+
+
+@mock.patch("lightimer.sound.sys.platform", "linux")
+class TestAudioProcess(unittest.TestCase):
+    def _wait_for_plays(self, player: AudioProcess, count: int) -> None:
+        deadline = time.monotonic() + 5.0
+        while len(player.latencies) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_sound_is_played_by_the_helper(self) -> None:
+        player = AudioProcess("ding.wav", loader=load_silent_sound)
+        player.start()
+        try:
+            self.assertTrue(player.ready.wait(10.0))
+            player.play()
+            player.play()
+            self._wait_for_plays(player, 2)
+        finally:
+            player.close()
+        self.assertEqual(len(player.latencies), 2)
+        self.assertTrue(all(0.0 <= latency < 5.0 for latency in player.latencies))
+        self.assertFalse(player._process.is_alive())
+
+    def test_requests_before_ready_are_kept(self) -> None:
+        player = AudioProcess(loader=load_silent_sound)
+        player.start()
+        player.play()
+        try:
+            self._wait_for_plays(player, 1)
+        finally:
+            player.close()
+        self.assertEqual(len(player.latencies), 1)
+
+    def test_failing_loader_is_reported_here(self) -> None:
+        player = AudioProcess(loader=_broken_loader)
+        with self.assertLogs("lightimer.sound", "ERROR") as logs:
+            player.start()
+            self.assertTrue(player.ready.wait(10.0))
+        self.assertIn("no audio device", logs.output[0])
+        player.play()
+        player.close()
+        self.assertEqual(player.latencies, [])
+
+    def test_close_without_start(self) -> None:
+        player = AudioProcess(loader=load_silent_sound)
+        player.close()
+        player.close()
+        player.play()  # dropped
+        self.assertEqual(player.latencies, [])
+
+    def test_unsupported_platform_spawns_nothing(self) -> None:
+        player = AudioProcess(loader=load_silent_sound)
+        with mock.patch("lightimer.sound.sys.platform", "darwin"):
+            with self.assertLogs("lightimer.sound", "WARNING"):
+                player.start()
+        self.assertTrue(player.ready.is_set())
+        self.assertIsNone(player._process.pid)
+        player.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
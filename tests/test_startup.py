@@ -0,0 +1,30 @@
+"""Unit tests for lightimer.startup.StartupProfile."""
+
+import unittest
+from unittest import mock
+
+from lightimer.startup import StartupProfile
+
+
+class TestStartupProfile(unittest.TestCase):
+    @mock.patch("lightimer.startup.time.perf_counter")
+    def test_phases_are_measured_between_marks(self, clock) -> None:
+        clock.side_effect = [10.0, 10.25, 11.0]
+        cut = StartupProfile()
+        cut.mark("create Tk root")
+        cut.mark("first frame")
+        self.assertEqual(cut.phases, [("create Tk root", 0.25), ("first frame", 0.75)])
+        self.assertEqual(cut.total(), 1.0)
+
+    @mock.patch("lightimer.startup.time.perf_counter", return_value=2.5)
+    def test_report_lists_phases_and_total(self, clock) -> None:
+        cut = StartupProfile(start=2.0)
+        cut.mark("import modules")
+        self.assertEqual(
+            cut.report().splitlines(),
+            ["import modules     500.0 ms", "total              500.0 ms"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+"""Tests for lightimer.sync leader/follower timers on loopback multicast."""
+
+import socket
+import threading
+import time
+import unittest
+
+from lightimer.sync import (
+    PING,
+    STATE,
+    SyncFollower,
+    SyncLeader,
+    apply_state,
+    decode,
+    encode,
+    estimate,
+)
+from lightimer.timer import StaticTimer, TimerState, VirtualClock
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestWireFormat(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        data = encode(STATE, 7, 3, True, 300.0, 120.5, 42.0)
+        self.assertEqual(decode(data), (STATE, 7, 3, True, 300.0, 120.5, 42.0))
+        self.assertEqual(decode(encode(PING, 1, 2, 5.0)), (PING, 1, 2, 5.0))
+
+    def test_rejects_foreign_datagrams(self) -> None:
+        for data in (b"", b"hello world", encode(PING, 1, 2, 5.0)[:-1]):
+            with self.assertRaises(ValueError):
+                decode(data)
+
+    def test_estimate(self) -> None:
+        # Leader is 100 s ahead, 10 ms each way, 1 ms spent in the leader
+        offset, rtt = estimate(0.0, 100.010, 100.011, 0.021)
+        self.assertAlmostEqual(offset, 100.0)
+        self.assertAlmostEqual(rtt, 0.020)
+
+
+class TestApplyState(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = VirtualClock()
+        self.timer = StaticTimer(300, clock=self.clock)
+
+    def test_projects_running_state_to_now(self) -> None:
+        self.clock.advance(5)
+        self.assertTrue(apply_state(self.timer, TimerState(600, 400, True), at=2))
+        self.assertTrue(self.timer.is_running)
+        self.assertAlmostEqual(self.timer.get_remaining(), 397)
+
+    def test_leaves_timer_in_tolerance_alone(self) -> None:
+        self.timer.start()
+        self.clock.advance(10)
+        events = []
+        self.timer.listeners.append(lambda event, timer: events.append(event))
+        state = TimerState(300, 290.001, True)
+        self.assertFalse(apply_state(self.timer, state, at=self.clock()))
+        self.assertEqual(events, [])
+
+    def test_stops_and_seeks(self) -> None:
+        self.timer.start()
+        apply_state(self.timer, TimerState(300, 200, False), at=0)
+        self.assertFalse(self.timer.is_running)
+        self.assertEqual(self.timer.get_remaining(), 200)
+
+
+class TestLoopbackSync(unittest.TestCase):
+    GROUP = "239.255.47.81"
+
+    def setUp(self) -> None:
+        port = _free_port()
+        self.leader_timer = StaticTimer(300)
+        try:
+            self.leader = SyncLeader(
+                self.leader_timer,
+                group=self.GROUP,
+                port=port,
+                interface="127.0.0.1",
+                heartbeat=0.05,
+            )
+            self.timers = []
+            self.followers = []
+            for skew in (0.0, 100.0, -3600.0):
+                clock = lambda skew=skew: time.perf_counter() + skew  # noqa: E731
+                timer = StaticTimer(60, clock=clock)
+                follower = SyncFollower(
+                    lambda state, at, timer=timer: apply_state(timer, state, at),
+                    clock=clock,
+                    group=self.GROUP,
+                    port=port,
+                    interface="127.0.0.1",
+                )
+                self.timers.append(timer)
+                self.followers.append(follower)
+        except OSError as exc:
+            self.skipTest(f"no loopback multicast: {exc}")
+        for follower in self.followers:
+            follower.start()
+            self.addCleanup(follower.close)
+        self.leader.start()
+        self.addCleanup(self.leader.close)
+
+    def test_followers_track_the_leader(self) -> None:
+        self.assertTrue(
+            _wait_for(lambda: all(t.state().period == 300 for t in self.timers))
+        )
+        self.leader_timer.start()
+        self.assertTrue(_wait_for(lambda: all(t.is_running for t in self.timers)))
+        time.sleep(0.1)
+        for timer in self.timers:
+            remaining = timer.get_remaining()
+            self.assertAlmostEqual(
+                remaining, self.leader_timer.get_remaining(), delta=0.005
+            )
+
+        self.leader_timer.stop()
+        self.assertTrue(_wait_for(lambda: not any(t.is_running for t in self.timers)))
+        for timer in self.timers:
+            self.assertAlmostEqual(
+                timer.get_remaining(), self.leader_timer.get_remaining(), delta=0.005
+            )
+
+    def test_heartbeats_do_not_read_the_timer(self) -> None:
+        readers = set()
+        state = self.leader_timer.state
+
+        def traced_state() -> TimerState:
+            readers.add(threading.current_thread())
+            return state()
+
+        self.leader_timer.state = traced_state
+        self.leader_timer.start()
+        time.sleep(0.3)  # a few heartbeats
+        self.assertEqual(readers, {threading.current_thread()})
+
+    def test_clock_offsets_are_estimated(self) -> None:
+        self.assertTrue(
+            _wait_for(lambda: all(f.offset is not None for f in self.followers))
+        )
+        for follower, skew in zip(self.followers, (0.0, 100.0, -3600.0)):
+            self.assertAlmostEqual(follower.offset, -skew, delta=0.005)
+            self.assertLess(follower.rtt, 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
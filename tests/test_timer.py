@@ -1,16 +1,18 @@
 """Unit tests for lightimer.timer.StaticTimer."""
 
+import random
 import time
 import unittest
 
-from lightimer.timer import StaticTimer
+from lightimer.timer import StaticTimer, VirtualClock
 
 DURATION_S = 2
 
 
 class TestStaticTimer(unittest.TestCase):
     def setUp(self) -> None:
-        self.cut = StaticTimer(DURATION_S)
+        self.clock = VirtualClock()
+        self.cut = StaticTimer(DURATION_S, clock=self.clock)
 
     def tearDown(self) -> None:
         del self.cut
@@ -24,32 +26,42 @@ class TestStaticTimer(unittest.TestCase):
         self.cut.set(20)
         self.assertEqual(self.cut.get_remaining(), 20)
 
+    def test_default_clock_is_monotonic(self) -> None:
+        self.assertIs(StaticTimer(DURATION_S).clock, time.perf_counter)
+
     # ── start / stop ──────────────────────────────────────────────────
 
     def test_start_sets_running(self) -> None:
         self.cut.start()
         self.assertTrue(self.cut.is_running)
-        t0 = time.time()
-        time.sleep(1)
-        t1 = time.time()
-        self.assertAlmostEqual(self.cut.get_elapsed(), t1 - t0, places=1)
+        self.clock.advance(1)
+        self.assertEqual(self.cut.get_elapsed(), 1)
 
     def test_stop_freezes_time(self) -> None:
         self.cut.start()
-        time.sleep(1)
+        self.clock.advance(1)
         self.cut.stop()
         self.assertFalse(self.cut.is_running)
         remaining = self.cut.get_remaining()
         elapsed = self.cut.get_elapsed()
-        time.sleep(1)
+        self.clock.advance(1)
         self.assertEqual(self.cut.get_remaining(), remaining)
         self.assertEqual(self.cut.get_elapsed(), elapsed)
 
+    def test_resume_continues_countdown(self) -> None:
+        self.cut.start()
+        self.clock.advance(0.5)
+        self.cut.stop()
+        self.clock.advance(10)
+        self.cut.start()
+        self.clock.advance(0.25)
+        self.assertEqual(self.cut.get_elapsed(), 0.75)
+
     # ── remaining / elapsed ───────────────────────────────────────────
 
     def test_remaining_plus_elapsed_equals_period(self) -> None:
         self.cut.start()
-        time.sleep(1)
+        self.clock.advance(1)
         self.cut.stop()
         self.assertEqual(
             self.cut.get_remaining(), DURATION_S - self.cut.get_elapsed()
@@ -57,7 +69,7 @@ class TestStaticTimer(unittest.TestCase):
 
     def test_elapsed_plus_remaining_equals_period(self) -> None:
         self.cut.start()
-        time.sleep(1)
+        self.clock.advance(1)
         self.cut.stop()
         self.assertEqual(
             self.cut.get_elapsed(), DURATION_S - self.cut.get_remaining()
@@ -68,9 +80,48 @@ class TestStaticTimer(unittest.TestCase):
     def test_is_time_up(self) -> None:
         self.cut.start()
         self.assertFalse(self.cut.is_time_up())
-        time.sleep(DURATION_S)
+        self.clock.advance(DURATION_S)
+        self.assertFalse(self.cut.is_time_up())
+        self.clock.advance(1e-6)
         self.assertTrue(self.cut.is_time_up())
 
+    def test_deadline_only_while_running(self) -> None:
+        self.assertIsNone(self.cut.deadline())
+        self.clock.advance(5)
+        self.cut.start()
+        self.assertEqual(self.cut.deadline(), 5 + DURATION_S)
+        self.clock.advance(1)
+        self.cut.stop()
+        self.assertIsNone(self.cut.deadline())
+
+    # ── random sequences ──────────────────────────────────────────────
+
+    def test_random_sequences_match_model(self) -> None:
+        """Thousands of start/stop/reset sequences against a simple model."""
+        rng = random.Random(42)
+        for _ in range(2_000):
+            expected = DURATION_S
+            running = False
+            self.cut.reset()
+            for _ in range(10):
+                op = rng.randrange(4)
+                if op == 0 and not running:
+                    self.cut.start()
+                    running = True
+                elif op == 1 and running:
+                    self.cut.stop()
+                    running = False
+                elif op == 2:
+                    self.cut.stop()
+                    self.cut.reset()
+                    expected, running = DURATION_S, False
+                step = rng.random()
+                self.clock.advance(step)
+                if running:
+                    expected -= step
+                self.assertAlmostEqual(self.cut.get_remaining(), expected)
+                self.assertEqual(self.cut.is_running, running)
+
     # ── formatting ────────────────────────────────────────────────────
 
     def test_format(self) -> None:
@@ -78,6 +129,12 @@ class TestStaticTimer(unittest.TestCase):
         self.assertEqual(StaticTimer.format(59), "00:59")
         self.assertEqual(StaticTimer.format(60), "01:00")
         self.assertEqual(StaticTimer.format(5999), "99:59")
+        self.assertEqual(StaticTimer.format(6000), "100:00")
+
+    def test_format_centiseconds(self) -> None:
+        self.assertEqual(StaticTimer.format_centiseconds(59.994), ("00:59", ".99"))
+        self.assertEqual(StaticTimer.format_centiseconds(1.5), ("00:01", ".50"))
+        self.assertEqual(StaticTimer.format_centiseconds(-0.003), ("00:00", ".00"))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,110 @@
+"""Tests for lightimer.tui.TerminalApp on a recording terminal."""
+
+import curses
+import subprocess
+import sys
+import unittest
+
+from lightimer.config import Orientation
+from lightimer.headless import RecordingTerminal
+from lightimer.tui import LEFT_EIGHTHS, LOWER_EIGHTHS, Palette, TerminalApp
+
+
+def _palette() -> Palette:
+    return Palette(256, 256, lambda *pair: None, lambda n: n << 8)
+
+
+class TestTerminalApp(unittest.TestCase):
+    def setUp(self) -> None:
+        self.term = RecordingTerminal(size=(80, 11))
+        self.app = TerminalApp(clock=self.term.clock)
+        self.bells = []
+        self.app.bell = lambda: self.bells.append(self.term.clock())
+        self.app.open(self.term, _palette())
+
+    def test_first_frame(self) -> None:
+        self.app.redraw()
+        self.assertEqual(self.term.row(5).strip(), "05:00")
+        self.assertTrue(self.term.row(10).startswith(" Lightimer"))
+
+    def test_bar_edge_moves_in_eighths_of_a_cell(self) -> None:
+        self.app.handle_key(ord("1"))  # 10:00, 7.5 s per cell
+        self.app.handle_key(ord(" "))
+        self.term.clock.advance(7.5 * 10.5)
+        self.app.redraw()
+        self.assertEqual(self.term.row(0), " " * 10 + LEFT_EIGHTHS[4] + " " * 69)
+
+    def test_only_changed_cells_are_written(self) -> None:
+        self.app.handle_key(ord(" "))
+        self.app.redraw()
+        renderer = self.app.renderer
+        written = renderer.written
+        self.term.clock.advance(300 / 80 / 8)  # one eighth of a cell
+        self.app.redraw()
+        # The edge cell of each of the ten bar rows, and 05:00 → 04:59
+        self.assertEqual(renderer.written - written, 10 + 3)
+        written = renderer.written
+        self.app.redraw()
+        self.assertEqual(renderer.written, written)
+
+    def test_typed_digits_are_shown_until_started(self) -> None:
+        for key in "12":
+            self.app.handle_key(ord(key))
+        self.app.redraw()
+        self.assertEqual(self.term.row(5).strip(), "12:--")
+        self.assertEqual(self.app.timer.state().period, 720)
+        self.app.handle_key(ord(" "))
+        self.app.redraw()
+        self.assertEqual(self.term.row(5).strip(), "12:00")
+
+    def test_runs_out_under_virtual_time(self) -> None:
+        self.term.press(" ")
+        self.term.press(curses.KEY_ENTER, at=400)
+        self.term.press(27, at=401)
+        self.app.mainloop()
+        self.assertEqual(len(self.bells), 1)
+        self.assertAlmostEqual(self.bells[0], 300, delta=0.01)
+        self.assertEqual(self.term.row(5).strip(), "05:00")
+        self.assertTrue(self.app.closed)
+
+    def test_timesup_frame(self) -> None:
+        self.term.press(" ")
+        self.term.press(27, at=301)
+        self.app.mainloop()
+        self.assertEqual(self.term.row(5).strip(), "00:00")
+        self.assertEqual(self.term.row(0), " " * 80)
+
+    def test_vertical_bar_and_lean(self) -> None:
+        self.app.handle_key(ord("t"))
+        self.app.handle_key(ord("l"))
+        self.assertIs(self.app.orientation, Orientation.VERTICAL)
+        self.app.handle_key(ord(" "))
+        self.term.clock.advance(300 / 11 * 2.25)
+        self.app.redraw()
+        self.assertEqual(self.term.row(1), " " * 80)
+        self.assertEqual(self.term.row(2), LOWER_EIGHTHS[6] * 80)
+        self.assertNotIn("Lightimer", self.term.row(10))
+
+    def test_resize_redraws_everything(self) -> None:
+        self.app.redraw()
+        self.term.size = (40, 5)
+        self.app.handle_key(curses.KEY_RESIZE)
+        self.app.redraw()
+        self.assertEqual(self.term.row(2).strip(), "05:00")
+        self.assertEqual(len(self.term.cells), 40 * 5)
+
+
+class TestStartup(unittest.TestCase):
+    def test_does_not_import_tkinter_or_pygame(self) -> None:
+        code = (
+            "import sys, lightimer.tui; "
+            "print(sorted({'tkinter', 'pygame'} & set(sys.modules)))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(out.stdout.strip(), "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
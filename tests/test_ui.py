@@ -1,9 +1,27 @@
-"""Placeholder tests for the Lightimer UI.
+"""Tests for the Lightimer UI.
 
-Full UI testing requires a display (or Xvfb on CI).
+The app runs on the headless backend, so no display is required.
 """
 
+import os
+import subprocess
+import sys
+import tempfile
+import threading
 import unittest
+from unittest import mock
+
+from lightimer.config import HEIGHT_V, Orientation
+from lightimer.headless import (
+    HeadlessImage,
+    HeadlessRoot,
+    HeadlessToplevel,
+    RecordingCanvas,
+)
+from lightimer.instance import Launch
+from lightimer.journal import Journal
+from lightimer.timer import TimerState
+from lightimer.ui import LightimerApp
 
 
 class TestLightimerApp(unittest.TestCase):
@@ -15,5 +33,524 @@ class TestLightimerApp(unittest.TestCase):
         from lightimer.timer import StaticTimer  # noqa: F401
 
 
+class TestHeadlessApp(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.app = LightimerApp(
+            self.root,
+            defer_assets=True,
+            clock=self.root.clock,
+            canvas_factory=RecordingCanvas,
+        )
+        self.canvas = self.app.canvas
+
+    def _label(self) -> str:
+        return self.canvas.itemcget(self.app.text, "text")
+
+    # ── start / stop ──────────────────────────────────────────────────
+
+    def test_initial_frame(self) -> None:
+        self.assertEqual(self._label(), "05:00")
+        self.assertEqual(self.root.geometry(), "116x800+1779+140")
+
+    def test_space_starts_and_stops(self) -> None:
+        self.canvas.key("space", " ")
+        self.root.advance(61)
+        self.assertEqual(self._label(), "03:59")
+        self.canvas.key("space", " ")
+        self.root.advance(60)
+        self.assertEqual(self._label(), "03:59")
+        self.assertEqual(self.root.pending(), 0)
+
+    def test_level_bar_follows_elapsed_time(self) -> None:
+        self.canvas.mouse("<Button-3>")
+        self.root.advance(150)
+        top = self.canvas.coords(self.app.level)[1]
+        self.assertAlmostEqual(top, HEIGHT_V / 2 + 1, delta=1)
+        self.assertEqual(self.canvas.itemcget(self.app.level, "fill"), "#ffff00")
+
+    def test_expiry_blackens_bar_and_reddens_label(self) -> None:
+        self.canvas.key("space", " ")
+        self.root.advance(301)
+        self.assertTrue(self.app.timer.is_time_up())
+        self.assertFalse(self.app.timer.is_running)
+        self.assertEqual(self.canvas.itemcget(self.app.level, "fill"), "black")
+        self.assertEqual(self.canvas.itemcget(self.app.text, "fill"), "red")
+
+    def test_enter_resets(self) -> None:
+        self.canvas.key("space", " ")
+        self.root.advance(10)
+        self.canvas.key("space", " ")
+        self.canvas.key("Return")
+        self.assertEqual(self._label(), "05:00")
+
+    # ── digit entry ───────────────────────────────────────────────────
+
+    def test_digit_entry_sets_duration(self) -> None:
+        self.canvas.type("1")
+        self.root.update()
+        self.assertEqual(self._label(), "1-:--")
+        self.canvas.type("23")
+        self.root.update()
+        self.assertEqual(self._label(), "12:3-")
+        self.assertEqual(self.app.duration, 750)
+        self.canvas.key("space", " ")
+        self.root.advance(1.5)
+        self.assertEqual(self._label(), "12:28")
+
+    def test_key_burst_is_entered_with_one_redraw(self) -> None:
+        self.canvas.type("1234")
+        self.assertEqual(self._label(), "05:00")  # nothing drawn per key
+        calls = self.canvas.calls["update_idletasks"]
+        self.root.update()
+        self.assertEqual(self.canvas.calls["update_idletasks"] - calls, 1)
+        self.assertEqual(self._label(), "12:34")
+        self.assertEqual(self.app.duration, 754)
+
+    def test_keys_act_in_the_order_typed(self) -> None:
+        self.canvas.type("2")
+        self.canvas.key("space", " ")  # before the idle flush
+        self.assertTrue(self.app.timer.is_running)
+        self.assertEqual(self.app.duration, 1200)
+
+    # ── dragging ──────────────────────────────────────────────────────
+
+    def test_drag_moves_window_once_per_frame(self) -> None:
+        moves = []
+        geometry = self.root.geometry
+
+        def record(spec=None):
+            if spec is not None:
+                moves.append(spec)
+            return geometry(spec)
+
+        self.root.geometry = record
+        self.canvas.mouse("<ButtonPress-1>", x=10, y=20)
+        for i in range(50):
+            self.canvas.mouse("<B1-Motion>", x_root=100 + i, y_root=200)
+        self.assertEqual(moves, [])
+        self.root.advance(0.1)
+        self.assertEqual(moves, ["116x800+139+180"])
+        self.canvas.mouse("<B1-Motion>", x_root=300, y_root=300)
+        self.canvas.mouse("<ButtonRelease-1>", x_root=310, y_root=320)
+        self.assertEqual(moves[-1], "116x800+300+300")
+        self.root.advance(0.1)
+        self.assertEqual(moves[-1], "116x800+300+300")
+        self.assertEqual(len(moves), 2)
+
+    # ── resizing ──────────────────────────────────────────────────────
+
+    def test_resize_storm_is_laid_out_once(self) -> None:
+        window = self.app.windows[0]
+        layouts = []
+        relayout = window._relayout
+        window._relayout = lambda: (layouts.append(1), relayout())
+        for height in range(800, 1200, 4):
+            self.canvas.resize(232, height)
+        self.root.advance(0.1)
+        self.assertEqual(len(layouts), 1)
+        self.assertEqual(window.size, (232, 1196))
+        self.assertEqual(window.axis, 1196)
+        self.assertEqual(self.canvas.itemcget(self.app.text, "font"), ("Helvetica", 36))
+        self.assertEqual(self.canvas.coords(self.app.text)[0], 116)
+
+    def test_bar_follows_the_new_size(self) -> None:
+        self.canvas.resize(116, 1600)
+        self.canvas.key("space", " ")
+        self.root.advance(150)
+        top = self.canvas.coords(self.app.level)[1]
+        self.assertAlmostEqual(top, 1600 / 2 + 1, delta=1)
+
+    def test_size_is_kept_per_orientation(self) -> None:
+        self.canvas.resize(200, 900)
+        self.root.advance(0.1)
+        self.canvas.type("tt")
+        self.assertEqual(self.app.windows[0].size, (200, 900))
+        self.assertTrue(self.root.geometry().startswith("200x900+"))
+
+    def test_calls_posted_from_threads_run_on_the_poll(self) -> None:
+        poster = threading.Thread(
+            target=self.app.post, args=(self.app.handle_command, "start")
+        )
+        poster.start()
+        poster.join()
+        self.assertFalse(self.app.timer.is_running)
+        self.app.poll_posts()
+        self.assertTrue(self.app.timer.is_running)
+        self.app.post(self.app.handle_command, "stop")
+        self.root.advance(0.05)
+        self.assertFalse(self.app.timer.is_running)
+
+    def test_follow_starts_and_stops_with_the_leader(self) -> None:
+        self.app.follow(TimerState(120, 100, True), at=self.root.clock() - 1)
+        self.assertTrue(self.app.timer.is_running)
+        self.assertEqual(self.app.duration, 120)
+        self.assertEqual(self._label(), "01:39")
+        self.root.advance(10)
+        self.assertEqual(self._label(), "01:29")
+
+        self.app.follow(TimerState(120, -0.001, False), at=self.root.clock())
+        self.assertEqual(self.root.pending(), 0)
+        self.assertEqual(self.canvas.itemcget(self.app.text, "fill"), "red")
+
+    # ── orientation ───────────────────────────────────────────────────
+
+    def test_toggle_orientation(self) -> None:
+        self.canvas.type("t")
+        self.assertIs(self.app.orientation, Orientation.HORIZONTAL)
+        self.assertEqual(self.canvas.cget("width"), 1000)
+        self.assertTrue(self.root.geometry().startswith("1000x50+"))
+
+    def test_later_launch_is_applied(self) -> None:
+        self.canvas.key("space", " ")
+        self.root.advance(10)
+        self.app.apply_launch(Launch(lean=True, sound_file="bell.wav", duration=600))
+        self.root.update()
+        self.assertEqual(self._label(), "10:00")
+        self.assertFalse(self.app.timer.is_running)
+        self.assertTrue(self.app.windows[0].lean)
+        self.assertEqual(self.app.audio.sound_path, "bell.wav")
+        self.assertEqual(self.root.raised, 1)
+
+    def test_time_up_is_played_by_the_audio_player(self) -> None:
+        players = []
+
+        def factory(path: str) -> mock.Mock:
+            players.append(mock.Mock(sound_path=path))
+            return players[-1]
+
+        root = HeadlessRoot()
+        app = LightimerApp(
+            root,
+            defer_assets=True,
+            clock=root.clock,
+            canvas_factory=RecordingCanvas,
+            audio_factory=factory,
+        )
+        app.canvas.key("space", " ")
+        root.advance(301)
+        players[0].play.assert_called_once()
+        app.set_sound("bell.wav")
+        self.assertEqual(players[1].sound_path, "bell.wav")
+        players[0].close.assert_called_once()
+
+    # ── frame rate ────────────────────────────────────────────────────
+
+    def test_fixed_rate_draws_every_frame(self) -> None:
+        # The cost per frame is measured by benchmarks.render_loop
+        self.app.adaptive = False
+        self.canvas.key("space", " ")
+        frames = self.root.advance(30)
+        self.assertEqual(frames, 30 * 1000 // self.app._frame_ms)
+
+
+class TestJournalResume(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "journal")
+
+    def _run(self, wall: float = 0.0) -> tuple[HeadlessRoot, LightimerApp]:
+        # The wall clock runs on while no process does; the timer clock
+        # of each run starts afresh
+        root = HeadlessRoot()
+        journal = Journal(self.path, wall=lambda: wall + root.clock())
+        self.addCleanup(journal.close)
+        app = LightimerApp(
+            root,
+            defer_assets=True,
+            clock=root.clock,
+            canvas_factory=RecordingCanvas,
+            journal=journal,
+        )
+        return root, app
+
+    def test_resumes_running_timer_and_placement(self) -> None:
+        root, app = self._run()
+        app.canvas.type("t")
+        app.canvas.type("2")
+        app.canvas.key("space", " ")
+        root.advance(30)
+        # The process dies here; a new one starts from the journal after
+        # another 90 s
+        root, app = self._run(wall=120.0)
+        self.assertTrue(app.timer.is_running)
+        self.assertEqual(app.duration, 1200)
+        self.assertAlmostEqual(app.timer.get_remaining(), 1200 - 120, delta=1e-6)
+        self.assertIs(app.orientation, Orientation.HORIZONTAL)
+        self.assertTrue(root.geometry().startswith("1000x50+"))
+        self.assertEqual(root.pending(), 1)
+
+    def test_resumes_paused_timer(self) -> None:
+        root, app = self._run()
+        app.canvas.key("space", " ")
+        root.advance(60)
+        app.canvas.key("space", " ")
+        root, app = self._run()
+        self.assertFalse(app.timer.is_running)
+        self.assertEqual(app.canvas.itemcget(app.text, "text"), "04:00")
+
+
+class TestHiDPI(unittest.TestCase):
+    def test_window_scales_with_the_display(self) -> None:
+        root = HeadlessRoot(screen=(3840, 2160), dpi=192)
+        app = LightimerApp(
+            root,
+            defer_assets=True,
+            clock=root.clock,
+            canvas_factory=RecordingCanvas,
+        )
+        self.assertEqual(app.scale, 2.0)
+        self.assertEqual(app.canvas.cget("height"), 1600)
+        self.assertTrue(root.geometry().startswith("232x1600+"))
+        # Points are scaled by Tk itself
+        self.assertEqual(app.canvas.itemcget(app.text, "font"), ("Helvetica", 24))
+        self.assertEqual(app.windows[0].layout.lead, 2)
+
+
+class TestProjector(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot(screen=(3840, 2160))
+        self.app = LightimerApp(
+            self.root,
+            defer_assets=True,
+            clock=self.root.clock,
+            canvas_factory=RecordingCanvas,
+            fullscreen=True,
+            image_factory=HeadlessImage,
+        )
+        self.window = self.app.windows[0]
+        self.canvas = self.app.canvas
+
+    def _images(self) -> list:
+        return [self.canvas.itemcget(item, "image") for item in self.window.digits]
+
+    def test_bar_covers_the_screen(self) -> None:
+        self.assertTrue(self.root.window_attributes["-fullscreen"])
+        self.assertEqual(self.canvas.cget("width"), 3840)
+        self.canvas.key("space", " ")
+        self.root.advance(150)
+        top = self.canvas.coords(self.app.level)[1]
+        self.assertAlmostEqual(top, 2160 / 2 + 1, delta=2)
+
+    def test_label_is_composed_of_cached_sprites(self) -> None:
+        atlas = self.window.glyphs.get(self.window.digit_height, "#777777")
+        self.assertEqual(self._images(), [atlas.images[c] for c in "05:00"])
+        swaps = []
+        itemconfig = self.canvas.itemconfig
+
+        def record(item, **options):
+            if "image" in options:
+                swaps.append(item)
+            itemconfig(item, **options)
+
+        self.canvas.itemconfig = record
+        self.canvas.key("space", " ")
+        self.root.advance(1)
+        self.assertEqual(self._images(), [atlas.images[c] for c in "04:59"])
+        # Only the changed digits were swapped, nothing was re-rendered
+        digits = self.window.digits
+        self.assertEqual(swaps, [digits[1], digits[3], digits[4]])
+        self.assertEqual(len(self.window.glyphs), 1)
+
+    def test_time_up_uses_red_sprites(self) -> None:
+        self.canvas.key("space", " ")
+        self.root.advance(301)
+        red = self.window.glyphs.get(self.window.digit_height, "red")
+        self.assertIn(red.images["0"], self._images())
+
+    def test_resize_invalidates_the_cache(self) -> None:
+        before = self._images()[0]
+        self.canvas.resize(1920, 1080)
+        self.root.advance(0.1)
+        self.assertLess(self.window.digit_height, 1000)
+        self.assertIsNot(self._images()[0], before)
+        self.assertEqual(len(self.window.glyphs), 1)
+
+
+class TestCentiseconds(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.app = LightimerApp(
+            self.root,
+            defer_assets=True,
+            clock=self.root.clock,
+            canvas_factory=RecordingCanvas,
+            centiseconds=True,
+        )
+        self.window = self.app.windows[0]
+        self.canvas = self.app.canvas
+
+    def _label(self) -> tuple[str, str]:
+        return (
+            self.canvas.itemcget(self.app.text, "text"),
+            self.canvas.itemcget(self.window.fraction_text, "text"),
+        )
+
+    def test_hundredths_only_in_the_last_minute(self) -> None:
+        self.canvas.key("space", " ")
+        self.root.advance(200.5)
+        self.assertEqual(self._label(), ("01:39", ""))
+        self.root.advance(50)
+        self.assertEqual(self._label(), ("00:49", ".50"))
+
+    def test_last_minute_is_drawn_every_hundredth(self) -> None:
+        self.canvas.key("space", " ")
+        self.root.advance(250)
+        frames = self.root.advance(1)
+        self.assertGreaterEqual(frames, 90)
+
+    def test_hundredths_change_only_their_item(self) -> None:
+        self.canvas.key("space", " ")
+        self.root.advance(250.2)
+        changed = []
+        itemconfig = self.canvas.itemconfig
+
+        def record(item, **options):
+            if "text" in options:
+                changed.append(item)
+            itemconfig(item, **options)
+
+        self.canvas.itemconfig = record
+        self.root.advance(0.5)
+        self.assertEqual(set(changed), {self.window.fraction_text})
+
+    def test_time_up_shows_zero_hundredths(self) -> None:
+        self.canvas.key("space", " ")
+        self.root.advance(301)
+        self.assertEqual(self._label(), ("00:00", ".00"))
+        self.assertEqual(self.canvas.itemcget(self.window.fraction_text, "fill"), "red")
+
+    def test_digit_entry_hides_the_hundredths(self) -> None:
+        self.canvas.key("space", " ")
+        self.root.advance(250.5)
+        self.canvas.key("1", "1")
+        self.root.advance(0.1)
+        self.assertEqual(self._label(), ("1-:--", ""))
+
+    def test_projector_label_has_room_for_the_hundredths(self) -> None:
+        root = HeadlessRoot(screen=(3840, 2160))
+        app = LightimerApp(
+            root,
+            defer_assets=True,
+            clock=root.clock,
+            canvas_factory=RecordingCanvas,
+            fullscreen=True,
+            image_factory=HeadlessImage,
+            centiseconds=True,
+        )
+        window = app.windows[0]
+        app.canvas.key("space", " ")
+        root.advance(250.5)
+        self.assertEqual(window.label + window.fraction, "00:49.50")
+        corners = [app.canvas.coords(item) for item in window.digits]
+        self.assertGreaterEqual(corners[0][0], 0)
+        self.assertLessEqual(corners[-1][0] + round(0.55 * window.digit_height), 3840)
+
+
+class TestMultiWindow(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = HeadlessRoot()
+        self.app = LightimerApp(
+            self.root,
+            defer_assets=True,
+            clock=self.root.clock,
+            canvas_factory=RecordingCanvas,
+            windows=3,
+            window_factory=HeadlessToplevel,
+        )
+        self.canvases = [window.canvas for window in self.app.windows]
+
+    def _labels(self) -> list[str]:
+        return [
+            window.canvas.itemcget(window.text, "text") for window in self.app.windows
+        ]
+
+    def test_windows_do_not_overlap(self) -> None:
+        self.assertEqual(len(self.canvases), 3)
+        geometries = {window.master.geometry() for window in self.app.windows}
+        self.assertEqual(len(geometries), 3)
+
+    def test_all_windows_show_the_same_countdown(self) -> None:
+        self.canvases[2].key("space", " ")
+        self.root.advance(90)
+        self.assertEqual(self._labels(), ["03:30"] * 3)
+        levels = {
+            tuple(window.canvas.coords(window.level)) for window in self.app.windows
+        }
+        self.assertEqual(len(levels), 1)
+
+    def test_closed_window_is_dropped(self) -> None:
+        self.canvases[0].key("space", " ")
+        self.root.advance(10)
+        closed = self.app.windows[1]
+        closed.master.close()
+        self.assertTrue(closed.master.destroyed)
+        self.assertNotIn(closed, self.app.windows)
+        self.root.advance(80)
+        self.assertEqual(self._labels(), ["03:30"] * 2)
+        self.assertFalse(self.root.destroyed)
+
+    def test_closing_the_main_window_quits(self) -> None:
+        self.app.windows[2].master.close()
+        self.root.close()
+        self.assertTrue(self.root.destroyed)
+
+    def test_toggle_is_per_window(self) -> None:
+        self.canvases[1].type("t")
+        orientations = [window.orientation for window in self.app.windows]
+        self.assertEqual(
+            orientations,
+            [Orientation.VERTICAL, Orientation.HORIZONTAL, Orientation.VERTICAL],
+        )
+        self.canvases[0].key("space", " ")
+        self.root.advance(150)
+        horizontal = self.app.windows[1]
+        left = horizontal.canvas.coords(horizontal.level)[0]
+        self.assertAlmostEqual(left, 1000 / 2 + 1, delta=1)
+
+    def test_digit_entry_shows_everywhere(self) -> None:
+        self.canvases[1].type("12")
+        self.root.update()
+        self.assertEqual(self._labels(), ["12:--"] * 3)
+
+    def test_one_frame_per_tick_for_all_windows(self) -> None:
+        self.app.adaptive = False
+        self.canvases[0].key("space", " ")
+        frames = self.root.advance(1)
+        calls = [canvas.calls["itemconfig"] for canvas in self.canvases]
+        self.assertEqual(len(set(calls)), 1)
+        self.assertLessEqual(self.root.pending(), 1)
+        self.assertGreater(frames, 0)
+
+
+
+class TestFirstFrameImports(unittest.TestCase):
+    """``import lightimer.ui`` stays on the fast path of the first frame."""
+
+    LAZY = (
+        "multiprocessing",
+        "lightimer.sound",
+        "socket",
+        "lightimer.instance",
+        "lightimer.sync",
+        "lightimer.agenda",
+        "dataclasses",
+        "lightimer.journal",
+        "lightimer.recorder",
+        "lightimer.profiler",
+    )
+
+    def test_lazy_modules_are_not_imported(self) -> None:
+        code = (
+            "import sys, lightimer.ui; "
+            f"print(' '.join(m for m in {self.LAZY!r} if m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(out.split(), [])
+
+
 if __name__ == "__main__":
     unittest.main()